@@ -0,0 +1,200 @@
+"""Benchmark fixtures for wdadaptivepy.
+
+Run with `uv run pytest benchmarks`. Use `--benchmark-scale` to grow the
+synthetic tenant and `--benchmark-json` to save the results for comparison
+between commits.
+"""
+
+import gc
+import json
+import time
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, TypeVar
+
+import pytest
+
+from wdadaptivepy.testing import SyntheticTenant
+
+T = TypeVar("T")
+
+
+@dataclass
+class Measurement:
+    """Result of a benchmark.
+
+    Attributes:
+        name: Name of the benchmark
+        rounds: Number of timed rounds
+        best_seconds: Fastest round
+        mean_seconds: Average round
+        peak_bytes: Peak memory allocated by Python during one round
+
+    """
+
+    name: str
+    rounds: int
+    best_seconds: float
+    mean_seconds: float
+    peak_bytes: int
+
+
+class Benchmark:
+    """Time a function and track its peak memory."""
+
+    def __init__(self, name: str, results: list[Measurement]) -> None:
+        """Initialize Benchmark.
+
+        Args:
+            name: Name of the benchmark
+            results: Collected results of the session
+
+        """
+        self.name = name
+        self.results = results
+
+    def __call__(
+        self,
+        func: Callable[..., T],
+        *args: Any,  # NOQA: ANN401
+        rounds: int = 5,
+        **kwargs: Any,  # NOQA: ANN401
+    ) -> T:
+        """Run the function, timing each round and measuring peak memory once.
+
+        Args:
+            func: Function to benchmark
+            *args: Positional arguments of the function
+            rounds: Number of timed rounds
+            **kwargs: Keyword arguments of the function
+
+        Returns:
+            Result of the last round
+
+        """
+        durations: list[float] = []
+        result = func(*args, **kwargs)
+        for _ in range(rounds):
+            gc.collect()
+            start = time.perf_counter()
+            result = func(*args, **kwargs)
+            durations.append(time.perf_counter() - start)
+        gc.collect()
+        tracemalloc.start()
+        try:
+            func(*args, **kwargs)
+            _, peak_bytes = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.results.append(
+            Measurement(
+                name=self.name,
+                rounds=rounds,
+                best_seconds=min(durations),
+                mean_seconds=sum(durations) / rounds,
+                peak_bytes=peak_bytes,
+            ),
+        )
+        return result
+
+
+RESULTS: list[Measurement] = []
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add benchmark options.
+
+    Args:
+        parser: pytest's parser
+
+    """
+    parser.addoption(
+        "--benchmark-scale",
+        type=int,
+        default=1,
+        help="Multiplier for the size of the synthetic tenant",
+    )
+    parser.addoption(
+        "--benchmark-json",
+        default=None,
+        help="Save benchmark results to a JSON file",
+    )
+
+
+@pytest.fixture
+def benchmark(request: pytest.FixtureRequest) -> Benchmark:
+    """Fixture to time a function and track its peak memory.
+
+    Args:
+        request: pytest's request
+
+    Returns:
+        Benchmark
+
+    """
+    return Benchmark(request.node.name, RESULTS)
+
+
+@pytest.fixture(scope="session")
+def scale(request: pytest.FixtureRequest) -> int:
+    """Multiplier for the size of the synthetic tenant.
+
+    Args:
+        request: pytest's request
+
+    Returns:
+        Scale
+
+    """
+    return request.config.getoption("--benchmark-scale")
+
+
+@pytest.fixture(scope="session")
+def tenant(scale: int) -> SyntheticTenant:
+    """Synthetic tenant sized by the benchmark scale.
+
+    Args:
+        scale: Multiplier for the size of the synthetic tenant
+
+    Returns:
+        SyntheticTenant
+
+    """
+    return SyntheticTenant(
+        accounts=1_000 * scale,
+        levels=200 * scale,
+        dimension_values=1_000 * scale,
+        users=500 * scale,
+        years=5,
+    )
+
+
+def pytest_terminal_summary(
+    terminalreporter: pytest.TerminalReporter,
+    config: pytest.Config,
+) -> None:
+    """Print and optionally save benchmark results.
+
+    Args:
+        terminalreporter: pytest's terminal reporter
+        config: pytest's config
+
+    """
+    if not RESULTS:
+        return
+    terminalreporter.section("benchmarks")
+    width = max(len(result.name) for result in RESULTS)
+    terminalreporter.write_line(
+        f"{'name':<{width}}  {'best (ms)':>10}  {'mean (ms)':>10}  {'peak (KiB)':>11}",
+    )
+    for result in RESULTS:
+        terminalreporter.write_line(
+            f"{result.name:<{width}}  {result.best_seconds * 1000:>10.2f}  "
+            f"{result.mean_seconds * 1000:>10.2f}  {result.peak_bytes / 1024:>11.1f}",
+        )
+    if output := config.getoption("--benchmark-json"):
+        Path(output).write_text(
+            json.dumps([asdict(result) for result in RESULTS], indent=2),
+        )
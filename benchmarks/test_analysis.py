@@ -0,0 +1,39 @@
+"""Benchmarks for wdadaptivepy's analysis of exported data."""
+
+from xml.etree import ElementTree as ET
+
+from benchmarks.conftest import Benchmark
+from wdadaptivepy.analysis import RollupEngine, VarianceTable
+from wdadaptivepy.connectors.xml_api.xml_api import XMLApi
+from wdadaptivepy.models import Account, Level, Time
+from wdadaptivepy.services.data import DataQuery
+from wdadaptivepy.testing import SyntheticTenant
+
+
+def test_rollup(benchmark: Benchmark, tenant: SyntheticTenant, scale: int) -> None:
+    """Benchmark rolling up leaf-level data by Account, Level, and time."""
+    rows = 2_000 * scale
+    response = ET.fromstring(tenant.export_data(rows, tenant.month_codes()[:12]))
+    table = DataQuery(XMLApi("", ""))._parse_table(response)  # NOQA: SLF001
+    engine = RollupEngine(
+        accounts=Account.from_xml(ET.fromstring(tenant.export_accounts())),
+        levels=Level.from_xml(ET.fromstring(tenant.export_levels())),
+        periods=Time.from_xml(ET.fromstring(tenant.export_time()))[0].period,
+    )
+    rolled_up = benchmark(engine.rollup, table, dimensions=False, rounds=3)
+    assert rolled_up.row_count > table.row_count
+    assert len(rolled_up.periods) == 12 + 4 + 1
+
+
+def test_variance(benchmark: Benchmark, tenant: SyntheticTenant, scale: int) -> None:
+    """Benchmark aligning and comparing two exports cell by cell."""
+    rows = 20_000 * scale
+    query = DataQuery(XMLApi("", ""))
+    base = query._parse_table(  # NOQA: SLF001
+        ET.fromstring(tenant.export_data(rows, tenant.month_codes()[:12])),
+    )
+    compare = query._parse_table(  # NOQA: SLF001
+        ET.fromstring(tenant.export_data(rows // 2, tenant.month_codes()[:12])),
+    )
+    variance = benchmark(VarianceTable.from_tables, base, compare, rounds=3)
+    assert variance.row_count >= rows // 2
@@ -0,0 +1,84 @@
+"""Benchmarks for wdadaptivepy's data service."""
+
+from xml.etree import ElementTree as ET
+
+from pytest_mock import MockerFixture
+
+from benchmarks.conftest import Benchmark
+from wdadaptivepy.connectors.xml_api.xml_api import XMLApi
+from wdadaptivepy.models.account import Account
+from wdadaptivepy.models.data import AccountFilter, ExportDataFilter, TimeFilter
+from wdadaptivepy.models.time import Period
+from wdadaptivepy.models.version import Version
+from wdadaptivepy.services.data import DataQuery, DataService
+from wdadaptivepy.testing import SyntheticTenant
+
+
+def test_parse_response(
+    benchmark: Benchmark,
+    tenant: SyntheticTenant,
+    scale: int,
+) -> None:
+    """Benchmark parsing an exportData response into cells."""
+    rows = 5_000 * scale
+    response = ET.fromstring(tenant.export_data(rows, tenant.month_codes()[:12]))
+    query = DataQuery(XMLApi("", ""))
+    data = benchmark(query._parse_response, response, rounds=3)  # NOQA: SLF001
+    assert len(data) == rows * 12
+
+
+def test_parse_table(
+    benchmark: Benchmark,
+    tenant: SyntheticTenant,
+    scale: int,
+) -> None:
+    """Benchmark parsing an exportData response into a columnar DataTable."""
+    rows = 5_000 * scale
+    response = ET.fromstring(
+        tenant.export_data(rows, tenant.month_codes()[:12], mark_blanks=True),
+    )
+    query = DataQuery(XMLApi("", ""))
+    table = benchmark(query._parse_table, response, rounds=3)  # NOQA: SLF001
+    assert table.cell_count == rows * 12
+
+
+def test_data_table_cells(
+    benchmark: Benchmark,
+    tenant: SyntheticTenant,
+    scale: int,
+) -> None:
+    """Benchmark unpivoting a DataTable into index arrays."""
+    rows = 5_000 * scale
+    response = ET.fromstring(tenant.export_data(rows, tenant.month_codes()[:12]))
+    table = DataQuery(XMLApi("", ""))._parse_table(response)  # NOQA: SLF001
+    cells = benchmark(table.cells, rounds=3)
+    assert len(cells) == rows * 12
+
+
+def test_data_service_get_data(
+    benchmark: Benchmark,
+    tenant: SyntheticTenant,
+    scale: int,
+    mocker: MockerFixture,
+) -> None:
+    """Benchmark DataService.get_data on an exportData response."""
+    rows = 5_000 * scale
+    response = ET.fromstring(tenant.export_data(rows, tenant.month_codes()[:12]))
+    service = DataService(XMLApi("", ""))
+    mocked_request = mocker.patch.object(
+        service._DataService__xml_api,  # NOQA: SLF001  # pyright: ignore[reportAttributeAccessIssue]
+        "make_xml_request",
+        return_value=response,
+    )
+    data_filter = ExportDataFilter(
+        accounts=[AccountFilter(account=Account(code="A0", is_assumption=False))],
+        time=TimeFilter(start=Period(code="01/2025"), end=Period(code="12/2025")),
+    )
+    data = benchmark(
+        service.get_data,
+        version=Version(name="Actuals"),
+        data_filter=data_filter,
+        rounds=3,
+    )
+    assert mocked_request.called
+    assert len(data) == rows * 12
@@ -0,0 +1,150 @@
+"""End-to-end benchmarks against the fake Adaptive XML API server."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from benchmarks.conftest import Benchmark
+from wdadaptivepy import AdaptiveConnection
+from wdadaptivepy.connectors.xml_api import RateLimiter
+from wdadaptivepy.testing import FakeAdaptiveServer, SyntheticTenant
+
+
+@pytest.fixture
+def adaptive(tenant: SyntheticTenant, scale: int) -> AdaptiveConnection:
+    """Connect to a fake server serving the synthetic tenant.
+
+    Args:
+        tenant: Synthetic tenant
+        scale: Benchmark scale
+
+    Returns:
+        AdaptiveConnection
+
+    """
+    server = FakeAdaptiveServer(tenant, data_rows=5_000 * scale)
+    return AdaptiveConnection(
+        login="benchmark",
+        password="benchmark",  # NOQA: S106
+        transport=server.transport(),
+    )
+
+
+def test_accounts_get_all(
+    benchmark: Benchmark,
+    adaptive: AdaptiveConnection,
+    tenant: SyntheticTenant,
+) -> None:
+    """Benchmark AccountService.get_all including HTTP and XML parsing."""
+    accounts = benchmark(adaptive.accounts.get_all)
+    assert len(accounts) == tenant.accounts
+
+
+@pytest.mark.parametrize("coalesce", [False, True], ids=["sent", "coalesced"])
+def test_concurrent_accounts_get_all(
+    benchmark: Benchmark,
+    scale: int,
+    coalesce: bool,  # NOQA: FBT001
+) -> None:
+    """Benchmark 16 workers exporting Accounts at once through 4 connections."""
+    tenant = SyntheticTenant(accounts=100 * scale)
+    server = FakeAdaptiveServer(tenant, latency=0.05)
+    adaptive = AdaptiveConnection(
+        login="benchmark",
+        password="benchmark",  # NOQA: S106
+        transport=server.transport(),
+        rate_limiter=RateLimiter(max_concurrent_requests=4),
+        coalesce_requests=coalesce,
+    )
+
+    def get_all() -> list[int]:
+        with ThreadPoolExecutor(16) as executor:
+            return list(
+                executor.map(
+                    lambda _: len(adaptive.accounts.get_all()),
+                    range(16),
+                ),
+            )
+
+    counts = benchmark(get_all, rounds=3)
+    assert counts == [tenant.accounts] * 16
+
+
+@pytest.mark.parametrize("refresh", [False, True], ids=["clear", "refresh"])
+def test_metadata_cache_accounts(
+    benchmark: Benchmark,
+    adaptive: AdaptiveConnection,
+    tenant: SyntheticTenant,
+    refresh: bool,  # NOQA: FBT001
+) -> None:
+    """Benchmark reloading unchanged Accounts after clearing or refreshing the cache."""
+    cache = adaptive.data.metadata_cache
+
+    def reload() -> int:
+        if refresh:
+            cache.refresh()
+        else:
+            cache.clear()
+        return len(cache.accounts())
+
+    assert benchmark(reload) == tenant.accounts
+
+
+@pytest.mark.parametrize("many", [False, True], ids=["get_all", "get_all_many"])
+def test_dimension_values_of_all_dimensions(
+    benchmark: Benchmark,
+    tenant: SyntheticTenant,
+    many: bool,  # NOQA: FBT001
+) -> None:
+    """Benchmark retrieving every Dimension's values from a server with latency.
+
+    get_all_many saves two round trips per additional Dimension; with few
+    Dimensions and low latency, parsing dominates and both take about as
+    long.
+    """
+    server = FakeAdaptiveServer(tenant, latency=0.02)
+    adaptive = AdaptiveConnection(
+        login="benchmark",
+        password="benchmark",  # NOQA: S106
+        transport=server.transport(),
+    )
+    names = tenant.dimension_names()
+
+    def get_all() -> int:
+        if many:
+            values = adaptive.dimension_values.get_all_many(names)
+            return sum(len(x) for x in values.values())
+        return sum(len(adaptive.dimension_values.get_all(x)) for x in names)
+
+    assert benchmark(get_all, rounds=3) == tenant.dimension_values * len(names)
+    calls = server.calls["exportDimensions"]
+    get_all()
+    assert server.calls["exportDimensions"] - calls == (2 if many else 2 * len(names))
+
+
+def test_data_query_get_data(
+    benchmark: Benchmark,
+    adaptive: AdaptiveConnection,
+    scale: int,
+) -> None:
+    """Benchmark DataQuery.get_data including HTTP and CSV parsing."""
+    query = (
+        adaptive.data.query_data()
+        .set_version_filter("Actuals")
+        .add_account_filter("A0")
+        .set_time_filter("01/2025", "12/2025")
+        .use_corporate_currency()
+    )
+    data = benchmark(query.get_data, rounds=3)
+    assert len(data) == 5_000 * scale * 12
+
+
+def test_modeled_sheet_convert_rows(
+    benchmark: Benchmark,
+    adaptive: AdaptiveConnection,
+    scale: int,
+) -> None:
+    """Benchmark ModeledSheetQuery.convert_rows including type conversion."""
+    query = adaptive.data.query_modeled_sheet("Budget", "Personnel")
+    rows = benchmark(lambda: list(query.convert_rows()), rounds=3)
+    assert len(rows) == 5_000 * scale
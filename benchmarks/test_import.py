@@ -0,0 +1,47 @@
+"""Benchmarks of importing wdadaptivepy."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import wdadaptivepy
+from benchmarks.conftest import Benchmark
+
+IMPORT_BUDGET_SECONDS = {
+    "import wdadaptivepy": 0.05,
+    "from wdadaptivepy import AdaptiveConnection": 0.3,
+}
+
+
+def _import_seconds(statement: str) -> float:
+    """Run an import in a fresh interpreter and return its cumulative import time.
+
+    Interpreter startup finishes by importing `site`, so only the top-level
+    imports reported after it are counted.
+    """
+    result = subprocess.run(  # NOQA: S603
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": str(Path(wdadaptivepy.__file__).parents[1])},
+    )
+    microseconds = 0
+    for line in result.stderr.splitlines():
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        if name == " site":
+            microseconds = 0
+        elif not name.startswith("  ") and cumulative.strip().isdigit():
+            microseconds += int(cumulative)
+    return microseconds / 1_000_000
+
+
+@pytest.mark.parametrize("statement", list(IMPORT_BUDGET_SECONDS))
+def test_import(benchmark: Benchmark, statement: str) -> None:
+    """Benchmark importing wdadaptivepy in a fresh interpreter."""
+    seconds = benchmark(_import_seconds, statement, rounds=3)
+
+    assert seconds < IMPORT_BUDGET_SECONDS[statement]
@@ -0,0 +1,225 @@
+"""Benchmarks for wdadaptivepy's models."""
+
+from dataclasses import fields
+from datetime import date
+from pathlib import Path
+from xml.etree import ElementTree as ET
+
+import pytest
+
+from benchmarks.conftest import Benchmark
+from wdadaptivepy.models import (
+    Account,
+    Calendar,
+    DimensionValue,
+    Level,
+    MetadataList,
+    Time,
+    User,
+)
+from wdadaptivepy.models.base import date_or_none, datetime_or_none
+from wdadaptivepy.testing import SyntheticTenant
+
+
+@pytest.fixture(scope="module")
+def accounts(tenant: SyntheticTenant) -> MetadataList[Account]:
+    """Accounts of the synthetic tenant.
+
+    Args:
+        tenant: Synthetic tenant
+
+    Returns:
+        Accounts
+
+    """
+    return Account.from_xml(ET.fromstring(tenant.export_accounts()))
+
+
+@pytest.fixture(scope="module")
+def levels(tenant: SyntheticTenant) -> MetadataList[Level]:
+    """Levels of the synthetic tenant.
+
+    Args:
+        tenant: Synthetic tenant
+
+    Returns:
+        Levels
+
+    """
+    return Level.from_xml(ET.fromstring(tenant.export_levels()))
+
+
+def test_from_xml_accounts(benchmark: Benchmark, tenant: SyntheticTenant) -> None:
+    """Benchmark converting exportAccounts into Accounts."""
+    xml = ET.fromstring(tenant.export_accounts())
+    accounts = benchmark(Account.from_xml, xml)
+    assert len(accounts) == tenant.accounts
+
+
+def test_from_xml_accounts_lazy(benchmark: Benchmark, tenant: SyntheticTenant) -> None:
+    """Benchmark lazily converting exportAccounts, reading id, code, and parent."""
+    xml = ET.fromstring(tenant.export_accounts())
+
+    def read() -> list[tuple[int | None, str | None, Account | None]]:
+        return [
+            (x.id, x.code, x.adaptive_parent) for x in Account.from_xml(xml, lazy=True)
+        ]
+
+    accounts = benchmark(read)
+    assert len(accounts) == tenant.accounts
+
+
+def test_from_xml_levels(benchmark: Benchmark, tenant: SyntheticTenant) -> None:
+    """Benchmark converting exportLevels into Levels."""
+    xml = ET.fromstring(tenant.export_levels())
+    levels = benchmark(Level.from_xml, xml)
+    assert len(levels) == tenant.levels
+
+
+@pytest.mark.parametrize(
+    "branching",
+    [pytest.param(2, id="deep"), pytest.param(250, id="wide")],
+)
+def test_from_xml_dimension_values(
+    benchmark: Benchmark,
+    scale: int,
+    branching: int,
+) -> None:
+    """Benchmark converting deep and wide exportDimensions into Dimension Values."""
+    tenant = SyntheticTenant(
+        dimensions=1,
+        dimension_values=1_000 * scale,
+        dimension_branching=branching,
+    )
+    xml = ET.fromstring(tenant.export_dimensions())
+    dimension_values = benchmark(DimensionValue.from_xml, xml)
+    assert len(dimension_values) == tenant.dimension_values
+
+
+def test_from_xml_users(benchmark: Benchmark, tenant: SyntheticTenant) -> None:
+    """Benchmark converting exportUsers into Users."""
+    xml = ET.fromstring(tenant.export_users())
+    users = benchmark(User.from_xml, xml)
+    assert len(users) == tenant.users
+
+
+def test_from_xml_users_lazy(benchmark: Benchmark, tenant: SyntheticTenant) -> None:
+    """Benchmark lazily converting exportUsers into Users."""
+    xml = ET.fromstring(tenant.export_users())
+    users = benchmark(User.from_xml, xml, lazy=True)
+    assert len(users) == tenant.users
+
+
+def test_from_xml_time(benchmark: Benchmark, tenant: SyntheticTenant) -> None:
+    """Benchmark converting exportTime into Time."""
+    xml = ET.fromstring(tenant.export_time())
+    time = benchmark(Time.from_xml, xml)
+    assert len(time[0].period) == len(tenant.periods())
+
+
+def test_date_or_none(
+    benchmark: Benchmark, tenant: SyntheticTenant, scale: int
+) -> None:
+    """Benchmark parsing repeated Period dates."""
+    values = [
+        period[key] for period in tenant.periods() for key in ("start", "end")
+    ] * (500 * scale)
+    dates = benchmark(lambda: [date_or_none(value) for value in values])
+    assert len(dates) == len(values)
+
+
+def test_datetime_or_none(benchmark: Benchmark, tenant: SyntheticTenant) -> None:
+    """Benchmark parsing distinct User timestamps."""
+    users = ET.fromstring(tenant.export_users()).iter("user")
+    values = [user.attrib["createdDate"] for user in users]
+    datetimes = benchmark(lambda: [datetime_or_none(value) for value in values])
+    assert len(datetimes) == tenant.users
+
+
+def test_calendar_periods_for_dates(
+    benchmark: Benchmark,
+    tenant: SyntheticTenant,
+    scale: int,
+) -> None:
+    """Benchmark mapping transaction dates to month Periods."""
+    calendar = Calendar.from_time(Time.from_xml(ET.fromstring(tenant.export_time())))
+    first = date(tenant.start_year, 1, 1).toordinal()
+    days = date(tenant.start_year + tenant.years, 1, 1).toordinal() - first
+    dates = [date.fromordinal(first + x % days) for x in range(100_000 * scale)]
+    periods = benchmark(calendar.periods_for_dates, dates)
+    assert None not in periods
+
+
+@pytest.mark.parametrize("validate", [True, False], ids=["validated", "trusted"])
+def test_from_dict_accounts(
+    benchmark: Benchmark,
+    accounts: MetadataList[Account],
+    validate: bool,  # NOQA: FBT001
+) -> None:
+    """Benchmark rebuilding cached Accounts with and without validators."""
+    records = [
+        {x.name: getattr(account, x.name) for x in fields(account)}
+        for account in accounts
+    ]
+    rebuilt = benchmark(Account.from_dict, records, validate=validate)
+    assert len(rebuilt) == len(accounts)
+
+
+def test_to_xml_accounts(
+    benchmark: Benchmark,
+    accounts: MetadataList[Account],
+) -> None:
+    """Benchmark converting Accounts into an importAccounts payload."""
+    leaves = accounts.get_members(code__startswith="A")[-100:]
+    element = benchmark(Account.to_xml, "update", leaves)
+    assert element.tag == "accounts"
+
+
+def test_to_xml_levels(benchmark: Benchmark, levels: MetadataList[Level]) -> None:
+    """Benchmark converting Levels into an importLevels payload."""
+    element = benchmark(Level.to_xml, "update", levels)
+    assert element.tag == "levels"
+
+
+def test_get_member(benchmark: Benchmark, accounts: MetadataList[Account]) -> None:
+    """Benchmark finding the last Account by code."""
+    code = accounts[-1].code
+    account = benchmark(accounts.get_member, code=code)
+    assert account is accounts[-1]
+
+
+def test_get_members_by_attribute(
+    benchmark: Benchmark,
+    accounts: MetadataList[Account],
+) -> None:
+    """Benchmark finding the Accounts of every Attribute Value."""
+
+    def lookup() -> int:
+        accounts.clear_attribute_index()
+        return sum(
+            len(accounts.get_members_by_attribute(1, 100 + value)) for value in range(5)
+        )
+
+    found = benchmark(lookup)
+    assert found == len(accounts)
+
+
+def test_to_csv(
+    benchmark: Benchmark,
+    accounts: MetadataList[Account],
+    tmp_path: Path,
+) -> None:
+    """Benchmark writing Accounts to CSV."""
+    csv_path = tmp_path / "accounts.csv"
+    benchmark(accounts.to_csv, csv_path, rounds=3)
+    assert csv_path.exists()
+
+
+def test_get_common_ancestors(
+    benchmark: Benchmark,
+    levels: MetadataList[Level],
+) -> None:
+    """Benchmark finding the common ancestors of the leaf Levels."""
+    leaves = [level for level in levels if not level.adaptive_children]
+    ancestors = benchmark(Level.get_common_ancestors, leaves, rounds=3)
+    assert ancestors[0] is levels[0]
@@ -1,18 +1,44 @@
-"""wdadaptivepy main entry imports."""
-
-from wdadaptivepy.main import AdaptiveConnection
-from wdadaptivepy.models.account import Account
-from wdadaptivepy.models.attribute import Attribute
-from wdadaptivepy.models.attribute_value import AttributeValue
-from wdadaptivepy.models.base import MetadataAttribute
-from wdadaptivepy.models.dimension import Dimension
-from wdadaptivepy.models.dimension_value import DimensionValue
-from wdadaptivepy.models.group import Group
-from wdadaptivepy.models.level import Level
-from wdadaptivepy.models.permission_set import PermissionSet
-from wdadaptivepy.models.time import Period, Stratum, Time
-from wdadaptivepy.models.user import User
-from wdadaptivepy.models.version import Version
+"""wdadaptivepy main entry imports.
+
+Exports are imported on first access, so importing wdadaptivepy does not
+import httpx, the models, or the services until they are used.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from wdadaptivepy.main import AdaptiveConnection
+    from wdadaptivepy.models.account import Account
+    from wdadaptivepy.models.attribute import Attribute
+    from wdadaptivepy.models.attribute_value import AttributeValue
+    from wdadaptivepy.models.base import MetadataAttribute
+    from wdadaptivepy.models.dimension import Dimension
+    from wdadaptivepy.models.dimension_value import DimensionValue
+    from wdadaptivepy.models.group import Group
+    from wdadaptivepy.models.level import Level
+    from wdadaptivepy.models.permission_set import PermissionSet
+    from wdadaptivepy.models.time import Period, Stratum, Time
+    from wdadaptivepy.models.user import User
+    from wdadaptivepy.models.version import Version
+
+_EXPORTS = {
+    "Account": "wdadaptivepy.models.account",
+    "AdaptiveConnection": "wdadaptivepy.main",
+    "Attribute": "wdadaptivepy.models.attribute",
+    "AttributeValue": "wdadaptivepy.models.attribute_value",
+    "Dimension": "wdadaptivepy.models.dimension",
+    "DimensionValue": "wdadaptivepy.models.dimension_value",
+    "Group": "wdadaptivepy.models.group",
+    "Level": "wdadaptivepy.models.level",
+    "MetadataAttribute": "wdadaptivepy.models.base",
+    "Period": "wdadaptivepy.models.time",
+    "PermissionSet": "wdadaptivepy.models.permission_set",
+    "Stratum": "wdadaptivepy.models.time",
+    "Time": "wdadaptivepy.models.time",
+    "User": "wdadaptivepy.models.user",
+    "Version": "wdadaptivepy.models.version",
+}
 
 __all__ = [
     "Account",
@@ -31,3 +57,34 @@ __all__ = [
     "User",
     "Version",
 ]
+
+
+def __getattr__(name: str) -> Any:  # NOQA: ANN401
+    """Import an export on first access.
+
+    Args:
+        name: Name of the export
+
+    Returns:
+        Exported class
+
+    Raises:
+        AttributeError: Unknown export
+
+    """
+    if name not in _EXPORTS:
+        error_message = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(error_message)
+    value = getattr(import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the module's attributes, including exports not yet imported.
+
+    Returns:
+        Names of the module's attributes
+
+    """
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,6 @@
+"""wdadaptivepy analysis of exported Adaptive data."""
+
+from wdadaptivepy.analysis.rollup import RollupEngine
+from wdadaptivepy.analysis.variance import VarianceTable
+
+__all__ = ["RollupEngine", "VarianceTable"]
@@ -0,0 +1,367 @@
+"""Local rollups of leaf-level Adaptive data."""
+
+from array import array
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from itertools import repeat
+from math import isnan, nan
+from typing import Any, TypeVar
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+from wdadaptivepy.models.account import Account
+from wdadaptivepy.models.base import HierarchicalMetadata
+from wdadaptivepy.models.data_table import DataTable
+from wdadaptivepy.models.dimension_value import DimensionValue
+from wdadaptivepy.models.level import Level
+from wdadaptivepy.models.time import Period
+
+T = TypeVar("T", bound=HierarchicalMetadata)
+
+TIME_ROLL_UPS = ("SUM", "FIRST", "LAST", "AVERAGE")
+TIME_ROLL_UP_ALIASES = {"AVG": "AVERAGE", "AVERAGE": "AVERAGE"}
+
+Ancestors = dict[str, list[tuple[str | None, str | None, float]]]
+
+
+def _ancestors(
+    members: Sequence[T],
+    *,
+    by_code: bool,
+    balance_types: bool = False,
+) -> Ancestors:
+    """Map each member to itself and its ancestors.
+
+    Each entry holds the code, name, and sign of the member's contribution.
+    Signs only flip between Accounts of different balance types.
+    """
+    ancestors: Ancestors = {}
+    for member in members:
+        key = getattr(member, "code" if by_code else "name", None)
+        if key is None:
+            continue
+        entries = [(getattr(member, "code", None), getattr(member, "name", None), 1.0)]
+        sign = 1.0
+        child = member
+        parent = member.adaptive_parent
+        while parent is not None:
+            if balance_types:
+                child_balance = getattr(child, "balance_type", None)
+                parent_balance = getattr(parent, "balance_type", None)
+                if child_balance and parent_balance and child_balance != parent_balance:
+                    sign = -sign
+            entries.append(
+                (getattr(parent, "code", None), getattr(parent, "name", None), sign),
+            )
+            child = parent
+            parent = parent.adaptive_parent
+        ancestors[key] = entries
+    return ancestors
+
+
+def _group_sum(
+    column: Any,  # NOQA: ANN401
+    group_ids: Sequence[int],
+    sources: Sequence[int],
+    signs: Sequence[float],
+    group_count: int,
+) -> Any:  # NOQA: ANN401
+    """Sum signed source amounts into groups, leaving all-blank groups NaN."""
+    if np is not None:
+        values = np.asarray(column, dtype=np.float64)[np.asarray(sources)]
+        values *= np.asarray(signs)
+        present = ~np.isnan(values)
+        ids = np.asarray(group_ids)
+        sums = np.bincount(
+            ids, weights=np.where(present, values, 0), minlength=group_count
+        )
+        counts = np.bincount(ids, weights=present, minlength=group_count)
+        sums[counts == 0] = nan
+        return sums
+    sums = array("d", repeat(nan, group_count))
+    for group_id, source, sign in zip(group_ids, sources, signs, strict=True):
+        value = column[source]
+        if not isnan(value):
+            current = sums[group_id]
+            sums[group_id] = value * sign if isnan(current) else current + value * sign
+    return sums
+
+
+def _time_roll_up(
+    children: Sequence[Any],
+    roll_ups: Sequence[int],
+) -> Any:  # NOQA: ANN401
+    """Aggregate child period columns using each row's time roll up."""
+    if np is not None:
+        stack = np.column_stack([np.asarray(x, dtype=np.float64) for x in children])
+        present = ~np.isnan(stack)
+        counts = present.sum(axis=1)
+        sums = np.where(present, stack, 0).sum(axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            averages = sums / counts
+        sums[counts == 0] = nan
+        codes = np.asarray(roll_ups)
+        return np.select(
+            [codes == 0, codes == 1, codes == 2, codes == 3],  # NOQA: PLR2004
+            [sums, stack[:, 0], stack[:, -1], averages],
+            nan,
+        )
+    result = array("d", repeat(nan, len(roll_ups)))
+    for row, roll_up in enumerate(roll_ups):
+        values = [column[row] for column in children]
+        present = [value for value in values if not isnan(value)]
+        if roll_up == 0 and present:
+            result[row] = sum(present)
+        elif roll_up == 1:
+            result[row] = values[0]
+        elif roll_up == 2:  # NOQA: PLR2004
+            result[row] = values[-1]
+        elif roll_up == 3 and present:  # NOQA: PLR2004
+            result[row] = sum(present) / len(present)
+    return result
+
+
+@dataclass
+class RollupEngine:
+    """Compute Adaptive rollups locally from leaf-level exported data.
+
+    Export leaf-level data once (without rollup Accounts, Levels, or time
+    rollups) as a DataTable, then derive rollup views in memory using the
+    hierarchies already retrieved through the services.
+
+    Account rollups subtract child Accounts whose balance type (debit or
+    credit) differs from their parent's. Time rollups follow each Account's
+    time roll up: SUM, FIRST, LAST, and AVERAGE are supported; other roll
+    ups (such as weighted averages) are left blank. Level and Dimension
+    Value rollups are sums. Blank and invalid cells are ignored; a rollup
+    of only blank cells is blank.
+
+    Attributes:
+        accounts: Account hierarchy
+        levels: Level hierarchy
+        dimension_values: Dimension Value hierarchy of each Dimension, by Dimension name
+        periods: Periods of the time hierarchy
+
+    """
+
+    accounts: Sequence[Account] = field(default_factory=list)
+    levels: Sequence[Level] = field(default_factory=list)
+    dimension_values: Mapping[str, Sequence[DimensionValue]] = field(
+        default_factory=dict,
+    )
+    periods: Sequence[Period] = field(default_factory=list)
+
+    def __rollup_members(
+        self,
+        table: DataTable,
+        column: str,
+        members: Sequence[HierarchicalMetadata],
+        *,
+        balance_types: bool = False,
+    ) -> DataTable:
+        code_column = f"{column} Code"
+        name_column = f"{column} Name"
+        code_index = (
+            table.base_columns.index(code_column)
+            if code_column in table.base_columns
+            else None
+        )
+        name_index = (
+            table.base_columns.index(name_column)
+            if name_column in table.base_columns
+            else None
+        )
+        key_index = code_index if code_index is not None else name_index
+        if key_index is None:
+            error_message = f"Expected a {code_column} or {name_column} column"
+            raise ValueError(error_message)
+        ancestors = _ancestors(
+            members,
+            by_code=code_index is not None,
+            balance_types=balance_types,
+        )
+
+        groups: dict[tuple[str, ...], int] = {}
+        group_ids: list[int] = []
+        sources: list[int] = []
+        signs: list[float] = []
+        rows = zip(*table.base_values, strict=True) if table.base_values else []
+        for source, base_row in enumerate(rows):
+            entries = ancestors.get(base_row[key_index])
+            if entries is None:
+                entries = [(None, None, 1.0)]
+            for code, name, sign in entries:
+                values = list(base_row)
+                if code_index is not None and code is not None:
+                    values[code_index] = code
+                if name_index is not None and name is not None:
+                    values[name_index] = name
+                group_ids.append(groups.setdefault(tuple(values), len(groups)))
+                sources.append(source)
+                signs.append(sign)
+
+        amounts = [
+            _group_sum(period_amounts, group_ids, sources, signs, len(groups))
+            for period_amounts in table.amounts
+        ]
+        base_values = (
+            [list(x) for x in zip(*groups, strict=True)]
+            if groups
+            else [[] for _ in table.base_columns]
+        )
+        return DataTable.from_columns(
+            table.base_columns,
+            base_values,
+            table.periods,
+            amounts,
+        )
+
+    def rollup_accounts(self, table: DataTable) -> DataTable:
+        """Add rollup Accounts to leaf-level data.
+
+        Args:
+            table: Exported data
+
+        Returns:
+            Data including every ancestor Account
+
+        """
+        return self.__rollup_members(
+            table,
+            "Account",
+            self.accounts,
+            balance_types=True,
+        )
+
+    def rollup_levels(self, table: DataTable) -> DataTable:
+        """Add rollup Levels to leaf-level data.
+
+        Args:
+            table: Exported data
+
+        Returns:
+            Data including every ancestor Level
+
+        """
+        return self.__rollup_members(table, "Level", self.levels)
+
+    def rollup_dimension(self, table: DataTable, dimension: str) -> DataTable:
+        """Add rollup Dimension Values of a Dimension to leaf-level data.
+
+        Args:
+            table: Exported data
+            dimension: Name of the Dimension
+
+        Returns:
+            Data including every ancestor Dimension Value
+
+        """
+        return self.__rollup_members(
+            table,
+            dimension,
+            self.dimension_values.get(dimension, []),
+        )
+
+    def rollup_time(self, table: DataTable) -> DataTable:
+        """Add rollup Periods to leaf-level data.
+
+        A rollup Period is only added when all of its descendants of the
+        exported stratum are exported.
+
+        Args:
+            table: Exported data
+
+        Returns:
+            Data including every fully exported ancestor Period
+
+        """
+        positions = {period: index for index, period in enumerate(table.periods)}
+        strata = {
+            period.stratum_id
+            for period in self.periods
+            if period.code in positions and period.stratum_id is not None
+        }
+        roll_ups = self.__row_time_roll_ups(table)
+        periods = list(table.periods)
+        amounts = list(table.amounts)
+        for period in self.periods:
+            if period.code is None or period.code in positions:
+                continue
+            children = [
+                descendant
+                for descendant in period.get_descendents()
+                if descendant.stratum_id in strata
+            ]
+            if not children or any(child.code not in positions for child in children):
+                continue
+            children.sort(key=lambda child: positions[child.code])
+            periods.append(period.code)
+            amounts.append(
+                _time_roll_up(
+                    [table.amounts[positions[child.code]] for child in children],
+                    roll_ups,
+                ),
+            )
+        return DataTable.from_columns(
+            table.base_columns,
+            table.base_values,
+            periods,
+            amounts,
+        )
+
+    def __row_time_roll_ups(self, table: DataTable) -> list[int]:
+        """Get the time roll up of each row's Account as an index of TIME_ROLL_UPS."""
+        by_code = "Account Code" in table.base_columns
+        column = "Account Code" if by_code else "Account Name"
+        roll_ups: dict[str, int] = {}
+        for account in self.accounts:
+            key = account.code if by_code else account.name
+            if key is None:
+                continue
+            roll_up = (account.time_roll_up or "SUM").upper()
+            roll_up = TIME_ROLL_UP_ALIASES.get(roll_up, roll_up)
+            roll_ups[key] = (
+                TIME_ROLL_UPS.index(roll_up)
+                if roll_up in TIME_ROLL_UPS
+                else len(TIME_ROLL_UPS)
+            )
+        if column not in table.base_columns:
+            return [0] * table.row_count
+        return [roll_ups.get(key, 0) for key in table.column(column)]
+
+    def rollup(
+        self,
+        table: DataTable,
+        *,
+        accounts: bool = True,
+        levels: bool = True,
+        dimensions: bool | Sequence[str] = True,
+        time: bool = True,
+    ) -> DataTable:
+        """Add every requested rollup to leaf-level data.
+
+        Args:
+            table: Exported data
+            accounts: Add rollup Accounts
+            levels: Add rollup Levels
+            dimensions: Add rollup Dimension Values (of all or the given Dimensions)
+            time: Add rollup Periods
+
+        Returns:
+            Data including rollups
+
+        """
+        if accounts:
+            table = self.rollup_accounts(table)
+        if levels:
+            table = self.rollup_levels(table)
+        if dimensions is True:
+            dimensions = list(self.dimension_values)
+        for dimension in dimensions or []:
+            table = self.rollup_dimension(table, dimension)
+        if time:
+            table = self.rollup_time(table)
+        return table
@@ -0,0 +1,215 @@
+"""Cell-by-cell variance between two exports of Adaptive data."""
+
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass
+from itertools import repeat
+from math import isnan, nan
+from typing import Any, Literal
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+from wdadaptivepy.models.data_table import DataTable
+
+VarianceMeasure = Literal["base", "compare", "difference", "percentage"]
+
+
+def _aligned(table: DataTable, period: str, indexes: Sequence[int]) -> Any:  # NOQA: ANN401
+    """Gather a period's amounts by row position (NaN for -1 or a missing period)."""
+    if period not in table.periods:
+        if np is not None:
+            return np.full(len(indexes), nan)
+        return array("d", repeat(nan, len(indexes)))
+    column = table.column(period)
+    if np is not None:
+        return np.append(np.asarray(column, dtype=np.float64), nan)[
+            np.asarray(indexes, dtype=np.int64)
+        ]
+    return array("d", (column[index] if index >= 0 else nan for index in indexes))
+
+
+def _compare_columns(base: Any, compare: Any) -> tuple[Any, Any, Any, Any]:  # NOQA: ANN401
+    """Compute the difference, percentage, and missing masks of aligned columns."""
+    if np is not None:
+        base_blank = np.isnan(base)
+        compare_blank = np.isnan(compare)
+        difference = np.nan_to_num(compare) - np.nan_to_num(base)
+        difference[base_blank & compare_blank] = nan
+        with np.errstate(invalid="ignore", divide="ignore"):
+            percentage = difference / np.abs(base)
+        percentage[base_blank | (base == 0)] = nan
+        return (
+            difference,
+            percentage,
+            base_blank & ~compare_blank,
+            compare_blank & ~base_blank,
+        )
+    size = len(base)
+    difference = array("d", repeat(nan, size))
+    percentage = array("d", repeat(nan, size))
+    missing_in_base = bytearray(size)
+    missing_in_compare = bytearray(size)
+    for row, (base_amount, compare_amount) in enumerate(
+        zip(base, compare, strict=True)
+    ):
+        base_blank = isnan(base_amount)
+        compare_blank = isnan(compare_amount)
+        if base_blank and compare_blank:
+            continue
+        if base_blank:
+            missing_in_base[row] = 1
+            difference[row] = compare_amount
+            continue
+        if compare_blank:
+            missing_in_compare[row] = 1
+            difference[row] = -base_amount
+        else:
+            difference[row] = compare_amount - base_amount
+        if base_amount != 0:
+            percentage[row] = difference[row] / abs(base_amount)
+    return difference, percentage, missing_in_base, missing_in_compare
+
+
+@dataclass(eq=False)
+class VarianceTable:
+    """Columnar cell-by-cell comparison of two exports.
+
+    Rows are the union of both exports' rows, matched on their base values;
+    periods are the union of both exports' periods. Each measure is kept as
+    one float64 array per period (a NumPy array when NumPy is installed, an
+    `array.array` otherwise).
+
+    A blank or missing cell on one side counts as zero in the difference.
+    Percentages are relative to the absolute base amount and are NaN when
+    the base amount is blank or zero.
+
+    Attributes:
+        base_columns: Names of the base columns
+        base_values: Values of each base column
+        periods: Period codes of the period columns
+        base: Base amounts (such as Budget) of each period column
+        compare: Compared amounts (such as Actuals) of each period column
+        difference: Compared minus base amounts of each period column
+        percentage: Difference relative to the base amount of each period column
+        missing_in_base: Mask of cells only found in the compared data
+        missing_in_compare: Mask of cells only found in the base data
+
+    """
+
+    base_columns: list[str]
+    base_values: list[Sequence[str]]
+    periods: list[str]
+    base: list[Any]
+    compare: list[Any]
+    difference: list[Any]
+    percentage: list[Any]
+    missing_in_base: list[Any]
+    missing_in_compare: list[Any]
+
+    @classmethod
+    def from_tables(cls, base: DataTable, compare: DataTable) -> "VarianceTable":
+        """Align two exports on their base values with a hash join.
+
+        Args:
+            base: Base data (such as Budget)
+            compare: Compared data (such as Actuals)
+
+        Returns:
+            Variance of every cell
+
+        Raises:
+            ValueError: The exports have different base columns, or several
+                rows of an export have the same base values
+
+        """
+        if base.base_columns != compare.base_columns:
+            error_message = "Expected data with the same base columns"
+            raise ValueError(error_message)
+        rows = base.row_index()
+        base_indexes = [*range(len(rows))]
+        compare_indexes = [-1] * len(rows)
+        for row, index in compare.row_index().items():
+            position = rows.setdefault(row, len(rows))
+            if position == len(compare_indexes):
+                compare_indexes.append(index)
+                base_indexes.append(-1)
+            else:
+                compare_indexes[position] = index
+
+        periods = list(base.periods)
+        periods.extend(x for x in compare.periods if x not in base.periods)
+        variance = cls(
+            base_columns=list(base.base_columns),
+            base_values=[list(x) for x in zip(*rows, strict=True)]
+            if rows
+            else [[] for _ in base.base_columns],
+            periods=periods,
+            base=[],
+            compare=[],
+            difference=[],
+            percentage=[],
+            missing_in_base=[],
+            missing_in_compare=[],
+        )
+        for period in periods:
+            base_amounts = _aligned(base, period, base_indexes)
+            compare_amounts = _aligned(compare, period, compare_indexes)
+            difference, percentage, missing_in_base, missing_in_compare = (
+                _compare_columns(base_amounts, compare_amounts)
+            )
+            variance.base.append(base_amounts)
+            variance.compare.append(compare_amounts)
+            variance.difference.append(difference)
+            variance.percentage.append(percentage)
+            variance.missing_in_base.append(missing_in_base)
+            variance.missing_in_compare.append(missing_in_compare)
+        return variance
+
+    @property
+    def row_count(self) -> int:
+        """Number of aligned rows.
+
+        Returns:
+            Number of rows
+
+        """
+        if self.base_values:
+            return len(self.base_values[0])
+        if self.base:
+            return len(self.base[0])
+        return 0
+
+    def __len__(self) -> int:
+        """Count the aligned rows.
+
+        Returns:
+            Number of rows
+
+        """
+        return self.row_count
+
+    def to_data_table(self, measure: VarianceMeasure = "difference") -> DataTable:
+        """Convert one measure of the variance into a DataTable.
+
+        Args:
+            measure: Measure to convert
+
+        Returns:
+            DataTable of the measure
+
+        Raises:
+            ValueError: Unexpected measure
+
+        """
+        if measure not in ("base", "compare", "difference", "percentage"):
+            error_message = f"Unexpected measure {measure}"
+            raise ValueError(error_message)
+        return DataTable.from_columns(
+            self.base_columns,
+            self.base_values,
+            self.periods,
+            getattr(self, measure),
+        )
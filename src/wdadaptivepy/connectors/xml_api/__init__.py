@@ -3,6 +3,9 @@
 Exposes functions to allow wdadaptivepy to utilize Adaptive's XML API
 """
 
+from wdadaptivepy.connectors.xml_api.cassette import Cassette
+from wdadaptivepy.connectors.xml_api.rate_limiter import RateLimiter
+from wdadaptivepy.connectors.xml_api.single_flight import SingleFlight
 from wdadaptivepy.connectors.xml_api.xml_api import XMLApi
 
-__all__ = ["XMLApi"]
+__all__ = ["Cassette", "RateLimiter", "SingleFlight", "XMLApi"]
@@ -0,0 +1,143 @@
+"""Record and replay Adaptive XML API responses."""
+
+import gzip
+import hashlib
+import os
+import tempfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from threading import Lock
+from typing import Literal
+from xml.etree import ElementTree as ET
+
+from wdadaptivepy.connectors.xml_api.exceptions import CassetteMissError
+
+CassetteMode = Literal["record", "replay", "replay_or_record"]
+CASSETTE_MODES = ("record", "replay", "replay_or_record")
+
+
+@dataclass
+class Cassette:
+    """Store of recorded XML API responses keyed by request fingerprint.
+
+    Each response is stored gzip-compressed in its own file, named after the
+    fingerprint of the request. Fingerprints cover the method, XML API
+    version, streaming flag, instance code, locale, and canonicalized payload;
+    the login and password are never part of a fingerprint, so recordings can
+    be shared between logins but not between instances.
+
+    Modes:
+    - `record`: Always call Adaptive and store the response
+    - `replay`: Only replay stored responses, raising CassetteMissError otherwise
+    - `replay_or_record`: Replay stored responses, calling Adaptive and
+      storing the response otherwise
+
+    Attributes:
+        path: Directory of the recorded responses
+        mode: Record and replay behavior
+        hits: Number of requests answered from the cassette
+        misses: Number of requests not found in the cassette
+
+    """
+
+    path: Path | str
+    mode: CassetteMode = "replay_or_record"
+    hits: int = field(default=0, init=False)
+    misses: int = field(default=0, init=False)
+
+    def __post_init__(self) -> None:
+        """Clean up Cassette instance.
+
+        Raises:
+            ValueError: Unexpected mode
+
+        """
+        if self.mode not in CASSETTE_MODES:
+            error_message = f"Expected mode to be one of {', '.join(CASSETTE_MODES)}"
+            raise ValueError(error_message)
+        self.path = Path(self.path)
+        self.__lock = Lock()
+
+    @staticmethod
+    def fingerprint(  # NOQA: PLR0913
+        method: str,
+        payload: bytes,
+        *,
+        version: int,
+        stream: bool = False,
+        instance_code: str | None = None,
+        locale: str | None = None,
+    ) -> str:
+        """Fingerprint an XML API request.
+
+        Args:
+            method: Adaptive XML API name
+            payload: Serialized body of the XML API call (without credentials)
+            version: Version of Adaptive's XML API
+            stream: Stream XML response
+            instance_code: Adaptive tenant/instance code of the call
+            locale: Locale of the call
+
+        Returns:
+            Hex digest identifying the request
+
+        """
+        canonical_payload = ET.canonicalize(
+            xml_data=b"<payload>" + payload + b"</payload>",
+            strip_text=True,
+        )
+        digest = hashlib.sha256()
+        digest.update(f"{method}\0{version}\0{stream}\0".encode())
+        if instance_code or locale:
+            digest.update(f"{instance_code or ''}\0{locale or ''}\0".encode())
+        digest.update(canonical_payload.encode())
+        return digest.hexdigest()
+
+    def __file(self, fingerprint: str) -> Path:
+        return Path(self.path) / f"{fingerprint}.xml.gz"
+
+    def play(self, method: str, fingerprint: str) -> bytes | None:
+        """Get the recorded response of a request.
+
+        Args:
+            method: Adaptive XML API name
+            fingerprint: Fingerprint of the request
+
+        Returns:
+            Recorded response body, or None if the request should be sent
+
+        Raises:
+            CassetteMissError: No recording exists in replay mode
+
+        """
+        if self.mode == "record":
+            return None
+        file = self.__file(fingerprint)
+        if file.exists():
+            with self.__lock:
+                self.hits += 1
+            return gzip.decompress(file.read_bytes())
+        with self.__lock:
+            self.misses += 1
+        if self.mode == "replay":
+            raise CassetteMissError(method=method, fingerprint=fingerprint)
+        return None
+
+    def record(self, fingerprint: str, content: bytes) -> None:
+        """Store the response of a request.
+
+        Args:
+            fingerprint: Fingerprint of the request
+            content: Response body
+
+        """
+        file = self.__file(fingerprint)
+        file.parent.mkdir(parents=True, exist_ok=True)
+        descriptor, temporary_name = tempfile.mkstemp(dir=file.parent, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as temporary_file:
+                temporary_file.write(gzip.compress(content))
+            Path(temporary_name).replace(file)
+        except BaseException:
+            Path(temporary_name).unlink(missing_ok=True)
+            raise
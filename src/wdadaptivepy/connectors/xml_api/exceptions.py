@@ -26,3 +26,26 @@ class FailedRequestError(Exception):
             error_message = str(message)
         super().__init__(error_message, method)
         self.method = method
+
+
+class CassetteMissError(Exception):
+    """Exception for XML API calls without a recording in replay mode.
+
+    Attributes:
+        method: Adaptive XML API name
+        fingerprint: Fingerprint of the XML API call
+
+    """
+
+    def __init__(self, method: str, fingerprint: str) -> None:
+        """Generate Exception for XML API calls without a recording.
+
+        Args:
+            method: Adaptive XML API name
+            fingerprint: Fingerprint of the XML API call
+
+        """
+        error_message = f"No recorded response for {method} ({fingerprint})"
+        super().__init__(error_message, method)
+        self.method = method
+        self.fingerprint = fingerprint
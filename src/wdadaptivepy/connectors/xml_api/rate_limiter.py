@@ -0,0 +1,74 @@
+"""Client-side rate limiting of Adaptive XML API calls."""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from threading import BoundedSemaphore, Lock
+
+
+@dataclass
+class RateLimiter:
+    """Limit the pace and concurrency of XML API calls.
+
+    Share one RateLimiter between connections (or between the clones of a
+    fan-out export) to keep all of their calls within the same limits.
+
+    Attributes:
+        requests_per_second: Calls started per second (unlimited if None)
+        max_concurrent_requests: Calls in flight at once (unlimited if None)
+        waited: Total seconds calls waited for the rate limit
+
+    """
+
+    requests_per_second: float | None = None
+    max_concurrent_requests: int | None = None
+    waited: float = field(default=0.0, init=False)
+
+    def __post_init__(self) -> None:
+        """Clean up RateLimiter instance.
+
+        Raises:
+            ValueError: Limit that is not positive
+
+        """
+        if (self.requests_per_second is not None and self.requests_per_second <= 0) or (
+            self.max_concurrent_requests is not None
+            and self.max_concurrent_requests <= 0
+        ):
+            error_message = "Expected positive rate limits"
+            raise ValueError(error_message)
+        self.__lock = Lock()
+        self.__next_start = 0.0
+        self.__slots = (
+            BoundedSemaphore(self.max_concurrent_requests)
+            if self.max_concurrent_requests is not None
+            else None
+        )
+
+    @contextmanager
+    def acquire(self) -> Iterator[float]:
+        """Wait until a call may start, holding a concurrency slot until it ends.
+
+        Yields:
+            Seconds waited
+
+        """
+        started = time.monotonic()
+        if self.__slots is not None:
+            self.__slots.acquire()
+        try:
+            if self.requests_per_second is not None:
+                with self.__lock:
+                    now = time.monotonic()
+                    start = max(now, self.__next_start)
+                    self.__next_start = start + 1 / self.requests_per_second
+                if start > now:
+                    time.sleep(start - now)
+            waited = time.monotonic() - started
+            with self.__lock:
+                self.waited += waited
+            yield waited
+        finally:
+            if self.__slots is not None:
+                self.__slots.release()
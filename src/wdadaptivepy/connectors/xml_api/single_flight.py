@@ -0,0 +1,84 @@
+"""Share one in-flight call between threads making the same call."""
+
+from collections.abc import Callable, Hashable
+from threading import Event, Lock
+from typing import Generic, TypeVar
+
+T = TypeVar("T")
+
+
+class _Flight(Generic[T]):
+    """Outcome of a call shared by the threads waiting on it."""
+
+    def __init__(self) -> None:
+        self.done = Event()
+        self.result: T | None = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight(Generic[T]):
+    """Run a call once for all threads asking for the same key at once.
+
+    The first thread asking for a key runs the call; threads asking for the
+    same key before it finishes wait for it and share its result (or its
+    exception). Nothing is cached: once the call finishes, the next request
+    for the key runs the call again.
+
+    Attributes:
+        shared: Number of calls answered by another thread's in-flight call
+
+    """
+
+    def __init__(self) -> None:
+        """Initialize SingleFlight."""
+        self.__lock = Lock()
+        self.__flights: dict[Hashable, _Flight[T]] = {}
+        self.shared = 0
+
+    def do(self, key: Hashable, func: Callable[[], T]) -> T:
+        """Run a call, or wait for the identical call already in flight.
+
+        Args:
+            key: Identity of the call
+            func: Call to run
+
+        Returns:
+            Result of the call
+
+        Raises:
+            BaseException: Exception raised by the call
+
+        """
+        with self.__lock:
+            flight = self.__flights.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = _Flight()
+                self.__flights[key] = flight
+            else:
+                self.shared += 1
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result  # pyright: ignore[reportReturnType]
+        try:
+            flight.result = func()
+        except BaseException as error:
+            flight.error = error
+            raise
+        finally:
+            with self.__lock:
+                del self.__flights[key]
+            flight.done.set()
+        return flight.result
+
+    def in_flight(self) -> int:
+        """Count the calls currently in flight.
+
+        Returns:
+            Number of calls in flight
+
+        """
+        with self.__lock:
+            return len(self.__flights)
@@ -1,11 +1,15 @@
 """Class to connect to Adaptive's XML API."""
 
-from collections.abc import Sequence
-from dataclasses import dataclass
+import hashlib
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field, fields, replace
+from threading import Lock
+from typing import Any
 from xml.etree import ElementTree as ET
 
 import httpx
 
+from wdadaptivepy.connectors.xml_api.cassette import Cassette
 from wdadaptivepy.connectors.xml_api.constants import (
     BASE_URL,
     DEFAULT_CALLER_NAME,
@@ -15,6 +19,35 @@ from wdadaptivepy.connectors.xml_api.exceptions import (
     FailedRequestError,
     InvalidCredentialsError,
 )
+from wdadaptivepy.connectors.xml_api.rate_limiter import RateLimiter
+from wdadaptivepy.connectors.xml_api.single_flight import SingleFlight
+from wdadaptivepy.instrumentation import Instrumentation
+
+XMLPayload = ET.Element | Sequence[ET.Element] | bytes | Iterator[bytes] | None
+
+
+@dataclass(frozen=True)
+class Credentials:
+    """Snapshot of the credentials sent with an XML API call.
+
+    Attributes:
+        login: Adaptive username/login
+        password: Adaptive password
+        locale: Locale for text translations and data formats
+        instance_code: Adaptive tenant/instance code
+        caller_name: Identifier used within Adaptive's logs
+
+    """
+
+    login: str
+    password: str = field(repr=False)
+    locale: str | None = None
+    instance_code: str | None = None
+    caller_name: str = DEFAULT_CALLER_NAME
+
+
+CREDENTIAL_FIELDS = tuple(x.name for x in fields(Credentials))
+READ_METHOD_PREFIX = "export"
 
 
 @dataclass
@@ -28,6 +61,19 @@ class XMLApi:
         instance_code: Adaptive tenant/instance code
         caller_name: Identifier used within Adaptive's logs
         version: Version of Adaptive's XML API
+        instrumentation: Timing and measurements of XML API calls
+        base_url: URL of Adaptive's XML API (without the version)
+        transport: httpx transport used instead of the network (such as a
+            wdadaptivepy.testing.FakeAdaptiveServer)
+        cassette: Record and replay store of XML API responses
+        rate_limiter: Limits on the pace and concurrency of XML API calls
+        coalesce_requests: Share one in-flight response between identical
+            concurrent export calls
+
+    An XMLApi can be shared between threads. Each call takes a snapshot of
+    the credentials when it starts, so changing them (preferably with
+    update_credentials) never affects calls already in flight, and the
+    pooled HTTP client is created once for all threads.
 
     """
 
@@ -37,32 +83,158 @@ class XMLApi:
     instance_code: str | None = None
     caller_name: str = DEFAULT_CALLER_NAME
     version: int = MINIMUM_VERSION
+    instrumentation: Instrumentation = field(
+        default_factory=Instrumentation,
+        repr=False,
+        compare=False,
+    )
+    base_url: str = BASE_URL
+    transport: httpx.BaseTransport | None = field(
+        default=None,
+        repr=False,
+        compare=False,
+    )
+    cassette: Cassette | None = field(default=None, repr=False, compare=False)
+    rate_limiter: RateLimiter | None = field(default=None, repr=False, compare=False)
+    coalesce_requests: bool = field(default=True, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Clean up XMLApi instance."""
+        self.__envelopes: tuple[
+            Credentials | None,
+            dict[tuple[str, bool], tuple[bytes, bytes]],
+        ] = (None, {})
+        self.__credentials_lock = Lock()
+        self.__client_lock = Lock()
+        self.__client: httpx.Client | None = None
+        self.__client_transport: httpx.BaseTransport | None = None
+        self.__owns_client = True
+        self.__flights: SingleFlight[bytes] = SingleFlight()
+
+    @property
+    def coalesced_requests(self) -> int:
+        """Number of calls answered by an identical call already in flight.
+
+        Returns:
+            Number of coalesced calls
+
+        """
+        return self.__flights.shared
+
+    def __get_client(self) -> httpx.Client:
+        """Get the pooled HTTP client, rebuilding it if the transport changed."""
+        with self.__client_lock:
+            client = self.__client
+            if client is None or self.__client_transport is not self.transport:
+                if client is not None and self.__owns_client:
+                    client.close()
+                client = httpx.Client(transport=self.transport)
+                self.__client = client
+                self.__client_transport = self.transport
+                self.__owns_client = True
+            return client
+
+    def close(self) -> None:
+        """Close the pooled HTTP connections to Adaptive.
+
+        Connections shared with a derived XMLApi are only closed by the
+        XMLApi they were derived from.
+        """
+        with self.__client_lock:
+            if self.__client is not None:
+                if self.__owns_client:
+                    self.__client.close()
+                self.__client = None
+                self.__client_transport = None
+
+    def derive(self, **changes: Any) -> "XMLApi":  # NOQA: ANN401
+        """Create a modified XMLApi sharing this one's connection pool.
+
+        The derived XMLApi also shares the instrumentation, cassette, rate
+        limiter, and in-flight calls unless they are changed, so it suits
+        concurrent calls to other instance codes or with other credentials.
+
+        Args:
+            **changes: Fields to change (such as instance_code)
+
+        Returns:
+            Derived XMLApi
+
+        """
+        with self.__credentials_lock:
+            xml_api = replace(self, **changes)
+        xml_api.__client = self.__get_client()  # NOQA: SLF001
+        xml_api.__client_transport = self.transport  # NOQA: SLF001
+        xml_api.__owns_client = False  # NOQA: SLF001
+        xml_api.__flights = self.__flights  # NOQA: SLF001
+        return xml_api
+
+    def credentials(self) -> Credentials:
+        """Take a snapshot of the credentials sent with XML API calls.
+
+        Returns:
+            wdadaptivepy Credentials
+
+        """
+        with self.__credentials_lock:
+            return Credentials(
+                login=self.login,
+                password=self.password,
+                locale=self.locale,
+                instance_code=self.instance_code,
+                caller_name=self.caller_name,
+            )
+
+    def update_credentials(self, **changes: str | None) -> None:
+        """Change several credentials at once.
+
+        Calls never see only some of the changes, and calls already in
+        flight keep the credentials they started with.
+
+        Args:
+            **changes: New login, password, locale, instance_code, or
+                caller_name
+
+        Raises:
+            TypeError: Unexpected credential
+
+        """
+        unexpected = set(changes).difference(CREDENTIAL_FIELDS)
+        if unexpected:
+            error_message = f"Unexpected credentials {', '.join(sorted(unexpected))}"
+            raise TypeError(error_message)
+        with self.__credentials_lock:
+            for name, value in changes.items():
+                setattr(self, name, value)
 
     def __generate_xml_call(
         self,
         method: str,
         payload: ET.Element | Sequence[ET.Element] | None,
+        credentials: Credentials | None = None,
         *,
         stream: bool = False,
     ) -> ET.Element:
+        if credentials is None:
+            credentials = self.credentials()
         call = ET.Element(
             "call",
-            attrib={"method": method, "callerName": self.caller_name},
+            attrib={"method": method, "callerName": credentials.caller_name},
         )
         if stream:
             call.attrib["stream"] = "true"
-        credentials = ET.Element(
+        credentials_element = ET.Element(
             "credentials",
             attrib={
-                "login": self.login,
-                "password": self.password,
+                "login": credentials.login,
+                "password": credentials.password,
             },
         )
-        if self.locale:
-            credentials.attrib["locale"] = self.locale
-        if self.instance_code:
-            credentials.attrib["instanceCode"] = self.instance_code
-        call.append(credentials)
+        if credentials.locale:
+            credentials_element.attrib["locale"] = credentials.locale
+        if credentials.instance_code:
+            credentials_element.attrib["instanceCode"] = credentials.instance_code
+        call.append(credentials_element)
         if payload is not None:
             if isinstance(payload, ET.Element):
                 call.append(payload)
@@ -73,6 +245,83 @@ class XMLApi:
                 call.extend(payload)
         return call
 
+    def __get_envelope(
+        self,
+        method: str,
+        credentials: Credentials,
+        *,
+        stream: bool,
+    ) -> tuple[bytes, bytes]:
+        """Get the serialized opening and closing bytes surrounding a payload.
+
+        The envelope only depends on the method and the connection's
+        credentials, so it is serialized once and reused until any of the
+        credentials change. The credentials and their envelopes are swapped
+        together, so concurrent calls never mix envelopes of other credentials.
+        """
+        envelope_credentials, envelopes = self.__envelopes
+        if envelope_credentials != credentials:
+            envelopes = {}
+            self.__envelopes = (credentials, envelopes)
+        envelope = envelopes.get((method, stream))
+        if envelope is None:
+            call = ET.tostring(
+                self.__generate_xml_call(method, None, credentials, stream=stream),
+            )
+            envelope = (call.removesuffix(b"</call>"), b"</call>")
+            envelopes[(method, stream)] = envelope
+        return envelope
+
+    def __iter_payload(self, payload: XMLPayload) -> Iterator[bytes]:
+        if payload is None:
+            return
+        if isinstance(payload, bytes):
+            yield payload
+        elif isinstance(payload, ET.Element):
+            yield ET.tostring(payload)
+        elif isinstance(payload, Sequence):
+            if not all(isinstance(element, ET.Element) for element in payload):
+                error_message = "Expected XML Element Tree Element"
+                raise TypeError(error_message)
+            for element in payload:
+                yield ET.tostring(element)
+        elif isinstance(payload, Iterable):
+            for chunk in payload:
+                if not isinstance(chunk, bytes):
+                    error_message = "Expected bytes"
+                    raise TypeError(error_message)
+                yield chunk
+        else:
+            error_message = "Unexpected payload type"
+            raise TypeError(error_message)
+
+    def iter_xml_request(
+        self,
+        method: str,
+        payload: XMLPayload,
+        *,
+        stream: bool = False,
+        credentials: Credentials | None = None,
+    ) -> Iterator[bytes]:
+        """Serialize an XML API call as chunks of bytes.
+
+        Args:
+            method: Adaptive XML API name
+            payload: Body of XML API call (XML Elements or pre-serialized bytes)
+            stream: Stream XML response
+            credentials: Credentials of the call (current credentials if None)
+
+        Yields:
+            Serialized XML API call
+
+        """
+        if credentials is None:
+            credentials = self.credentials()
+        prefix, suffix = self.__get_envelope(method, credentials, stream=stream)
+        yield prefix
+        yield from self.__iter_payload(payload)
+        yield suffix
+
     def preview_xml_request(
         self,
         method: str,
@@ -97,38 +346,155 @@ class XMLApi:
             credentials.attrib["password"] = "*" * len(credentials.attrib["password"])
         return call
 
-    def make_xml_request(
+    def __count_bytes(
+        self,
+        chunks: Iterator[bytes],
+        attributes: dict[str, int],
+    ) -> Iterator[bytes]:
+        attributes["request_bytes"] = 0
+        for chunk in chunks:
+            attributes["request_bytes"] += len(chunk)
+            yield chunk
+
+    def __send(
         self,
         method: str,
-        payload: ET.Element | Sequence[ET.Element] | None,
+        payload: XMLPayload,
+        credentials: Credentials,
+        url: str,
         *,
-        stream: bool = False,
-    ) -> ET.Element:
-        """Send API call to Adaptive.
+        stream: bool,
+    ) -> bytes:
+        body = self.iter_xml_request(
+            method,
+            payload,
+            stream=stream,
+            credentials=credentials,
+        )
+        request_headers = {"Content-Type": "application/xml"}
+        with self.instrumentation.span("http", method=method) as span:
+            if isinstance(payload, Iterator):
+                content = self.__count_bytes(body, span.attributes)
+            else:
+                content = b"".join(body)
+                span.attributes["request_bytes"] = len(content)
+            client = self.__get_client()
+            if self.rate_limiter is None:
+                response = client.post(
+                    url=url, content=content, headers=request_headers
+                )
+            else:
+                with self.rate_limiter.acquire() as waited:
+                    span.attributes["rate_limit_wait"] = waited
+                    response = client.post(
+                        url=url,
+                        content=content,
+                        headers=request_headers,
+                    )
+            span.attributes["response_bytes"] = len(response.content)
+        return response.content
 
-        Args:
-            method: Adaptive XML API name
-            payload:Body of XML API call
-            stream: Stream XML response
+    def __fetch(
+        self,
+        method: str,
+        payload: XMLPayload,
+        credentials: Credentials,
+        version: int,
+        *,
+        stream: bool,
+    ) -> tuple[bytes, str | None]:
+        """Get the response body from the cassette or from Adaptive.
 
-        Returns:
-            XML Element of API response
+        The fingerprint is only returned when the response should be recorded.
+        """
+        url = self.base_url + "v" + str(version)
+        fingerprint = None
+        content = None
+        if self.cassette is not None:
+            payload = b"".join(self.__iter_payload(payload))
+            fingerprint = self.cassette.fingerprint(
+                method,
+                payload,
+                version=version,
+                stream=stream,
+                instance_code=credentials.instance_code,
+                locale=credentials.locale,
+            )
+            with self.instrumentation.span("cassette", method=method) as span:
+                content = self.cassette.play(method, fingerprint)
+                span.attributes["hit"] = content is not None
+        if content is not None:
+            return content, None
+        return self.__send(
+            method, payload, credentials, url, stream=stream
+        ), fingerprint
 
-        Raises:
-            InvalidCredentialsError: Exception indicating the credentials are invalid
-            FailedRequestError: Exception indicating the API request was unsuccessful
+    def __receive(
+        self,
+        method: str,
+        payload: XMLPayload,
+        *,
+        stream: bool,
+    ) -> tuple[bytes, str | None, bool]:
+        """Get the response body, sharing identical export calls in flight.
 
+        Only the caller that made the shared call gets the fingerprint to
+        record, and the last value tells whether the response was shared.
         """
-        call = self.__generate_xml_call(method, payload, stream=stream)
-
-        request_headers = {"Content-Type": "application/xml"}
-        response = httpx.post(
-            url=BASE_URL + "v" + str(self.version),
-            content=ET.tostring(call),
-            headers=request_headers,
+        credentials = self.credentials()
+        version = self.version
+        if (
+            not self.coalesce_requests
+            or not method.startswith(READ_METHOD_PREFIX)
+            or isinstance(payload, Iterator)
+        ):
+            content, fingerprint = self.__fetch(
+                method,
+                payload,
+                credentials,
+                version,
+                stream=stream,
+            )
+            return content, fingerprint, False
+        payload = b"".join(self.__iter_payload(payload))
+        key = (
+            Cassette.fingerprint(method, payload, version=version, stream=stream),
+            credentials,
+            self.base_url,
         )
+        fingerprints: list[str | None] = []
 
-        tree = ET.fromstring(text=response.text)  # NOQA: S314
+        def request() -> bytes:
+            content, fingerprint = self.__fetch(
+                method,
+                payload,
+                credentials,
+                version,
+                stream=stream,
+            )
+            fingerprints.append(fingerprint)
+            return content
+
+        content = self.__flights.do(key, request)
+        if fingerprints:
+            return content, fingerprints[0], False
+        return content, None, True
+
+    def __parse(
+        self,
+        method: str,
+        content: bytes,
+        fingerprint: str | None,
+        *,
+        coalesced: bool,
+    ) -> ET.Element:
+        with self.instrumentation.span(
+            "xml_parse",
+            method=method,
+            response_bytes=len(content),
+            coalesced=coalesced,
+        ):
+            tree = ET.fromstring(content)  # NOQA: S314
 
         messages: list[dict[str, str | None]] = []
         messages_element = tree.find(path="messages")
@@ -154,4 +520,85 @@ class XMLApi:
                 method=method,
             )
 
+        if self.cassette is not None and fingerprint is not None:
+            self.cassette.record(fingerprint, content)
         return tree
+
+    def make_xml_request(
+        self,
+        method: str,
+        payload: XMLPayload,
+        *,
+        stream: bool = False,
+    ) -> ET.Element:
+        """Send API call to Adaptive.
+
+        Payloads given as an iterator of bytes (such as a generator) are
+        written straight into the request body without being joined first.
+        When a cassette is attached, recorded responses are replayed instead
+        of calling Adaptive, and successful responses are recorded.
+
+        Identical export calls (same method, canonical payload, credentials,
+        and URL) made while one is in flight wait for it and share its
+        response instead of calling Adaptive again.
+
+        Args:
+            method: Adaptive XML API name
+            payload: Body of XML API call
+            stream: Stream XML response
+
+        Returns:
+            XML Element of API response
+
+        Raises:
+            InvalidCredentialsError: Exception indicating the credentials are invalid
+            FailedRequestError: Exception indicating the API request was unsuccessful
+            CassetteMissError: No recorded response exists in replay mode
+
+        """
+        content, fingerprint, coalesced = self.__receive(
+            method,
+            payload,
+            stream=stream,
+        )
+        return self.__parse(method, content, fingerprint, coalesced=coalesced)
+
+    def make_xml_request_if_changed(
+        self,
+        method: str,
+        payload: XMLPayload,
+        digest: str | None,
+        *,
+        stream: bool = False,
+    ) -> tuple[ET.Element | None, str]:
+        """Send API call to Adaptive, only parsing a response that changed.
+
+        Adaptive has no conditional requests, so the response is always
+        received, but a response whose SHA-256 digest matches the digest of
+        a previous response is neither parsed nor converted again.
+
+        Args:
+            method: Adaptive XML API name
+            payload: Body of XML API call
+            digest: Digest of the previous response (None to always parse)
+            stream: Stream XML response
+
+        Returns:
+            XML Element of API response (None if unchanged) and its digest
+
+        Raises:
+            InvalidCredentialsError: Exception indicating the credentials are invalid
+            FailedRequestError: Exception indicating the API request was unsuccessful
+            CassetteMissError: No recorded response exists in replay mode
+
+        """
+        content, fingerprint, coalesced = self.__receive(
+            method,
+            payload,
+            stream=stream,
+        )
+        response_digest = hashlib.sha256(content).hexdigest()
+        if response_digest == digest:
+            return None, response_digest
+        tree = self.__parse(method, content, fingerprint, coalesced=coalesced)
+        return tree, response_digest
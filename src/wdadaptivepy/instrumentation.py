@@ -0,0 +1,208 @@
+"""wdadaptivepy instrumentation for Adaptive API calls and parsing."""
+
+import logging
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Span:
+    """Timing and measurements of a single instrumented operation.
+
+    Attributes:
+        name: Name of the instrumented operation
+        attributes: Measurements recorded during the operation
+        start_time_ns: Wall clock time (nanoseconds since epoch) the span started
+        duration: Duration of the operation in seconds
+        error: Exception raised during the operation, if any
+
+    """
+
+    name: str
+    attributes: dict[str, Any] = field(default_factory=dict)
+    start_time_ns: int = 0
+    duration: float = 0.0
+    error: BaseException | None = None
+
+
+SpanHook = Callable[[Span], None]
+
+
+class Instrumentation:
+    """Collect spans for wdadaptivepy operations and forward them to hooks.
+
+    Span names used by wdadaptivepy:
+    - `http`: Adaptive XML API round trip (method, request_bytes,
+      response_bytes, rate_limit_wait)
+    - `cassette`: Lookup of a recorded XML API response (method, hit)
+    - `xml_parse`: Parsing of the XML API response (method, response_bytes,
+      coalesced)
+    - `from_xml`: Conversion of XML into wdadaptivepy models (model, rows)
+    - `to_xml`: Conversion of wdadaptivepy models into XML (model, rows)
+    - `read_csv`: Parsing of exported CSV data (rows, expected_rows,
+      row_count_mismatch, distinct_values)
+    - `unpivot`: Conversion of exported CSV rows into cells (rows, cells)
+    - `refresh`: Incremental refresh of exported data (exported_periods,
+      skipped)
+    - `data_table`: Conversion of exported CSV rows into a DataTable (rows,
+      cells)
+    - `modeled_sheet`: Export of a Modeled Sheet (sheet, response_chars)
+    - `export_many`: Concurrent export of cloned data queries (queries)
+    - `variance`: Export and comparison of two Versions (rows)
+    - `preflight`: Validation of a data query against cached metadata (cells,
+      errors)
+    - `metadata`: Retrieval of metadata by the metadata cache (kind, stale,
+      reused)
+    """
+
+    def __init__(self) -> None:
+        """Initialize Instrumentation."""
+        self.__hooks: list[SpanHook] = []
+        self.__stats: dict[str, dict[str, float | int]] = {}
+        self.__lock = Lock()
+
+    def add_hook(self, hook: SpanHook) -> None:
+        """Call a function with every completed span.
+
+        Exceptions raised by the hook are logged and do not reach the
+        instrumented operation.
+
+        Args:
+            hook: Function receiving each completed Span
+
+        """
+        with self.__lock:
+            self.__hooks = [*self.__hooks, hook]
+
+    def remove_hook(self, hook: SpanHook) -> None:
+        """Stop calling a function with completed spans.
+
+        Args:
+            hook: Function previously added with add_hook
+
+        """
+        with self.__lock:
+            self.__hooks = [x for x in self.__hooks if x is not hook]
+
+    @contextmanager
+    def span(self, name: str, **attributes: Any) -> Iterator[Span]:  # NOQA: ANN401
+        """Measure an operation.
+
+        Measurements can be added to the yielded Span's attributes while the
+        operation runs.
+
+        Args:
+            name: Name of the operation
+            **attributes: Initial measurements of the operation
+
+        Yields:
+            Span of the operation
+
+        """
+        span = Span(name=name, attributes=attributes, start_time_ns=time.time_ns())
+        start = time.perf_counter()
+        try:
+            yield span
+        except BaseException as e:
+            span.error = e
+            raise
+        finally:
+            span.duration = time.perf_counter() - start
+            self.__record(span)
+            for hook in self.__hooks:
+                try:
+                    hook(span)
+                except Exception:  # NOQA: PERF203
+                    logger.exception("Instrumentation hook %r failed", hook)
+
+    def __record(self, span: Span) -> None:
+        with self.__lock:
+            names = [span.name]
+            if isinstance(method := span.attributes.get("method"), str):
+                names.append(f"{span.name}:{method}")
+            if isinstance(model := span.attributes.get("model"), str):
+                names.append(f"{span.name}:{model}")
+            for name in names:
+                stats = self.__stats.setdefault(
+                    name,
+                    {"count": 0, "errors": 0, "seconds": 0.0, "max_seconds": 0.0},
+                )
+                stats["count"] += 1
+                stats["errors"] += span.error is not None
+                stats["seconds"] += span.duration
+                stats["max_seconds"] = max(stats["max_seconds"], span.duration)
+                for key, value in span.attributes.items():
+                    if isinstance(value, int | float):
+                        stats[key] = stats.get(key, 0) + value
+
+    def stats(self) -> dict[str, dict[str, float | int]]:
+        """Summarize all recorded spans.
+
+        Spans are summarized by name, and additionally by name and method
+        (`http:exportAccounts`) or name and model (`from_xml:Account`).
+        Numeric measurements are summed; boolean measurements are counted.
+
+        Returns:
+            Summary of recorded spans
+
+        """
+        with self.__lock:
+            return {name: dict(stats) for name, stats in self.__stats.items()}
+
+    def reset(self) -> None:
+        """Clear all recorded statistics."""
+        with self.__lock:
+            self.__stats = {}
+
+
+class OpenTelemetrySpanEmitter:
+    """Hook forwarding completed spans to OpenTelemetry.
+
+    Requires the optional `opentelemetry-api` package.
+    """
+
+    def __init__(self, tracer: Any = None) -> None:  # NOQA: ANN401
+        """Initialize OpenTelemetrySpanEmitter.
+
+        Args:
+            tracer: OpenTelemetry Tracer (defaults to the global wdadaptivepy tracer)
+
+        Raises:
+            ImportError: opentelemetry-api is not installed
+
+        """
+        try:
+            from opentelemetry import trace  # NOQA: PLC0415
+        except ImportError as e:
+            error_message = "OpenTelemetrySpanEmitter requires opentelemetry-api"
+            raise ImportError(error_message) from e
+        self.__trace = trace
+        self.__tracer = tracer if tracer is not None else trace.get_tracer(__name__)
+
+    def __call__(self, span: Span) -> None:
+        """Emit a completed span.
+
+        Args:
+            span: Completed wdadaptivepy Span
+
+        """
+        attributes = {
+            key: value
+            for key, value in span.attributes.items()
+            if isinstance(value, str | bool | int | float)
+        }
+        otel_span = self.__tracer.start_span(
+            f"wdadaptivepy.{span.name}",
+            start_time=span.start_time_ns,
+            attributes=attributes,
+        )
+        if span.error is not None:
+            otel_span.record_exception(span.error)
+            otel_span.set_status(self.__trace.StatusCode.ERROR)
+        otel_span.end(end_time=span.start_time_ns + int(span.duration * 1e9))
@@ -1,26 +1,41 @@
 """wdadaptivepy main entry."""
 
-from dataclasses import dataclass
-from typing import Any
+from dataclasses import dataclass, fields
+from functools import cached_property
+from threading import Lock
+from typing import TYPE_CHECKING, Any, TypeVar
 
+import httpx
+
+from wdadaptivepy.connectors.xml_api.cassette import Cassette
 from wdadaptivepy.connectors.xml_api.constants import (
+    BASE_URL,
     DEFAULT_CALLER_NAME,
     MINIMUM_VERSION,
 )
-from wdadaptivepy.connectors.xml_api.xml_api import XMLApi
-from wdadaptivepy.services.accounts import AccountService
-from wdadaptivepy.services.attribute_values import AttributeValueService
-from wdadaptivepy.services.attributes import AttributeService
-from wdadaptivepy.services.currencies import CurrencyService
-from wdadaptivepy.services.data import DataService
-from wdadaptivepy.services.dimension_values import DimensionValueService
-from wdadaptivepy.services.dimensions import DimensionService
-from wdadaptivepy.services.groups import GroupService
-from wdadaptivepy.services.levels import LevelService
-from wdadaptivepy.services.permission_sets import PermissionSetService
-from wdadaptivepy.services.time import TimeService
-from wdadaptivepy.services.users import UserService
-from wdadaptivepy.services.versions import VersionService
+from wdadaptivepy.connectors.xml_api.rate_limiter import RateLimiter
+from wdadaptivepy.connectors.xml_api.xml_api import CREDENTIAL_FIELDS, XMLApi
+from wdadaptivepy.instrumentation import Instrumentation
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from wdadaptivepy.services.accounts import AccountService
+    from wdadaptivepy.services.attribute_values import AttributeValueService
+    from wdadaptivepy.services.attributes import AttributeService
+    from wdadaptivepy.services.currencies import CurrencyService
+    from wdadaptivepy.services.data import DataService
+    from wdadaptivepy.services.dimension_values import DimensionValueService
+    from wdadaptivepy.services.dimensions import DimensionService
+    from wdadaptivepy.services.groups import GroupService
+    from wdadaptivepy.services.levels import LevelService
+    from wdadaptivepy.services.permission_sets import PermissionSetService
+    from wdadaptivepy.services.time import TimeService
+    from wdadaptivepy.services.users import UserService
+    from wdadaptivepy.services.versions import VersionService
+
+T = TypeVar("T")
+XML_API_FIELDS = tuple(x.name for x in fields(XMLApi))
 
 
 @dataclass
@@ -34,6 +49,13 @@ class AdaptiveConnection:
         caller_name: Adaptive Caller Name
         locale: Adaptive Locale
         xml_api_version: Adaptive XML API Version
+        base_url: Adaptive XML API URL (without the version)
+        transport: httpx transport used instead of the network
+        cassette: Record and replay store of XML API responses
+        rate_limiter: Limits on the pace and concurrency of XML API calls
+            (share one RateLimiter between connections to share the limits)
+        coalesce_requests: Share one in-flight response between identical
+            concurrent export calls
         accounts (AccountService): wdadaptivepy AccountService
         attributes (AttributeService): wdadaptivepy AttributeService
         attribute_values (AttributeValueService): wdadaptivepy AttributeValueService
@@ -48,6 +70,11 @@ class AdaptiveConnection:
         users (UserService): wdadaptivepy UserService
         versions (VersionService): wdadaptivepy VersionService
 
+    One AdaptiveConnection can be shared between threads: each service is
+    created once, each XML API call uses a snapshot of the credentials taken
+    when it starts, and the pooled HTTP client is thread-safe. Change
+    several credentials together with update_credentials.
+
     """
 
     login: str
@@ -56,6 +83,11 @@ class AdaptiveConnection:
     caller_name: str = DEFAULT_CALLER_NAME
     locale: str | None = None
     xml_api_version: int = MINIMUM_VERSION
+    base_url: str = BASE_URL
+    transport: httpx.BaseTransport | None = None
+    cassette: Cassette | None = None
+    rate_limiter: RateLimiter | None = None
+    coalesce_requests: bool = True
 
     def __post_init__(self) -> None:
         """Clean up AdaptiveConnection instance."""
@@ -66,21 +98,215 @@ class AdaptiveConnection:
             instance_code=self.instance_code,
             caller_name=self.caller_name,
             version=self.xml_api_version,
+            base_url=self.base_url,
+            transport=self.transport,
+            cassette=self.cassette,
+            rate_limiter=self.rate_limiter,
+            coalesce_requests=self.coalesce_requests,
         )
+        self.__services_lock = Lock()
+        self.__services: dict[str, Any] = {}
+
+    def __service(self, name: str, service: "Callable[[XMLApi], T]") -> T:
+        """Create a service once, even when first used by several threads."""
+        with self.__services_lock:
+            if name not in self.__services:
+                self.__services[name] = service(self.__xml_api)
+            return self.__services[name]
+
+    @cached_property
+    def accounts(self) -> "AccountService":
+        """Create the AccountService on first access.
+
+        Returns:
+            wdadaptivepy AccountService
+
+        """
+        from wdadaptivepy.services.accounts import AccountService  # NOQA: PLC0415
+
+        return self.__service("accounts", AccountService)
+
+    @cached_property
+    def attributes(self) -> "AttributeService":
+        """Create the AttributeService on first access.
+
+        Returns:
+            wdadaptivepy AttributeService
+
+        """
+        from wdadaptivepy.services.attributes import AttributeService  # NOQA: PLC0415
+
+        return self.__service("attributes", AttributeService)
+
+    @cached_property
+    def attribute_values(self) -> "AttributeValueService":
+        """Create the AttributeValueService on first access.
+
+        Returns:
+            wdadaptivepy AttributeValueService
+
+        """
+        from wdadaptivepy.services.attribute_values import AttributeValueService  # NOQA: PLC0415
+
+        return self.__service("attribute_values", AttributeValueService)
+
+    @cached_property
+    def currencies(self) -> "CurrencyService":
+        """Create the CurrencyService on first access.
+
+        Returns:
+            wdadaptivepy CurrencyService
+
+        """
+        from wdadaptivepy.services.currencies import CurrencyService  # NOQA: PLC0415
+
+        return self.__service("currencies", CurrencyService)
+
+    @cached_property
+    def data(self) -> "DataService":
+        """Create the DataService on first access.
+
+        Returns:
+            wdadaptivepy DataService
+
+        """
+        from wdadaptivepy.services.data import DataService  # NOQA: PLC0415
+
+        return self.__service("data", DataService)
+
+    @cached_property
+    def dimensions(self) -> "DimensionService":
+        """Create the DimensionService on first access.
+
+        Returns:
+            wdadaptivepy DimensionService
+
+        """
+        from wdadaptivepy.services.dimensions import DimensionService  # NOQA: PLC0415
+
+        return self.__service("dimensions", DimensionService)
+
+    @cached_property
+    def dimension_values(self) -> "DimensionValueService":
+        """Create the DimensionValueService on first access.
+
+        Returns:
+            wdadaptivepy DimensionValueService
+
+        """
+        from wdadaptivepy.services.dimension_values import DimensionValueService  # NOQA: PLC0415
+
+        return self.__service("dimension_values", DimensionValueService)
+
+    @cached_property
+    def groups(self) -> "GroupService":
+        """Create the GroupService on first access.
+
+        Returns:
+            wdadaptivepy GroupService
 
-        self.accounts = AccountService(xml_api=self.__xml_api)
-        self.attributes = AttributeService(xml_api=self.__xml_api)
-        self.attribute_values = AttributeValueService(xml_api=self.__xml_api)
-        self.currencies = CurrencyService(xml_api=self.__xml_api)
-        self.data = DataService(xml_api=self.__xml_api)
-        self.dimensions = DimensionService(xml_api=self.__xml_api)
-        self.dimension_values = DimensionValueService(xml_api=self.__xml_api)
-        self.groups = GroupService(xml_api=self.__xml_api)
-        self.levels = LevelService(xml_api=self.__xml_api)
-        self.permission_sets = PermissionSetService(xml_api=self.__xml_api)
-        self.time = TimeService(xml_api=self.__xml_api)
-        self.users = UserService(xml_api=self.__xml_api)
-        self.versions = VersionService(xml_api=self.__xml_api)
+        """
+        from wdadaptivepy.services.groups import GroupService  # NOQA: PLC0415
+
+        return self.__service("groups", GroupService)
+
+    @cached_property
+    def levels(self) -> "LevelService":
+        """Create the LevelService on first access.
+
+        Returns:
+            wdadaptivepy LevelService
+
+        """
+        from wdadaptivepy.services.levels import LevelService  # NOQA: PLC0415
+
+        return self.__service("levels", LevelService)
+
+    @cached_property
+    def permission_sets(self) -> "PermissionSetService":
+        """Create the PermissionSetService on first access.
+
+        Returns:
+            wdadaptivepy PermissionSetService
+
+        """
+        from wdadaptivepy.services.permission_sets import PermissionSetService  # NOQA: PLC0415
+
+        return self.__service("permission_sets", PermissionSetService)
+
+    @cached_property
+    def time(self) -> "TimeService":
+        """Create the TimeService on first access.
+
+        Returns:
+            wdadaptivepy TimeService
+
+        """
+        from wdadaptivepy.services.time import TimeService  # NOQA: PLC0415
+
+        return self.__service("time", TimeService)
+
+    @cached_property
+    def users(self) -> "UserService":
+        """Create the UserService on first access.
+
+        Returns:
+            wdadaptivepy UserService
+
+        """
+        from wdadaptivepy.services.users import UserService  # NOQA: PLC0415
+
+        return self.__service("users", UserService)
+
+    @cached_property
+    def versions(self) -> "VersionService":
+        """Create the VersionService on first access.
+
+        Returns:
+            wdadaptivepy VersionService
+
+        """
+        from wdadaptivepy.services.versions import VersionService  # NOQA: PLC0415
+
+        return self.__service("versions", VersionService)
+
+    @property
+    def instrumentation(self) -> Instrumentation:
+        """Instrumentation of the connection's API calls and parsing.
+
+        Returns:
+            wdadaptivepy Instrumentation
+
+        """
+        return self.__xml_api.instrumentation
+
+    def stats(self) -> dict[str, dict[str, float | int]]:
+        """Summarize timing, bytes, and rows of the connection's operations.
+
+        Returns:
+            Summary of instrumented operations
+
+        """
+        return self.__xml_api.instrumentation.stats()
+
+    def close(self) -> None:
+        """Close the connection's pooled HTTP connections to Adaptive."""
+        self.__xml_api.close()
+
+    def update_credentials(self, **changes: str | None) -> None:
+        """Change several credentials at once.
+
+        XML API calls never see only some of the changes, and calls already
+        in flight keep the credentials they started with.
+
+        Args:
+            **changes: New login, password, locale, instance_code, or
+                caller_name
+
+        """
+        self.__xml_api.update_credentials(**changes)
+        for name, value in changes.items():
+            super().__setattr__(name, value)
 
     def __setattr__(self, name: str, value: Any, /) -> None:  # NOQA: ANN401
         """Force data to appropriate data type.
@@ -94,8 +320,9 @@ class AdaptiveConnection:
 
         """
         if getattr(self, "_AdaptiveConnection__xml_api", None):
-            if getattr(self.__xml_api, name.removeprefix("xml_api_"), None):
-                setattr(self.__xml_api, name.removeprefix("xml_api_"), value)
-            if getattr(self.__xml_api, name, None):
-                setattr(self.__xml_api, name, value)
+            xml_api_name = name.removeprefix("xml_api_")
+            if xml_api_name in CREDENTIAL_FIELDS:
+                self.__xml_api.update_credentials(**{xml_api_name: value})
+            elif xml_api_name in XML_API_FIELDS:
+                setattr(self.__xml_api, xml_api_name, value)
         super().__setattr__(name, value)
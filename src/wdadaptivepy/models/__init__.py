@@ -1,25 +1,63 @@
-"""wdadaptivepy data models."""
-
-from wdadaptivepy.models.account import Account
-from wdadaptivepy.models.attribute import Attribute
-from wdadaptivepy.models.attribute_value import AttributeValue
-from wdadaptivepy.models.base import MetadataAttribute
-from wdadaptivepy.models.currency import Currency
-from wdadaptivepy.models.dimension import Dimension
-from wdadaptivepy.models.dimension_value import DimensionValue
-from wdadaptivepy.models.group import Group
-from wdadaptivepy.models.level import Level
-from wdadaptivepy.models.list import MetadataList
-from wdadaptivepy.models.permission_set import PermissionSet
-from wdadaptivepy.models.time import Period, Stratum, Time
-from wdadaptivepy.models.user import Subscription, User
-from wdadaptivepy.models.version import Version
+"""wdadaptivepy data models.
+
+Models are imported on first access, so importing one model does not import
+them all.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from wdadaptivepy.models.account import Account
+    from wdadaptivepy.models.attribute import Attribute
+    from wdadaptivepy.models.attribute_value import AttributeValue
+    from wdadaptivepy.models.base import MetadataAttribute
+    from wdadaptivepy.models.calendar import Calendar
+    from wdadaptivepy.models.currency import Currency
+    from wdadaptivepy.models.data_table import DataCells, DataRecord, DataTable
+    from wdadaptivepy.models.dimension import Dimension
+    from wdadaptivepy.models.dimension_value import DimensionValue
+    from wdadaptivepy.models.group import Group
+    from wdadaptivepy.models.level import Level
+    from wdadaptivepy.models.list import MetadataList
+    from wdadaptivepy.models.permission_set import PermissionSet
+    from wdadaptivepy.models.time import Period, Stratum, Time
+    from wdadaptivepy.models.user import Subscription, User
+    from wdadaptivepy.models.version import Version
+
+_EXPORTS = {
+    "Account": "wdadaptivepy.models.account",
+    "Attribute": "wdadaptivepy.models.attribute",
+    "AttributeValue": "wdadaptivepy.models.attribute_value",
+    "Calendar": "wdadaptivepy.models.calendar",
+    "Currency": "wdadaptivepy.models.currency",
+    "DataCells": "wdadaptivepy.models.data_table",
+    "DataRecord": "wdadaptivepy.models.data_table",
+    "DataTable": "wdadaptivepy.models.data_table",
+    "Dimension": "wdadaptivepy.models.dimension",
+    "DimensionValue": "wdadaptivepy.models.dimension_value",
+    "Group": "wdadaptivepy.models.group",
+    "Level": "wdadaptivepy.models.level",
+    "MetadataAttribute": "wdadaptivepy.models.base",
+    "MetadataList": "wdadaptivepy.models.list",
+    "Period": "wdadaptivepy.models.time",
+    "PermissionSet": "wdadaptivepy.models.permission_set",
+    "Stratum": "wdadaptivepy.models.time",
+    "Subscription": "wdadaptivepy.models.user",
+    "Time": "wdadaptivepy.models.time",
+    "User": "wdadaptivepy.models.user",
+    "Version": "wdadaptivepy.models.version",
+}
 
 __all__ = [
     "Account",
     "Attribute",
     "AttributeValue",
+    "Calendar",
     "Currency",
+    "DataCells",
+    "DataRecord",
+    "DataTable",
     "Dimension",
     "DimensionValue",
     "Group",
@@ -34,3 +72,34 @@ __all__ = [
     "User",
     "Version",
 ]
+
+
+def __getattr__(name: str) -> Any:  # NOQA: ANN401
+    """Import an export on first access.
+
+    Args:
+        name: Name of the export
+
+    Returns:
+        Exported class
+
+    Raises:
+        AttributeError: Unknown export
+
+    """
+    if name not in _EXPORTS:
+        error_message = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(error_message)
+    value = getattr(import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the module's attributes, including exports not yet imported.
+
+    Returns:
+        Names of the module's attributes
+
+    """
+    return sorted({*globals(), *__all__})
@@ -1,9 +1,11 @@
 """wdadaptivepy base model for Adaptive's metadata."""
 
+import inspect
 import sys
-from collections.abc import Callable, Sequence
-from dataclasses import InitVar, dataclass, field, fields
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import MISSING, Field, InitVar, dataclass, field, fields
 from datetime import datetime
+from functools import cache, lru_cache
 from json import loads
 from typing import Any, ClassVar
 from xml.etree import ElementTree as ET
@@ -71,6 +73,121 @@ def metadatalist_or_none(
     raise TypeError(error_message)
 
 
+class _LazyField:
+    """Convert a field of a lazily parsed member from its raw XML on first read."""
+
+    def __init__(self, data_field: Field) -> None:
+        self.name = data_field.name
+        self.xml_name = data_field.metadata.get("xml_read")
+        self.validator: Callable[[Any], Any] | None = data_field.metadata.get(
+            "validator",
+        )
+        self.default = data_field.default
+        self.default_factory = data_field.default_factory
+
+    def __get__(self, instance: object, owner: type | None = None) -> Any:  # NOQA: ANN401
+        if instance is None:
+            if self.default is MISSING:
+                raise AttributeError(self.name)
+            return self.default
+        xml_attributes = instance.__dict__.get("_BaseMetadata__xml_attributes")
+        if xml_attributes is not None and self.xml_name in xml_attributes:
+            value = xml_attributes[self.xml_name]
+            if self.validator is not None:
+                value = self.validator(value)
+        elif self.default_factory is not MISSING:
+            value = self.default_factory()
+        elif self.default is not MISSING:
+            value = self.default
+        else:
+            raise AttributeError(self.name)
+        instance.__dict__[self.name] = value
+        return value
+
+
+_LAZY_EAGER_FIELDS = ("id", "code", "name")
+
+
+@cache
+def _lazy_layout(cls: type) -> list[tuple[str, str, Callable[[Any], Any] | None]]:
+    """Install the lazy field descriptors of a model and list its eager fields.
+
+    The descriptors replace the class-level defaults of the fields; members
+    built by the regular constructor store every field on the instance and
+    never reach them.
+    """
+    eager_fields: list[tuple[str, str, Callable[[Any], Any] | None]] = []
+    for data_field in fields(cls):
+        setattr(cls, data_field.name, _LazyField(data_field))
+        xml_name = data_field.metadata.get("xml_read")
+        if data_field.name in _LAZY_EAGER_FIELDS and xml_name:
+            eager_fields.append(
+                (data_field.name, xml_name, data_field.metadata.get("validator")),
+            )
+    return eager_fields
+
+
+def _is_ascii_digits(value: str) -> bool:
+    return value.isascii() and value.isdigit()
+
+
+@lru_cache(maxsize=4096)
+def _parse_date(value: str) -> datetime:
+    """Parse a YYYY-MM-DD date, slicing the common layout instead of strptime."""
+    if (
+        len(value) == 10  # NOQA: PLR2004
+        and value[4] == value[7] == "-"
+        and _is_ascii_digits(value[:4] + value[5:7] + value[8:])
+    ):
+        return datetime(int(value[:4]), int(value[5:7]), int(value[8:]))  # NOQA: DTZ001
+    return datetime.strptime(value, "%Y-%m-%d")  # NOQA: DTZ007
+
+
+@lru_cache(maxsize=4096)
+def _parse_datetime(value: str) -> datetime:
+    """Parse a YYYY-MM-DD HH:MM:SS.f datetime, slicing the common layout."""
+    if (
+        21 <= len(value) <= 26  # NOQA: PLR2004
+        and value[4] == value[7] == "-"
+        and value[10] == " "
+        and value[13] == value[16] == ":"
+        and value[19] == "."
+        and _is_ascii_digits(
+            value[:4]
+            + value[5:7]
+            + value[8:10]
+            + value[11:13]
+            + value[14:16]
+            + value[17:19]
+            + value[20:],
+        )
+    ):
+        return datetime(  # NOQA: DTZ001
+            int(value[:4]),
+            int(value[5:7]),
+            int(value[8:10]),
+            int(value[11:13]),
+            int(value[14:16]),
+            int(value[17:19]),
+            int(value[20:].ljust(6, "0")),
+        )
+    return datetime.strptime(value, "%Y-%m-%d %H:%M:%S.%f")  # NOQA: DTZ007
+
+
+@cache
+def _trusted_layout(
+    cls: type,
+) -> tuple[list[tuple[str, Any, Callable[[], Any] | Any]], tuple[str, ...]]:
+    """Describe the fields and init-only variables set by trusted construction."""
+    data_fields = [(x.name, x.default, x.default_factory) for x in fields(cls)]
+    init_vars = tuple(
+        name
+        for name in inspect.signature(cls.__post_init__).parameters
+        if name != "self"
+    )
+    return data_fields, init_vars
+
+
 def date_or_none(value: str | datetime | None) -> datetime | None:
     """Convert a value to either a Python datetime object (date) or none.
 
@@ -87,7 +204,7 @@ def date_or_none(value: str | datetime | None) -> datetime | None:
     if value is None or isinstance(value, datetime):
         return value
     if isinstance(value, str):
-        return datetime.strptime(value, "%Y-%m-%d")  # NOQA: DTZ007
+        return _parse_date(value)
     error_message = "Unexpected type for date"
     raise TypeError(error_message)
 
@@ -108,7 +225,7 @@ def datetime_or_none(value: str | datetime | None) -> datetime | None:
     if value is None or isinstance(value, datetime):
         return value
     if isinstance(value, str):
-        return datetime.strptime(value, "%Y-%m-%d %H:%M:%S.%f")  # NOQA: DTZ007
+        return _parse_datetime(value)
     error_message = "Unexpected type for datetime"
     raise TypeError(error_message)
 
@@ -482,12 +599,10 @@ class BaseMetadata:
         if name not in self.__dataclass_fields__:
             super().__setattr__(name, value)
             return
-        field_def = self.__dataclass_fields__[name]
-        validator: Callable[[Any], Any] = field_def.metadata.get(
-            "validator",
-            lambda x: x,
-        )
-        new_value = validator(value)
+        validator: Callable[[Any], Any] | None = self.__dataclass_fields__[
+            name
+        ].metadata.get("validator")
+        new_value = validator(value) if validator is not None else value
         if (
             name == "id"
             and getattr(self, "id", None) is not None
@@ -495,24 +610,40 @@ class BaseMetadata:
         ):
             error_message = "Cannot change value of id"
             raise RuntimeError(error_message)
-        super().__setattr__(name, validator(value))
+        super().__setattr__(name, new_value)
+
+    @classmethod
+    def __from_lazy_xml(cls: type[Self], xml_attributes: Mapping[str, str]) -> Self:
+        member = cls.__new__(cls)
+        member.__dict__["_BaseMetadata__xml_attributes"] = xml_attributes
+        for name, xml_name, validator in _lazy_layout(cls):
+            if xml_name in xml_attributes:
+                value = xml_attributes[xml_name]
+                member.__dict__[name] = validator(value) if validator else value
+        member.__post_init__()
+        return member
 
     @classmethod
-    def __parse_xml_to_metadata(  # NOQA: PLR0912 C901
+    def __parse_xml_to_metadata(  # NOQA: PLR0912 PLR0913 C901
         cls: type[Self],
         xml_element: ET.Element,
         xml_tag: str,
         xml_children: dict | None,
         parent: Self | None,
         processed_xml_elements: list[ET.Element],
+        *,
+        lazy: bool = False,
     ) -> MetadataList[Self]:
         processed_xml_elements.append(xml_element)
-        metadata_data = {
-            field_name: xml_element.get(field_def.metadata.get("xml_read"))
-            for field_name, field_def in cls.__dataclass_fields__.items()
-            if field_def.metadata.get("xml_read") in xml_element.attrib
-        }
-        metadata_member = cls(**metadata_data)
+        if lazy:
+            metadata_member = cls.__from_lazy_xml(xml_element.attrib)
+        else:
+            metadata_data = {
+                field_name: xml_element.get(field_def.metadata.get("xml_read"))
+                for field_name, field_def in cls.__dataclass_fields__.items()
+                if field_def.metadata.get("xml_read") in xml_element.attrib
+            }
+            metadata_member = cls(**metadata_data)
         metadata_members = MetadataList[Self]([metadata_member])
         if xml_children:
             for field_name, data_type in xml_children.items():
@@ -531,10 +662,16 @@ class BaseMetadata:
                 )
                 children_members = MetadataList()
                 for child_element in xml_element.findall(f"./{search_xml_tag}"):
-                    children_members.extend(data_type.from_xml(child_element))
+                    children_members.extend(
+                        data_type.from_xml(child_element, lazy=lazy),
+                    )
                 if children_members:
                     setattr(metadata_member, field_name, children_members)
-        if hasattr(metadata_member, "adaptive_attributes"):
+        if lazy and isinstance(metadata_member, BaseAttributtedMetadata):
+            metadata_member._defer_adaptive_attributes(
+                xml_element.findall("./attributes"),
+            )
+        elif hasattr(metadata_member, "adaptive_attributes"):
             adaptive_metadata_instance = MetadataAttribute()
             for metadata_element in xml_element.findall(
                 f"./{adaptive_metadata_instance.__dataclass_fields__['_MetadataAttribute__xml_tags'].default['xml_read_parent_tag']}",
@@ -567,6 +704,7 @@ class BaseMetadata:
                         xml_children=xml_children,
                         parent=metadata_member,
                         processed_xml_elements=processed_xml_elements,
+                        lazy=lazy,
                     )
                 )
 
@@ -576,12 +714,20 @@ class BaseMetadata:
     def from_xml(
         cls: type[Self],
         xml: ET.Element,
+        *,
+        lazy: bool = False,
     ) -> MetadataList[Self]:
         """Create wdadaptivepy object from XML.
 
+        Lazy members convert only their id, code, and name (and link their
+        parent and children) up front. Every other field keeps the raw XML
+        value and is converted the first time it is read, so invalid values
+        raise on access instead of while parsing.
+
         Args:
             cls: Metadata Base Class
             xml: XML to convert to MetadataList of wdadaptivepy metadata objects
+            lazy: Convert fields and Attributes on first access
 
         Returns:
             wdadaptivepy MetadataList
@@ -611,6 +757,7 @@ class BaseMetadata:
                             xml_children=xml_children,
                             parent=None,
                             processed_xml_elements=processed_xml_elements,
+                            lazy=lazy,
                         )
                     )
 
@@ -718,17 +865,23 @@ class BaseMetadata:
     def from_dict(
         cls: type[Self],
         data: dict | Sequence[dict],
+        *,
+        validate: bool = True,
     ) -> MetadataList[Self]:
         """Convert Python Dictionary to MetadataList.
 
         Args:
             cls: BaseMetadata
             data: Python Dictionary
+            validate: Run each field's validator (disable only for records
+                that are already validated, see from_trusted_records)
 
         Returns:
             MetadataList
 
         """
+        if not validate:
+            return cls.from_trusted_records([data] if isinstance(data, dict) else data)
         members = MetadataList[Self]()
         if isinstance(data, Sequence):
             for record in data:
@@ -740,6 +893,53 @@ class BaseMetadata:
 
         return members
 
+    @classmethod
+    def from_trusted_records(
+        cls: type[Self],
+        records: Iterable[Mapping[str, Any]],
+    ) -> MetadataList[Self]:
+        """Create wdadaptivepy objects from records without running validators.
+
+        Values are stored as given, so the records must already hold validated
+        values of the fields' types (such as members previously exported to a
+        snapshot or cache). Missing fields get their defaults, and parent,
+        children, and attributes are set up as by the regular constructor.
+
+        Args:
+            cls: BaseMetadata
+            records: Field values of each member
+
+        Returns:
+            MetadataList
+
+        Raises:
+            TypeError: Unexpected or missing field
+
+        """
+        data_fields, init_vars = _trusted_layout(cls)
+        names = {x[0] for x in data_fields}.union(init_vars)
+        set_value = object.__setattr__
+        members = MetadataList[Self]()
+        for record in records:
+            if not names.issuperset(record):
+                error_message = f"Unexpected fields {set(record) - names}"
+                raise TypeError(error_message)
+            member = cls.__new__(cls)
+            for name, default, default_factory in data_fields:
+                if name in record:
+                    value = record[name]
+                elif default_factory is not MISSING:
+                    value = default_factory()
+                elif default is not MISSING:
+                    value = default
+                else:
+                    error_message = f"Missing field {name}"
+                    raise TypeError(error_message)
+                set_value(member, name, value)
+            member.__post_init__(**{x: record[x] for x in init_vars if x in record})
+            members.append(member)
+        return members
+
 
 @dataclass(eq=False)
 class BaseHierarchicalMetadata:
@@ -1018,10 +1218,28 @@ class BaseAttributtedMetadata:
 
         """
         self.__adaptive_attributes = MetadataList[MetadataAttribute]()
+        self.__attribute_positions: dict[int | None, int] = {}
+        self.__indexed_changes = 0
+        self.__pending_attributes: list[ET.Element] | None = None
         if attributes:
             for attribute in attributes:
                 self.set_adaptive_attribute(attribute)
 
+    def _defer_adaptive_attributes(self, xml_elements: list[ET.Element]) -> None:
+        """Keep the XML of Adaptive Attributes to convert on first access.
+
+        Args:
+            xml_elements: XML elements of the Attributes
+
+        """
+        self.__pending_attributes = xml_elements or None
+
+    def __hydrate_adaptive_attributes(self) -> None:
+        xml_elements, self.__pending_attributes = self.__pending_attributes, None
+        for xml_element in xml_elements or ():
+            for attribute in MetadataAttribute.from_xml(xml_element):
+                self.set_adaptive_attribute(attribute)
+
     @property
     def adaptive_attributes(self) -> MetadataList[MetadataAttribute]:
         """Adaptive Attributes of member.
@@ -1030,8 +1248,38 @@ class BaseAttributtedMetadata:
             MetadataList of Attributes
 
         """
+        if self.__pending_attributes is not None:
+            self.__hydrate_adaptive_attributes()
         return self.__adaptive_attributes
 
+    def __attribute_position(self, attribute_id: int | None) -> int | None:
+        """Find an Attribute's position, reindexing if the list was edited directly.
+
+        The positions are rebuilt only when the list of Attributes changed
+        since they were built.
+        """
+        if self.__indexed_changes != self.__adaptive_attributes.changes:
+            self.__attribute_positions = {}
+            for index, attribute in enumerate(self.__adaptive_attributes):
+                self.__attribute_positions.setdefault(attribute.attribute_id, index)
+            self.__indexed_changes = self.__adaptive_attributes.changes
+        return self.__attribute_positions.get(attribute_id)
+
+    def get_adaptive_attribute(self, attribute_id: int) -> MetadataAttribute | None:
+        """Get the Adaptive Attribute of member with an Attribute ID.
+
+        Args:
+            attribute_id: Adaptive Attribute ID
+
+        Returns:
+            Adaptive Attribute, or None if not set
+
+        """
+        if self.__pending_attributes is not None:
+            self.__hydrate_adaptive_attributes()
+        position = self.__attribute_position(int_or_none(attribute_id))
+        return self.__adaptive_attributes[position] if position is not None else None
+
     def set_adaptive_attribute(self, adaptive_attribute: MetadataAttribute) -> None:
         """Set Adaptive Attribute for member.
 
@@ -1039,12 +1287,18 @@ class BaseAttributtedMetadata:
             adaptive_attribute: Adaptive Attribute
 
         """
-        if adaptive_attribute not in self.__adaptive_attributes:
-            for index, attribute in enumerate(iterable=self.__adaptive_attributes):
-                if attribute.attribute_id == adaptive_attribute.attribute_id:
-                    self.__adaptive_attributes[index] = adaptive_attribute
-                    return
-            self.__adaptive_attributes.append(adaptive_attribute)
+        if self.__pending_attributes is not None:
+            self.__hydrate_adaptive_attributes()
+        position = self.__attribute_position(adaptive_attribute.attribute_id)
+        if position is not None:
+            self.__adaptive_attributes[position] = adaptive_attribute
+            self.__indexed_changes = self.__adaptive_attributes.changes
+            return
+        self.__attribute_positions[adaptive_attribute.attribute_id] = len(
+            self.__adaptive_attributes,
+        )
+        self.__adaptive_attributes.append(adaptive_attribute)
+        self.__indexed_changes = self.__adaptive_attributes.changes
 
     def remove_adaptive_attribute(
         self,
@@ -1060,22 +1314,33 @@ class BaseAttributtedMetadata:
             adaptive_attribute_name: Adaptive Attribute Name
 
         """
+        if self.__pending_attributes is not None:
+            self.__hydrate_adaptive_attributes()
         attribute_id = 0
         if adaptive_attribute is not None:
             attribute_id = adaptive_attribute.attribute_id
         elif adaptive_attribute_id is not None:
             attribute_id = adaptive_attribute_id
-        for index, attribute in enumerate(iterable=self.__adaptive_attributes):
-            if (attribute.attribute_id == attribute_id) or (
-                attribute_id == 0 and attribute.name == adaptive_attribute_name
-            ):
-                self.__adaptive_attributes[index] = MetadataAttribute(
-                    attribute_id=self.__adaptive_attributes[index].attribute_id,
-                    name=self.__adaptive_attributes[index].name,
-                    value_id=0,
-                    value="",
-                )
-                return
+        if attribute_id == 0:
+            position = next(
+                (
+                    index
+                    for index, attribute in enumerate(self.__adaptive_attributes)
+                    if attribute.attribute_id == 0
+                    or attribute.name == adaptive_attribute_name
+                ),
+                None,
+            )
+        else:
+            position = self.__attribute_position(attribute_id)
+        if position is None:
+            return
+        self.__adaptive_attributes[position] = MetadataAttribute(
+            attribute_id=self.__adaptive_attributes[position].attribute_id,
+            name=self.__adaptive_attributes[position].name,
+            value_id=0,
+            value="",
+        )
 
 
 @dataclass(eq=False)
@@ -0,0 +1,277 @@
+"""wdadaptivepy index of Adaptive's Time for fast Period lookups."""
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from datetime import date
+
+from wdadaptivepy.models.time import Period, Stratum, Time
+
+
+class Calendar:
+    """Index Adaptive's Periods by code, date, and Stratum.
+
+    Periods of each Stratum are kept sorted by start date, so the Period
+    containing a date and the Periods between two Periods are found with a
+    binary search instead of a scan. Period ends are exclusive, as exported
+    by Adaptive.
+    """
+
+    def __init__(self, periods: Iterable[Period], strata: Iterable[Stratum]) -> None:
+        """Initialize Calendar.
+
+        Args:
+            periods: Periods of every Stratum
+            strata: Strata of the Periods
+
+        """
+        self.__strata = list(strata)
+        self.__strata_by_code = {x.code: x for x in self.__strata if x.code}
+        self.__periods_by_code: dict[str, Period] = {}
+        by_stratum: dict[int | None, list[Period]] = {}
+        for period in periods:
+            if period.code:
+                self.__periods_by_code.setdefault(period.code, period)
+            if period.start is not None and period.end is not None:
+                by_stratum.setdefault(period.stratum_id, []).append(period)
+        self.__periods: dict[int | None, list[Period]] = {}
+        self.__starts: dict[int | None, list[int]] = {}
+        self.__ends: dict[int | None, list[int]] = {}
+        for stratum_id, stratum_periods in by_stratum.items():
+            stratum_periods.sort(key=lambda x: x.start or 0)
+            self.__periods[stratum_id] = stratum_periods
+            self.__starts[stratum_id] = [
+                x.start.toordinal() for x in stratum_periods if x.start is not None
+            ]
+            self.__ends[stratum_id] = [
+                x.end.toordinal() for x in stratum_periods if x.end is not None
+            ]
+        self.__parents: dict[tuple[str, int | None], Period | None] = {}
+        default = next((x for x in self.__strata if x.is_default), None)
+        if default is None and self.__periods:
+            default_id = max(self.__periods, key=lambda x: len(self.__periods[x]))
+            default = next((x for x in self.__strata if x.id == default_id), None)
+        self.__default_stratum_id = (
+            default.id if default is not None else next(iter(self.__periods), None)
+        )
+
+    @classmethod
+    def from_time(cls, time: Time | Iterable[Time]) -> "Calendar":
+        """Build a Calendar from Adaptive's Time.
+
+        Args:
+            time: wdadaptivepy Time (or all Time returned by TimeService)
+
+        Returns:
+            wdadaptivepy Calendar
+
+        """
+        times = [time] if isinstance(time, Time) else list(time)
+        return cls(
+            periods=(period for x in times for period in x.period),
+            strata=(stratum for x in times for stratum in x.stratum),
+        )
+
+    @property
+    def strata(self) -> list[Stratum]:
+        """Strata of the calendar.
+
+        Returns:
+            wdadaptivepy Strata
+
+        """
+        return list(self.__strata)
+
+    def stratum(self, code: str) -> Stratum | None:
+        """Look up a Stratum by code.
+
+        Args:
+            code: Stratum code
+
+        Returns:
+            wdadaptivepy Stratum, or None if unknown
+
+        """
+        return self.__strata_by_code.get(code)
+
+    def period(self, code: str) -> Period | None:
+        """Look up a Period by code.
+
+        Args:
+            code: Period code
+
+        Returns:
+            wdadaptivepy Period, or None if unknown
+
+        """
+        return self.__periods_by_code.get(code)
+
+    def periods(self, stratum: Stratum | str | None = None) -> list[Period]:
+        """List the Periods of a Stratum in date order.
+
+        Args:
+            stratum: Stratum (or Stratum code) of the Periods (default Stratum
+                if None)
+
+        Returns:
+            wdadaptivepy Periods
+
+        """
+        return list(self.__periods.get(self.__stratum_id(stratum), []))
+
+    def __stratum_id(self, stratum: Stratum | str | None) -> int | None:
+        if stratum is None:
+            return self.__default_stratum_id
+        if isinstance(stratum, str):
+            stratum_obj = self.__strata_by_code.get(stratum)
+            if stratum_obj is None:
+                error_message = f"Unknown Stratum {stratum}"
+                raise KeyError(error_message)
+            return stratum_obj.id
+        return stratum.id
+
+    def __period_obj(self, period: Period | str) -> Period:
+        if isinstance(period, Period):
+            return period
+        period_obj = self.__periods_by_code.get(period)
+        if period_obj is None:
+            error_message = f"Unknown Period {period}"
+            raise KeyError(error_message)
+        return period_obj
+
+    def __find(self, stratum_id: int | None, ordinal: int) -> Period | None:
+        starts = self.__starts.get(stratum_id)
+        if not starts:
+            return None
+        index = bisect_right(starts, ordinal) - 1
+        if index < 0 or ordinal >= self.__ends[stratum_id][index]:
+            return None
+        return self.__periods[stratum_id][index]
+
+    def period_for_date(
+        self,
+        value: date,
+        stratum: Stratum | str | None = None,
+    ) -> Period | None:
+        """Find the Period of a Stratum containing a date.
+
+        Args:
+            value: Date (or datetime) to find
+            stratum: Stratum (or Stratum code) of the Period (default Stratum
+                if None)
+
+        Returns:
+            wdadaptivepy Period, or None if the date is outside the calendar
+
+        """
+        return self.__find(self.__stratum_id(stratum), value.toordinal())
+
+    def periods_for_dates(
+        self,
+        dates: Iterable[date],
+        stratum: Stratum | str | None = None,
+    ) -> list[Period | None]:
+        """Find the Periods of a Stratum containing many dates.
+
+        Repeated dates, common in transaction loads, are only searched once.
+
+        Args:
+            dates: Dates (or datetimes) to find
+            stratum: Stratum (or Stratum code) of the Periods (default Stratum
+                if None)
+
+        Returns:
+            wdadaptivepy Period of each date, or None if outside the calendar
+
+        """
+        stratum_id = self.__stratum_id(stratum)
+        found: dict[int, Period | None] = {}
+        periods: list[Period | None] = []
+        for value in dates:
+            ordinal = value.toordinal()
+            if ordinal not in found:
+                found[ordinal] = self.__find(stratum_id, ordinal)
+            periods.append(found[ordinal])
+        return periods
+
+    def codes_for_dates(
+        self,
+        dates: Iterable[date],
+        stratum: Stratum | str | None = None,
+    ) -> list[str | None]:
+        """Find the codes of the Periods of a Stratum containing many dates.
+
+        Args:
+            dates: Dates (or datetimes) to find
+            stratum: Stratum (or Stratum code) of the Periods (default Stratum
+                if None)
+
+        Returns:
+            Period code of each date, or None if outside the calendar
+
+        """
+        return [
+            period.code if period is not None else None
+            for period in self.periods_for_dates(dates, stratum)
+        ]
+
+    def parent(self, period: Period | str, stratum: Stratum | str) -> Period | None:
+        """Find the Period of a coarser Stratum containing a Period.
+
+        Args:
+            period: Period (or Period code), such as a month
+            stratum: Stratum (or Stratum code) of the parent, such as a year
+
+        Returns:
+            wdadaptivepy Period, or None if no Period contains it
+
+        """
+        period_obj = self.__period_obj(period)
+        stratum_id = self.__stratum_id(stratum)
+        key = (period_obj.code or "", stratum_id)
+        if key not in self.__parents:
+            parent = period_obj
+            while parent is not None and parent.stratum_id != stratum_id:
+                parent = parent.adaptive_parent
+            if parent is None and period_obj.start is not None:
+                parent = self.__find(stratum_id, period_obj.start.toordinal())
+            self.__parents[key] = parent
+        return self.__parents[key]
+
+    def expand_range(
+        self,
+        start: Period | str,
+        end: Period | str,
+        stratum: Stratum | str | None = None,
+    ) -> list[Period]:
+        """List the Periods of a Stratum from a start Period to an end Period.
+
+        Args:
+            start: First Period (or Period code) of the range
+            end: Last Period (or Period code) of the range
+            stratum: Stratum (or Stratum code) of the Periods (the start
+                Period's Stratum if None)
+
+        Returns:
+            wdadaptivepy Periods in date order
+
+        """
+        start_obj = self.__period_obj(start)
+        end_obj = self.__period_obj(end)
+        stratum_id = (
+            self.__stratum_id(stratum) if stratum is not None else start_obj.stratum_id
+        )
+        if start_obj.start is None or end_obj.start is None:
+            return []
+        starts = self.__starts.get(stratum_id, [])
+        first = bisect_left(starts, start_obj.start.toordinal())
+        last = bisect_right(starts, end_obj.start.toordinal())
+        return self.__periods[stratum_id][first:last] if starts else []
+
+    def __len__(self) -> int:
+        """Count the Periods of the calendar.
+
+        Returns:
+            Number of Periods
+
+        """
+        return len(self.__periods_by_code)
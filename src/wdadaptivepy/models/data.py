@@ -712,3 +712,29 @@ class ExportDataFormat:
             format_element.attrib["displayNameEnabled"] = display_name_enabled
 
         return format_element
+
+
+@dataclass
+class QueryEstimate:
+    """Estimated size of a data query's export.
+
+    Attributes:
+        accounts: Number of exported Accounts
+        levels: Number of exported Levels
+        dimension_values: Number of combinations of returned Dimension Values
+        periods: Number of Periods in the time span
+        max_rows: Rows when every combination has data
+        max_cells: Cells when every combination has data
+        rows: Expected rows
+        cells: Expected cells
+
+    """
+
+    accounts: int
+    levels: int
+    dimension_values: int
+    periods: int
+    max_rows: int
+    max_cells: int
+    rows: int
+    cells: int
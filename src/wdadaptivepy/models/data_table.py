@@ -0,0 +1,590 @@
+"""wdadaptivepy columnar table of exported Adaptive data."""
+
+from array import array
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from itertools import chain, repeat
+from math import isnan, nan
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+BLANK_MARKERS = frozenset(("", "B"))
+INVALID_MARKER = "I"
+
+
+def _parse_column(values: Sequence[str]) -> tuple[Any, Any, Any]:
+    """Convert a column of CSV amounts into float64 amounts and masks.
+
+    Blank and invalid cells are NaN in the amounts and flagged in their mask.
+    Masks are NumPy boolean arrays when NumPy is installed, bytearrays of 0
+    and 1 otherwise.
+    """
+    if np is not None:
+        text = np.asarray(values, dtype=np.str_)
+        blanks = (text == "") | (text == "B")
+        invalid = text == INVALID_MARKER
+        if blanks.any() or invalid.any():
+            text = np.where(blanks | invalid, "nan", text)
+        return text.astype(np.float64), blanks, invalid
+    try:
+        amounts = array("d", map(float, values))
+        return amounts, bytearray(len(values)), bytearray(len(values))
+    except ValueError:
+        pass
+    amounts = array("d", repeat(nan, len(values)))
+    blanks = bytearray(len(values))
+    invalid = bytearray(len(values))
+    for index, value in enumerate(values):
+        if value in BLANK_MARKERS:
+            blanks[index] = 1
+        elif value == INVALID_MARKER:
+            invalid[index] = 1
+        else:
+            amounts[index] = float(value)
+    return amounts, blanks, invalid
+
+
+def _take(column: Any, indexes: Sequence[int]) -> Any:  # NOQA: ANN401
+    """Gather amounts by position, using NaN for a position of -1."""
+    if np is not None:
+        return np.append(np.asarray(column, dtype=np.float64), nan)[
+            np.asarray(indexes, dtype=np.int64)
+        ]
+    return array("d", (column[index] if index >= 0 else nan for index in indexes))
+
+
+def _concat(columns: Sequence[Any], lengths: Sequence[int]) -> Any:  # NOQA: ANN401
+    """Concatenate amount columns, using NaN for a missing (None) column."""
+    if np is not None:
+        return np.concatenate(
+            [
+                np.full(length, nan)
+                if column is None
+                else np.asarray(column, dtype=np.float64)
+                for column, length in zip(columns, lengths, strict=True)
+            ],
+        )
+    result = array("d")
+    for column, length in zip(columns, lengths, strict=True):
+        result.extend(repeat(nan, length) if column is None else column)
+    return result
+
+
+def _base_rows(table: "DataTable") -> list[tuple[str, ...]]:
+    """Get the base values of each row of a table."""
+    if not table.base_values:
+        return [() for _ in range(table.row_count)]
+    return list(zip(*table.base_values, strict=True))
+
+
+class DataRecord(Mapping[str, str | float | int | None]):
+    """Read-only mapping of a single exported cell.
+
+    Every cell of a source row shares the same tuple of base values (Account,
+    Level, and Dimension codes and names) and every record of an export
+    shares the same column lookup, so a record only stores its own Period
+    Code and Amount.
+    """
+
+    __slots__ = ("__amount", "__columns", "__period", "__values")
+
+    def __init__(
+        self,
+        columns: Mapping[str, int],
+        values: tuple[str, ...],
+        period: str,
+        amount: float | None,
+    ) -> None:
+        """Initialize DataRecord.
+
+        Args:
+            columns: Position of each base column within values
+            values: Base values of the source row
+            period: Period Code of the cell
+            amount: Amount of the cell
+
+        """
+        self.__columns = columns
+        self.__values = values
+        self.__period = period
+        self.__amount = amount
+
+    def __getitem__(self, key: str) -> str | float | int | None:
+        """Get the value of a column.
+
+        Args:
+            key: Column name
+
+        Returns:
+            Column value
+
+        Raises:
+            KeyError: Unknown column
+
+        """
+        if key == "Period Code":
+            return self.__period
+        if key == "Amount":
+            return self.__amount
+        return self.__values[self.__columns[key]]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the column names.
+
+        Yields:
+            Column names
+
+        """
+        yield from self.__columns
+        yield "Period Code"
+        yield "Amount"
+
+    def __len__(self) -> int:
+        """Count the columns.
+
+        Returns:
+            Number of columns
+
+        """
+        return len(self.__columns) + 2
+
+    def to_dict(self) -> dict[str, str | float | int | None]:
+        """Copy the record into a modifiable dictionary.
+
+        Returns:
+            Values of each column, by column name
+
+        """
+        return dict(self)
+
+    def __repr__(self) -> str:
+        """Represent the record like a dictionary.
+
+        Returns:
+            Representation of the record
+
+        """
+        return repr(dict(self))
+
+
+@dataclass(eq=False)
+class DataCells:
+    """Exported data in long format, one entry per cell.
+
+    Cells are ordered by row, then by period, matching the order of
+    DataQuery.get_data. Use the indexes to look up base values and period
+    codes in the DataTable the cells came from.
+
+    Attributes:
+        row_index: Row of the DataTable of each cell
+        period_index: Period of the DataTable of each cell
+        amounts: Amount of each cell (NaN for blank and invalid cells)
+        blanks: Mask of blank cells
+        invalid: Mask of invalid cells
+
+    """
+
+    row_index: Any
+    period_index: Any
+    amounts: Any
+    blanks: Any
+    invalid: Any
+
+    def __len__(self) -> int:
+        """Count the cells.
+
+        Returns:
+            Number of cells
+
+        """
+        return len(self.amounts)
+
+
+@dataclass(eq=False)
+class DataTable:
+    """Columnar exportData result.
+
+    Base columns (Account, Level, and Dimension codes and names) are kept as
+    columns of strings. Each period is kept as a float64 array (a NumPy array
+    when NumPy is installed, an `array.array` otherwise) with masks flagging
+    blank and invalid cells.
+
+    Attributes:
+        base_columns: Names of the base columns
+        base_values: Values of each base column
+        periods: Period codes of the period columns
+        amounts: Amounts of each period column
+        blanks: Blank cell mask of each period column
+        invalid: Invalid cell mask of each period column
+
+    """
+
+    base_columns: list[str]
+    base_values: list[Sequence[str]]
+    periods: list[str]
+    amounts: list[Any]
+    blanks: list[Any]
+    invalid: list[Any]
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Sequence[Sequence[str]],
+        base_columns: Sequence[tuple[int, str]],
+        period_columns: Sequence[tuple[int, str]],
+    ) -> "DataTable":
+        """Convert CSV rows into a DataTable.
+
+        Args:
+            rows: CSV rows (without the header)
+            base_columns: Index and name of each base column
+            period_columns: Index and period code of each period column
+
+        Returns:
+            DataTable
+
+        """
+        width = len(base_columns) + len(period_columns)
+        columns: list[Sequence[str]] = (
+            list(zip(*rows, strict=True)) if rows else [() for _ in range(width)]
+        )
+        amounts: list[Any] = []
+        blanks: list[Any] = []
+        invalid: list[Any] = []
+        for index, _ in period_columns:
+            column_amounts, column_blanks, column_invalid = _parse_column(
+                columns[index],
+            )
+            amounts.append(column_amounts)
+            blanks.append(column_blanks)
+            invalid.append(column_invalid)
+        return cls(
+            base_columns=[name for _, name in base_columns],
+            base_values=[columns[index] for index, _ in base_columns],
+            periods=[name for _, name in period_columns],
+            amounts=amounts,
+            blanks=blanks,
+            invalid=invalid,
+        )
+
+    @classmethod
+    def from_columns(
+        cls,
+        base_columns: Sequence[str],
+        base_values: Sequence[Sequence[str]],
+        periods: Sequence[str],
+        amounts: Sequence[Sequence[float]],
+    ) -> "DataTable":
+        """Build a DataTable from computed columns.
+
+        NaN amounts are flagged as blank; no cell is flagged as invalid.
+
+        Args:
+            base_columns: Names of the base columns
+            base_values: Values of each base column
+            periods: Period codes of the period columns
+            amounts: Amounts of each period column
+
+        Returns:
+            DataTable
+
+        """
+        period_amounts: list[Any] = []
+        blanks: list[Any] = []
+        invalid: list[Any] = []
+        for column in amounts:
+            if np is not None:
+                values = np.asarray(column, dtype=np.float64)
+                period_amounts.append(values)
+                blanks.append(np.isnan(values))
+                invalid.append(np.zeros(len(values), dtype=np.bool_))
+            else:
+                values = column if isinstance(column, array) else array("d", column)
+                period_amounts.append(values)
+                blanks.append(bytearray(isnan(value) for value in values))
+                invalid.append(bytearray(len(values)))
+        return cls(
+            base_columns=list(base_columns),
+            base_values=list(base_values),
+            periods=list(periods),
+            amounts=period_amounts,
+            blanks=blanks,
+            invalid=invalid,
+        )
+
+    def row_index(self) -> dict[tuple[str, ...], int]:
+        """Map the base values of each row to the row's position.
+
+        Returns:
+            Position of each row, by base values
+
+        Raises:
+            ValueError: Several rows have the same base values
+
+        """
+        rows: dict[tuple[str, ...], int] = {}
+        for position, row in enumerate(_base_rows(self)):
+            if rows.setdefault(row, position) != position:
+                error_message = f"Expected unique base values, found {row} twice"
+                raise ValueError(error_message)
+        return rows
+
+    def merge_periods(self, other: "DataTable", periods: Sequence[str]) -> "DataTable":
+        """Replace the amounts of some periods with those of newer data.
+
+        Rows are matched on their base values. Rows only found in one of
+        the tables are blank in the periods taken from the other table.
+        Invalid cells are kept as blank cells.
+
+        Args:
+            other: Newer data with the same base columns
+            periods: Period codes to take from the newer data
+
+        Returns:
+            Merged data
+
+        Raises:
+            ValueError: The tables have different base columns, or several
+                rows of a table have the same base values
+
+        """
+        if other.base_columns != self.base_columns:
+            error_message = "Expected data with the same base columns"
+            raise ValueError(error_message)
+        rows = self.row_index()
+        own_count = len(rows)
+        other_rows = other.row_index()
+        for row in other_rows:
+            rows.setdefault(row, len(rows))
+        other_indexes = [-1] * len(rows)
+        for row, index in other_rows.items():
+            other_indexes[rows[row]] = index
+        own_indexes = [*range(own_count), *repeat(-1, len(rows) - own_count)]
+
+        replaced = set(periods)
+        merged_periods = list(self.periods)
+        merged_periods.extend(x for x in other.periods if x not in self.periods)
+        amounts = []
+        for period in merged_periods:
+            if period in other.periods and (
+                period in replaced or period not in self.periods
+            ):
+                column = other.amounts[other.periods.index(period)]
+                amounts.append(_take(column, other_indexes))
+            else:
+                column = self.amounts[self.periods.index(period)]
+                amounts.append(_take(column, own_indexes))
+        return DataTable.from_columns(
+            self.base_columns,
+            [list(x) for x in zip(*rows, strict=True)]
+            if rows
+            else [[] for _ in self.base_columns],
+            merged_periods,
+            amounts,
+        )
+
+    def select_periods(self, periods: Sequence[str]) -> "DataTable":
+        """Keep only some period columns.
+
+        Args:
+            periods: Period codes to keep, in order
+
+        Returns:
+            Data of the periods
+
+        Raises:
+            KeyError: Unknown period
+
+        """
+        positions = []
+        for period in periods:
+            if period not in self.periods:
+                raise KeyError(period)
+            positions.append(self.periods.index(period))
+        return DataTable(
+            base_columns=list(self.base_columns),
+            base_values=list(self.base_values),
+            periods=list(periods),
+            amounts=[self.amounts[x] for x in positions],
+            blanks=[self.blanks[x] for x in positions],
+            invalid=[self.invalid[x] for x in positions],
+        )
+
+    @classmethod
+    def concat(
+        cls,
+        tables: Sequence["DataTable"],
+        label_columns: Sequence[str] = (),
+        labels: Sequence[Sequence[str]] = (),
+    ) -> "DataTable":
+        """Stack tables with the same base columns, labelling each table's rows.
+
+        Periods are the union of every table's periods, in order of first
+        appearance; rows are blank in periods missing from their table.
+
+        Args:
+            tables: Tables to stack
+            label_columns: Names of the base columns added in front
+            labels: Values of the label columns for each table
+
+        Returns:
+            Stacked data
+
+        Raises:
+            ValueError: The tables have different base columns or missing labels
+
+        """
+        if labels and len(labels) != len(tables):
+            error_message = "Expected one set of labels per table"
+            raise ValueError(error_message)
+        if any(len(table_labels) != len(label_columns) for table_labels in labels):
+            error_message = "Expected one label per label column"
+            raise ValueError(error_message)
+        base_columns = tables[0].base_columns if tables else []
+        if any(table.base_columns != base_columns for table in tables):
+            error_message = "Expected data with the same base columns"
+            raise ValueError(error_message)
+        periods: list[str] = []
+        for table in tables:
+            periods.extend(x for x in table.periods if x not in periods)
+
+        base_values: list[list[str]] = [
+            [] for _ in range(len(label_columns) + len(base_columns))
+        ]
+        for index, table in enumerate(tables):
+            rows = table.row_count
+            for position, label in enumerate(labels[index] if labels else ()):
+                base_values[position].extend(repeat(label, rows))
+            for position, values in enumerate(table.base_values):
+                base_values[len(label_columns) + position].extend(values)
+        amounts = [
+            _concat(
+                [
+                    table.column(period) if period in table.periods else None
+                    for table in tables
+                ],
+                [table.row_count for table in tables],
+            )
+            for period in periods
+        ]
+        return cls.from_columns(
+            [*label_columns, *base_columns],
+            base_values,
+            periods,
+            amounts,
+        )
+
+    @property
+    def row_count(self) -> int:
+        """Number of exported rows.
+
+        Returns:
+            Number of rows
+
+        """
+        if self.base_values:
+            return len(self.base_values[0])
+        if self.amounts:
+            return len(self.amounts[0])
+        return 0
+
+    @property
+    def cell_count(self) -> int:
+        """Number of cells (rows multiplied by periods).
+
+        Returns:
+            Number of cells
+
+        """
+        return self.row_count * len(self.periods)
+
+    def __len__(self) -> int:
+        """Count the exported rows.
+
+        Returns:
+            Number of rows
+
+        """
+        return self.row_count
+
+    def column(self, name: str) -> Any:  # NOQA: ANN401
+        """Get a base column's values or a period column's amounts.
+
+        Args:
+            name: Base column name or period code
+
+        Returns:
+            Column values
+
+        Raises:
+            KeyError: Unknown column
+
+        """
+        if name in self.base_columns:
+            return self.base_values[self.base_columns.index(name)]
+        if name in self.periods:
+            return self.amounts[self.periods.index(name)]
+        raise KeyError(name)
+
+    def cells(self) -> DataCells:
+        """Unpivot the table into cells using repeated index arrays.
+
+        Returns:
+            Cells of the table
+
+        """
+        rows = self.row_count
+        periods = len(self.periods)
+        if np is not None:
+            if periods == 0:
+                empty = np.empty(0, dtype=np.float64)
+                empty_index = np.empty(0, dtype=np.int64)
+                empty_mask = np.empty(0, dtype=np.bool_)
+                return DataCells(
+                    empty_index, empty_index, empty, empty_mask, empty_mask
+                )
+            return DataCells(
+                row_index=np.repeat(np.arange(rows, dtype=np.int64), periods),
+                period_index=np.tile(np.arange(periods, dtype=np.int64), rows),
+                amounts=np.column_stack(self.amounts).ravel(),
+                blanks=np.column_stack(self.blanks).ravel(),
+                invalid=np.column_stack(self.invalid).ravel(),
+            )
+        return DataCells(
+            row_index=array(
+                "q",
+                chain.from_iterable(repeat(row, periods) for row in range(rows)),
+            ),
+            period_index=array("q", range(periods)) * rows,
+            amounts=array("d", chain.from_iterable(zip(*self.amounts, strict=True))),
+            blanks=bytearray(chain.from_iterable(zip(*self.blanks, strict=True))),
+            invalid=bytearray(chain.from_iterable(zip(*self.invalid, strict=True))),
+        )
+
+    def to_records(self) -> list[DataRecord]:
+        """Convert the table into one read-only mapping per cell.
+
+        Blank and invalid cells have an Amount of None. Amounts are stored
+        as floats, so every Amount is a float, unlike DataQuery.get_data
+        which returns integer amounts as ints.
+
+        Returns:
+            Rows of data in long format
+
+        """
+        records: list[DataRecord] = []
+        append = records.append
+        columns = {name: position for position, name in enumerate(self.base_columns)}
+        period_columns = list(
+            zip(self.periods, self.amounts, self.blanks, self.invalid, strict=True),
+        )
+        for row in range(self.row_count):
+            base_values = tuple([values[row] for values in self.base_values])
+            for period, amounts, blanks, invalid in period_columns:
+                amount = None if blanks[row] or invalid[row] else float(amounts[row])
+                append(DataRecord(columns, base_values, period, amount))
+        return records
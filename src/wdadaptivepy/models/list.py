@@ -4,7 +4,7 @@ import csv
 import operator
 import re
 import sys
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from dataclasses import asdict
 from os import PathLike
 from pathlib import Path
@@ -17,6 +17,7 @@ else:
 
 if TYPE_CHECKING:
     from datetime import datetime
+    from typing import SupportsIndex
 
 
 class IsDataclass(Protocol):
@@ -145,6 +146,134 @@ class MetadataList(list[T]):
         """
         return self.__class__([item for item in self if self._matches(item, **kwargs)])
 
+    @property
+    def changes(self) -> int:
+        """Number of times members were added, removed, replaced, or reordered.
+
+        Returns:
+            Number of changes
+
+        """
+        return self.__dict__.get("_MetadataList__changes", 0)
+
+    def __changed(self) -> None:
+        self.__dict__["_MetadataList__changes"] = self.changes + 1
+        self.clear_attribute_index()
+
+    def __attribute_signature(self) -> tuple[int, tuple[int, ...]]:
+        return self.changes, tuple(
+            getattr(getattr(item, "adaptive_attributes", None), "changes", 0)
+            for item in self
+        )
+
+    def __attribute_index(self) -> dict[Any, dict[Any, list[T]]]:
+        indexed: tuple[tuple[int, tuple[int, ...]], dict[Any, dict[Any, list[T]]]]
+        indexed = self.__dict__.get("_MetadataList__members_by_attribute")
+        if indexed is not None and indexed[0] == self.__attribute_signature():
+            return indexed[1]
+        index: dict[Any, dict[Any, list[T]]] = {}
+        for item in self:
+            for attribute in getattr(item, "adaptive_attributes", None) or ():
+                values = index.setdefault(attribute.attribute_id, {None: []})
+                values[None].append(item)
+                values.setdefault(attribute.value_id, []).append(item)
+        signature = self.__attribute_signature()
+        self.__dict__["_MetadataList__members_by_attribute"] = (signature, index)
+        return index
+
+    def clear_attribute_index(self) -> None:
+        """Forget the index of members by Adaptive Attribute.
+
+        The index is rebuilt on next use whenever members are added, removed,
+        or reordered, or Adaptive Attributes of members are set or removed;
+        clear it after editing an Adaptive Attribute of a member in place.
+        """
+        self.__dict__.pop("_MetadataList__members_by_attribute", None)
+
+    def __setitem__(self, index: Any, value: Any) -> None:  # NOQA: ANN401
+        """Set members, counting the change."""
+        self.__changed()
+        super().__setitem__(index, value)
+
+    def __delitem__(self, index: Any) -> None:  # NOQA: ANN401
+        """Delete members, counting the change."""
+        self.__changed()
+        super().__delitem__(index)
+
+    def __iadd__(self, values: Iterable[T]) -> Self:  # pyright: ignore[reportIncompatibleMethodOverride]
+        """Add members, counting the change."""
+        self.__changed()
+        return super().__iadd__(values)
+
+    def __imul__(self, count: "SupportsIndex") -> Self:
+        """Repeat members, counting the change."""
+        self.__changed()
+        return super().__imul__(count)
+
+    def append(self, value: T) -> None:
+        """Add a member, counting the change."""
+        self.__changed()
+        super().append(value)
+
+    def extend(self, values: Iterable[T]) -> None:
+        """Add members, counting the change."""
+        self.__changed()
+        super().extend(values)
+
+    def insert(self, index: "SupportsIndex", value: T) -> None:
+        """Insert a member, counting the change."""
+        self.__changed()
+        super().insert(index, value)
+
+    def pop(self, index: "SupportsIndex" = -1) -> T:
+        """Remove a member, counting the change."""
+        self.__changed()
+        return super().pop(index)
+
+    def remove(self, value: T) -> None:
+        """Remove a member, counting the change."""
+        self.__changed()
+        super().remove(value)
+
+    def clear(self) -> None:
+        """Remove all members, counting the change."""
+        self.__changed()
+        super().clear()
+
+    def sort(
+        self, *, key: Callable[[T], Any] | None = None, reverse: bool = False
+    ) -> None:
+        """Sort the members, counting the change."""
+        self.__changed()
+        super().sort(key=key, reverse=reverse)  # pyright: ignore[reportCallIssue]
+
+    def reverse(self) -> None:
+        """Reverse the order of the members, counting the change."""
+        self.__changed()
+        super().reverse()
+
+    def get_members_by_attribute(
+        self,
+        attribute_id: int,
+        value_id: int | str | None = None,
+    ) -> Self:
+        """Get members carrying an Adaptive Attribute (or Attribute Value).
+
+        Members are looked up in an index from Attribute ID and Attribute
+        Value ID to members, built on first use.
+
+        Args:
+            attribute_id: Adaptive Attribute ID
+            value_id: Adaptive Attribute Value ID (any value if None)
+
+        Returns:
+            MetadataList
+
+        """
+        values = self.__attribute_index().get(int(attribute_id), {})
+        key = str(value_id) if value_id is not None else None
+        return self.__class__(values.get(key, []))
+
     def _matches(self, item: T, **kwargs: Any) -> bool:  # NOQA: ANN401
         for attr, value in kwargs.items():
             if "__" in attr:
@@ -0,0 +1,157 @@
+"""wdadaptivepy type conversion of exported Modeled Sheet data."""
+
+import re
+from collections.abc import Callable, Iterable, Sequence
+from datetime import datetime
+from typing import Literal
+
+ModeledColumnType = Literal["text", "number", "date", "boolean"]
+ModeledValue = str | int | float | bool | datetime | None
+
+DATE_FORMATS = ("%m/%d/%Y", "%Y-%m-%d", "%m/%d/%Y %H:%M:%S", "%Y-%m-%d %H:%M:%S")
+BOOLEAN_VALUES = {"true": True, "false": False}
+NUMBER_PATTERN = re.compile(
+    r"-?(?:0|[1-9]\d{0,2}(?:,\d{3})+|[1-9]\d*)(?P<fraction>\.\d+)?",
+)
+
+
+def to_number(value: str) -> int | float:
+    """Convert text to an int, or a float if it has a decimal part.
+
+    Only text that reads back as the same number is converted: leading zeros
+    (such as "00123") and commas not grouping thousands (such as "1,5") are
+    rejected, so codes and decimal commas stay text.
+
+    Args:
+        value: Text of a number
+
+    Returns:
+        Number
+
+    Raises:
+        ValueError: Unexpected number format
+
+    """
+    match = NUMBER_PATTERN.fullmatch(value)
+    if match is None:
+        error_message = f"Unexpected number: {value}"
+        raise ValueError(error_message)
+    number = value.replace(",", "")
+    if match.group("fraction") is None:
+        return int(number)
+    return float(number)
+
+
+def to_date(value: str) -> datetime:
+    """Convert text in any of the DATE_FORMATS to a datetime.
+
+    Args:
+        value: Text of a date
+
+    Returns:
+        Date
+
+    Raises:
+        ValueError: Unexpected date format
+
+    """
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, date_format)  # NOQA: DTZ007
+        except ValueError:  # NOQA: PERF203
+            continue
+    error_message = f"Unexpected date format: {value}"
+    raise ValueError(error_message)
+
+
+def to_boolean(value: str) -> bool:
+    """Convert "true" or "false" (in any case) to a boolean.
+
+    Args:
+        value: Text of a boolean
+
+    Returns:
+        Boolean
+
+    Raises:
+        ValueError: Unexpected boolean value
+
+    """
+    try:
+        return BOOLEAN_VALUES[value.lower()]
+    except KeyError:
+        error_message = f"Unexpected boolean value: {value}"
+        raise ValueError(error_message) from None
+
+
+CONVERTERS: dict[ModeledColumnType, Callable[[str], ModeledValue]] = {
+    "number": to_number,
+    "date": to_date,
+    "boolean": to_boolean,
+}
+
+
+def infer_column_type(values: Iterable[str]) -> ModeledColumnType:
+    """Detect the type of a column from a sample of its values.
+
+    Blank values are ignored. A column is a number, date, or boolean column
+    when every other sampled value converts to that type.
+
+    Args:
+        values: Sampled values of the column
+
+    Returns:
+        Column type
+
+    """
+    present = [value for value in values if value != ""]
+    if not present:
+        return "text"
+    for column_type in ("boolean", "number", "date"):
+        converter = CONVERTERS[column_type]
+        try:
+            for value in present:
+                converter(value)
+        except ValueError:
+            continue
+        return column_type
+    return "text"
+
+
+def make_row_converter(
+    column_types: Sequence[ModeledColumnType],
+) -> Callable[[Sequence[str]], list[ModeledValue]]:
+    """Create a function converting the values of a CSV row to their column types.
+
+    Blank values of number, date, and boolean columns become None. Values
+    that do not match their column's type are kept as text.
+
+    Args:
+        column_types: Type of each column of the row
+
+    Returns:
+        Row converter
+
+    """
+    converters = [CONVERTERS.get(column_type) for column_type in column_types]
+
+    def convert_value(
+        converter: Callable[[str], ModeledValue] | None,
+        value: str,
+    ) -> ModeledValue:
+        if converter is None:
+            return value
+        if value == "":
+            return None
+        try:
+            return converter(value)
+        except ValueError:
+            return value
+
+    def convert_row(row: Sequence[str]) -> list[ModeledValue]:
+        return [
+            convert_value(converter, value)
+            for converter, value in zip(converters, row, strict=True)
+        ]
+
+    return convert_row
@@ -1,18 +1,42 @@
-"""wdadaptivepy service for Adaptive's APIs."""
-
-from wdadaptivepy.services.accounts import AccountService
-from wdadaptivepy.services.attribute_values import AttributeValueService
-from wdadaptivepy.services.attributes import AttributeService
-from wdadaptivepy.services.currencies import CurrencyService
-from wdadaptivepy.services.data import DataService
-from wdadaptivepy.services.dimension_values import DimensionValueService
-from wdadaptivepy.services.dimensions import DimensionService
-from wdadaptivepy.services.groups import GroupService
-from wdadaptivepy.services.levels import LevelService
-from wdadaptivepy.services.permission_sets import PermissionSetService
-from wdadaptivepy.services.time import TimeService
-from wdadaptivepy.services.users import UserService
-from wdadaptivepy.services.versions import VersionService
+"""wdadaptivepy service for Adaptive's APIs.
+
+Services are imported on first access, so importing one service does not
+import them all.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from wdadaptivepy.services.accounts import AccountService
+    from wdadaptivepy.services.attribute_values import AttributeValueService
+    from wdadaptivepy.services.attributes import AttributeService
+    from wdadaptivepy.services.currencies import CurrencyService
+    from wdadaptivepy.services.data import DataService
+    from wdadaptivepy.services.dimension_values import DimensionValueService
+    from wdadaptivepy.services.dimensions import DimensionService
+    from wdadaptivepy.services.groups import GroupService
+    from wdadaptivepy.services.levels import LevelService
+    from wdadaptivepy.services.permission_sets import PermissionSetService
+    from wdadaptivepy.services.time import TimeService
+    from wdadaptivepy.services.users import UserService
+    from wdadaptivepy.services.versions import VersionService
+
+_EXPORTS = {
+    "AccountService": "wdadaptivepy.services.accounts",
+    "AttributeService": "wdadaptivepy.services.attributes",
+    "AttributeValueService": "wdadaptivepy.services.attribute_values",
+    "CurrencyService": "wdadaptivepy.services.currencies",
+    "DataService": "wdadaptivepy.services.data",
+    "DimensionService": "wdadaptivepy.services.dimensions",
+    "DimensionValueService": "wdadaptivepy.services.dimension_values",
+    "GroupService": "wdadaptivepy.services.groups",
+    "LevelService": "wdadaptivepy.services.levels",
+    "PermissionSetService": "wdadaptivepy.services.permission_sets",
+    "TimeService": "wdadaptivepy.services.time",
+    "UserService": "wdadaptivepy.services.users",
+    "VersionService": "wdadaptivepy.services.versions",
+}
 
 __all__ = [
     "AccountService",
@@ -29,3 +53,34 @@ __all__ = [
     "UserService",
     "VersionService",
 ]
+
+
+def __getattr__(name: str) -> Any:  # NOQA: ANN401
+    """Import an export on first access.
+
+    Args:
+        name: Name of the export
+
+    Returns:
+        Exported class
+
+    Raises:
+        AttributeError: Unknown export
+
+    """
+    if name not in _EXPORTS:
+        error_message = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(error_message)
+    value = getattr(import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the module's attributes, including exports not yet imported.
+
+    Returns:
+        Names of the module's attributes
+
+    """
+    return sorted({*globals(), *__all__})
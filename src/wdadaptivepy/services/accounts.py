@@ -33,6 +33,7 @@ class AccountService:
         attributes: bool = True,
         include_attribute_value_names: bool = True,
         include_attribute_value_display_names: bool = True,
+        lazy: bool = False,
     ) -> MetadataList[Account]:
         """Retrieve all Accounts from Adaptive.
 
@@ -40,6 +41,7 @@ class AccountService:
             attributes: Include Account Attributes for each Account
             include_attribute_value_names: Include Name for each Account
             include_attribute_value_display_names: Include Display Name for each Account
+            lazy: Convert fields other than id, code, and name on first access
 
         Returns:
             wdadaptivepy Accounts
@@ -62,7 +64,10 @@ class AccountService:
             method="exportAccounts",
             payload=include,
         )
-        return MetadataList[Account](Account.from_xml(xml=response))
+        with self.__xml_api.instrumentation.span("from_xml", model="Account") as span:
+            members = MetadataList[Account](Account.from_xml(xml=response, lazy=lazy))
+            span.attributes["rows"] = len(members)
+        return members
 
     def preview_update(
         self,
@@ -80,7 +85,12 @@ class AccountService:
             XML API body
 
         """
-        updated_accounts = Account.to_xml("update", accounts)
+        with self.__xml_api.instrumentation.span(
+            "to_xml",
+            model="Account",
+            rows=len(accounts),
+        ):
+            updated_accounts = Account.to_xml("update", accounts)
         return self.__xml_api.preview_xml_request(
             method="importAccounts",
             payload=updated_accounts,
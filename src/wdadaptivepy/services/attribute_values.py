@@ -91,9 +91,14 @@ class AttributeValueService:
         update_attribute = update_attributes.find("attribute")
         if update_attribute is None:
             raise ValueError
-        update_attribute.extend(
-            AttributeValue.to_xml("update", attribute_values),
-        )
+        with self.__xml_api.instrumentation.span(
+            "to_xml",
+            model="AttributeValue",
+            rows=len(attribute_values),
+        ):
+            update_attribute.extend(
+                AttributeValue.to_xml("update", attribute_values),
+            )
         return "updateAttributes", update_attributes
 
     def __find_attribute(
@@ -140,7 +145,12 @@ class AttributeValueService:
                 break
         if found_xml_elem is None:
             raise ValueError
-        found_attribute_values = AttributeValue.from_xml(found_xml_elem)
+        with self.__xml_api.instrumentation.span(
+            "from_xml",
+            model="AttributeValue",
+        ) as span:
+            found_attribute_values = AttributeValue.from_xml(found_xml_elem)
+            span.attributes["rows"] = len(found_attribute_values)
 
         return found_attribute, found_attribute_values
 
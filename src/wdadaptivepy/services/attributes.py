@@ -49,7 +49,10 @@ class AttributeService:
             method="exportAttributes",
             payload=include,
         )
-        return MetadataList[Attribute](Attribute.from_xml(xml=response))
+        with self.__xml_api.instrumentation.span("from_xml", model="Attribute") as span:
+            members = MetadataList[Attribute](Attribute.from_xml(xml=response))
+            span.attributes["rows"] = len(members)
+        return members
 
     def preview_update(
         self,
@@ -67,7 +70,12 @@ class AttributeService:
             XML API body
 
         """
-        updated_attributes = Attribute.to_xml("update", attributes)
+        with self.__xml_api.instrumentation.span(
+            "to_xml",
+            model="Attribute",
+            rows=len(attributes),
+        ):
+            updated_attributes = Attribute.to_xml("update", attributes)
         return self.__xml_api.preview_xml_request(
             method="importAttributes",
             payload=updated_attributes,
@@ -161,7 +169,10 @@ class AttributeService:
             method="exportAttributes",
             payload=include,
         )
-        return MetadataList[Attribute](Attribute.from_xml(xml=response))
+        with self.__xml_api.instrumentation.span("from_xml", model="Attribute") as span:
+            members = MetadataList[Attribute](Attribute.from_xml(xml=response))
+            span.attributes["rows"] = len(members)
+        return members
 
     def from_json(self, data: str) -> MetadataList[Attribute]:
         """Convert JSON to MetadataList of Attributes.
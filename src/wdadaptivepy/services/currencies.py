@@ -37,7 +37,10 @@ class CurrencyService:
             method="exportActiveCurrencies",
             payload=None,
         )
-        return MetadataList[Currency](Currency.from_xml(xml=response))
+        with self.__xml_api.instrumentation.span("from_xml", model="Currency") as span:
+            members = MetadataList[Currency](Currency.from_xml(xml=response))
+            span.attributes["rows"] = len(members)
+        return members
 
     def preview_update(
         self,
@@ -55,7 +58,12 @@ class CurrencyService:
             XML API body
 
         """
-        updated_currencies = Currency.to_xml("update", currencies)
+        with self.__xml_api.instrumentation.span(
+            "to_xml",
+            model="Currency",
+            rows=len(currencies),
+        ):
+            updated_currencies = Currency.to_xml("update", currencies)
         return self.__xml_api.preview_xml_request(
             method="importCurrencies",
             payload=updated_currencies,
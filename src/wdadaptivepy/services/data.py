@@ -1,11 +1,17 @@
 """wdadaptivepy service for Adaptive data."""
 
+import copy
+import hashlib
+import math
 import sys
-from collections.abc import Sequence
+import warnings
+from collections.abc import Iterator, Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from csv import DictReader, reader
 from datetime import datetime
 from io import StringIO
-from typing import TypeVar, cast
+from itertools import chain, islice
+from typing import Any, Literal, TypeVar, cast
 from xml.etree import ElementTree as ET
 
 if sys.version_info >= (3, 11):
@@ -13,6 +19,8 @@ if sys.version_info >= (3, 11):
 else:
     from typing_extensions import Self
 
+from wdadaptivepy.analysis.variance import VarianceTable
+from wdadaptivepy.connectors.xml_api.rate_limiter import RateLimiter
 from wdadaptivepy.connectors.xml_api.xml_api import XMLApi
 from wdadaptivepy.models.account import Account
 from wdadaptivepy.models.base import bool_to_str_true_false
@@ -24,24 +32,61 @@ from wdadaptivepy.models.data import (
     ExportDataFormat,
     ExportDataRules,
     LevelFilter,
+    QueryEstimate,
     TimeFilter,
     VersionFilter,
 )
+from wdadaptivepy.models.data_table import DataRecord, DataTable
 from wdadaptivepy.models.dimension import Dimension
 from wdadaptivepy.models.dimension_value import DimensionValue
 from wdadaptivepy.models.level import Level
+from wdadaptivepy.models.modeled_sheet import (
+    ModeledColumnType,
+    ModeledValue,
+    infer_column_type,
+    make_row_converter,
+)
 from wdadaptivepy.models.time import Period, Stratum
 from wdadaptivepy.models.version import Version
+from wdadaptivepy.services.metadata_cache import MetadataCache
+from wdadaptivepy.stores.base import DataStore
 
 T = TypeVar("T")
+BudgetAction = Literal["raise", "warn"]
+
+
+class CellBudgetWarning(UserWarning):
+    """Warning for data queries estimated over their cell budget."""
+
+
+def _to_number(raw_amount: str) -> int | float:
+    """Cast a string amount to int, or float if it is not an integer."""
+    if raw_amount.lstrip("-").isdigit():
+        return int(raw_amount)
+    try:
+        return int(raw_amount)
+    except ValueError:
+        return float(raw_amount)
 
 
 class DataQuery:
     """Query builder for Adaptive's export_data API."""
 
-    def __init__(self, xml_api: XMLApi) -> None:
-        """Initialize DataQuery."""
+    def __init__(
+        self,
+        xml_api: XMLApi,
+        metadata_cache: MetadataCache | None = None,
+    ) -> None:
+        """Initialize DataQuery.
+
+        Args:
+            xml_api: wdadaptivepy XMLApi
+            metadata_cache: Cached metadata used by preflight validation
+
+        """
         self.__xml_api = xml_api
+        self._metadata_cache = metadata_cache
+        self._preflight: tuple[int | None, BudgetAction] | None = None
         self._version_filter = VersionFilter(version=None, is_default=None)
         self._account_filter: list[AccountFilter] = []
         self._time_filter: TimeFilter | None = None
@@ -62,6 +107,41 @@ class DataQuery:
             ),
         )
 
+    def copy(self, xml_api: XMLApi | None = None) -> Self:
+        """Copy the data query, so the copy can be modified independently.
+
+        The copy shares the data query's metadata cache, unless it is sent
+        through an XMLApi of another instance code or locale.
+
+        Args:
+            xml_api: wdadaptivepy XMLApi the copy sends its calls through
+                (the data query's XMLApi if None)
+
+        Returns:
+            Copied DataQuery object.
+
+        """
+        query = copy.copy(self)
+        if xml_api is not None:
+            query.__xml_api = xml_api  # NOQA: SLF001
+            current, derived = self.__xml_api.credentials(), xml_api.credentials()
+            if (current.instance_code, current.locale) != (
+                derived.instance_code,
+                derived.locale,
+            ):
+                query._metadata_cache = None  # NOQA: SLF001
+        query._version_filter = copy.copy(self._version_filter)  # NOQA: SLF001
+        query._account_filter = list(self._account_filter)  # NOQA: SLF001
+        query._level_filter = list(self._level_filter)  # NOQA: SLF001
+        query._dimension_value_filter = list(self._dimension_value_filter)  # NOQA: SLF001
+        query._returned_dimensions = list(self._returned_dimensions)  # NOQA: SLF001
+        query._rules = copy.deepcopy(self._rules)  # NOQA: SLF001
+        return query
+
+    def _derive(self, **changes: Any) -> Self:  # NOQA: ANN401
+        """Copy the data query onto an XMLApi derived from its own XMLApi."""
+        return self.copy(xml_api=self.__xml_api.derive(**changes))
+
     def _get_flat_list_obj(
         self,
         obj: T | Sequence[T],
@@ -748,6 +828,340 @@ class DataQuery:
         self._validate_returned_dimensions()
         self._validate_rules()
 
+    def enable_preflight_validation(
+        self,
+        cell_budget: int | None = None,
+        *,
+        on_budget_exceeded: BudgetAction = "raise",
+    ) -> Self:
+        """Validate the data query against cached metadata before every export.
+
+        Args:
+            cell_budget: Maximum estimated number of cells (unlimited if None)
+            on_budget_exceeded: Raise an error or only warn when the estimate
+                exceeds the cell budget
+
+        Returns:
+            Modified DataQuery object.
+
+        """
+        self._preflight = (cell_budget, on_budget_exceeded)
+        return self
+
+    def disable_preflight_validation(self) -> Self:
+        """Stop validating the data query against cached metadata before exports.
+
+        Returns:
+            Modified DataQuery object.
+
+        """
+        self._preflight = None
+        return self
+
+    @property
+    def metadata_cache(self) -> MetadataCache:
+        """Get the metadata cache used to validate the data query.
+
+        Returns:
+            wdadaptivepy MetadataCache
+
+        """
+        if self._metadata_cache is None:
+            self._metadata_cache = MetadataCache(self.__xml_api)
+        return self._metadata_cache
+
+    def __expand(
+        self,
+        member: Account | Level,
+        *,
+        include_descendants: bool,
+    ) -> list[Account | Level]:
+        if not include_descendants:
+            return [member]
+        return [member, *member.get_descendents()]
+
+    def _time_validation_errors(self) -> list[str]:
+        """List the Periods and Stratum of the data query that do not exist."""
+        if self._time_filter is None:
+            return []
+        cache = self.metadata_cache
+        errors = [
+            f"Unknown Period {period.code}"
+            for period in (self._time_filter.start, self._time_filter.end)
+            if period.code and cache.period(period.code) is None
+        ]
+        stratum = self._time_filter.stratum
+        if stratum is not None and stratum.code and cache.stratum(stratum.code) is None:
+            errors.append(f"Unknown Stratum {stratum.code}")
+        return errors
+
+    def _dimension_validation_errors(self) -> list[str]:
+        """List the Dimension Values of the data query that do not exist."""
+        cache = self.metadata_cache
+        errors: list[str] = []
+        for dimension_value_filter in self._dimension_value_filter:
+            dimension = dimension_value_filter.dimension
+            value = dimension_value_filter.dimension_value
+            if dimension is None or not dimension.name or value is None:
+                continue
+            if cache.dimensions().get_member(name=dimension.name) is None:
+                errors.append(f"Unknown Dimension {dimension.name}")
+            elif cache.dimension_value(dimension.name, value.code, value.id) is None:
+                value_name = value.code or value.id
+                errors.append(f"Unknown {dimension.name} Dimension Value {value_name}")
+        return errors
+
+    def _validation_errors(self) -> list[str]:
+        """List the members referenced by the data query that do not exist."""
+        cache = self.metadata_cache
+        errors: list[str] = []
+        version = self._version_filter.version
+        if version is not None and version.name and cache.version(version.name) is None:
+            errors.append(f"Unknown Version {version.name}")
+        errors.extend(
+            f"Unknown Account {account_filter.account.code}"
+            for account_filter in self._account_filter
+            if account_filter.account.code
+            and cache.account(account_filter.account.code) is None
+        )
+        errors.extend(
+            f"Unknown Level {level_filter.level.code}"
+            for level_filter in self._level_filter
+            if level_filter.level.code and cache.level(level_filter.level.code) is None
+        )
+        errors.extend(self._time_validation_errors())
+        errors.extend(self._dimension_validation_errors())
+        return errors
+
+    def _count_periods(self) -> int:
+        """Count the period columns of the data query using cached Time.
+
+        Time rollups add a column for each Period of a coarser Stratum
+        containing a Period of the time span, and aggregating the time span
+        exports a single column.
+        """
+        if self._time_filter is None:
+            return 0
+        calendar = self.metadata_cache.calendar()
+        stratum = self._time_filter.stratum
+        periods = calendar.expand_range(
+            self._time_filter.start.code or "",
+            self._time_filter.end.code or "",
+            stratum.code if stratum is not None and stratum.code else None,
+        )
+        if self._rules.time_rollups == "single":
+            return min(len(periods), 1)
+        if not self._rules.time_rollups or not periods:
+            return len(periods)
+        rollups: set[str] = set()
+        coarser = next(
+            (x for x in calendar.strata if x.id == periods[0].stratum_id),
+            None,
+        )
+        coarser = coarser.adaptive_parent if coarser is not None else None
+        while coarser is not None:
+            for period in periods:
+                parent = calendar.parent(period, coarser)
+                if parent is not None:
+                    rollups.add(parent.code or "")
+            coarser = coarser.adaptive_parent
+        return len(periods) + len(rollups)
+
+    def _count_accounts(self) -> int:
+        """Count the exported Accounts using cached Accounts.
+
+        Rollup Accounts are only counted when the rules include them, or
+        when requested without their descendants.
+        """
+        cache = self.metadata_cache
+        accounts: set[str] = set()
+        for account_filter in self._account_filter:
+            account = cache.account(account_filter.account.code or "")
+            if account is None:
+                continue
+            if not account_filter.include_descendants:
+                accounts.add(account.code or "")
+                continue
+            accounts.update(
+                member.code or ""
+                for member in self.__expand(account, include_descendants=True)
+                if self._rules.include_rollup_accounts or not member.adaptive_children
+            )
+        return len(accounts)
+
+    def _count_levels(self) -> int:
+        """Count the exported Levels using cached Levels.
+
+        Every Level is counted without Level filters. Otherwise, like
+        Accounts, rollup Levels are only counted when the rules include
+        them, or when requested without their descendants.
+        """
+        cache = self.metadata_cache
+        if not self._level_filter:
+            return len(cache.levels())
+        include_rollups = self._rules.include_rollup_levels
+        levels: set[str] = set()
+        for level_filter in self._level_filter:
+            level = cache.level(level_filter.level.code or "")
+            if level is None:
+                continue
+            if not level_filter.include_descendants:
+                levels.add(level.code or "")
+                continue
+            levels.update(
+                member.code or ""
+                for member in self.__expand(level, include_descendants=True)
+                if include_rollups or not member.adaptive_children
+            )
+        return len(levels)
+
+    def _count_dimension_values(self, dimension_name: str) -> int:
+        """Count the exported Dimension Values of a returned Dimension.
+
+        Each exported column is keyed by its Dimension Value ID (None for the
+        Dimension itself) and whether it is the uncategorized column.
+        """
+        cache = self.metadata_cache
+        dimension_values = cache.dimension_values(dimension_name)
+        filters = [
+            dimension_value_filter
+            for dimension_value_filter in self._dimension_value_filter
+            if dimension_value_filter.dimension is not None
+            and dimension_value_filter.dimension.name == dimension_name
+        ]
+        if not filters:
+            return len(dimension_values) + 1
+        members: set[tuple[int | None, bool]] = set()
+        for dimension_value_filter in filters:
+            if dimension_value_filter.uncategorized_of_dimension is not None:
+                members.add((None, True))
+            if dimension_value_filter.direct_children_of_dimension is not None:
+                members.update(
+                    (member.id, False)
+                    for member in dimension_values
+                    if not member.adaptive_parent
+                )
+            value = dimension_value_filter.dimension_value
+            if value is None:
+                continue
+            member = cache.dimension_value(dimension_name, value.code, value.id)
+            if member is None:
+                continue
+            if dimension_value_filter.uncategorized:
+                members.add((member.id, True))
+            elif dimension_value_filter.direct_children:
+                members.update((child.id, False) for child in member.adaptive_children)
+            else:
+                members.add((member.id, False))
+                members.update((child.id, False) for child in member.get_descendents())
+        return len(members)
+
+    def estimate(self, density: float = 1.0) -> QueryEstimate:
+        """Estimate the size of the data query's export without calling exportData.
+
+        Accounts, Levels, Dimension Values, and Periods are counted from the
+        connection's cached metadata, expanding descendants locally. Every
+        combination is exported when zero rows are included; otherwise only
+        the given share of combinations is expected to have data.
+
+        Args:
+            density: Share of rows expected to have data (ignored when zero
+                rows are included)
+
+        Returns:
+            Estimated size of the export
+
+        Raises:
+            ValueError: Unknown members or density outside of 0 to 1
+
+        """
+        if not 0 <= density <= 1:
+            error_message = "Expected a density between 0 and 1"
+            raise ValueError(error_message)
+        self._validate_data_query()
+        with self.__xml_api.instrumentation.span("preflight") as span:
+            errors = self._validation_errors()
+            if errors:
+                span.attributes["errors"] = len(errors)
+                error_message = "Invalid data query: " + "; ".join(errors)
+                raise ValueError(error_message)
+            accounts = self._count_accounts()
+            levels = self._count_levels()
+            dimension_values = math.prod(
+                self._count_dimension_values(dimension)
+                for dimension in dict.fromkeys(self.returned_dimensions)
+            )
+            periods = self._count_periods()
+            max_rows = accounts * levels * dimension_values
+            rows = (
+                max_rows
+                if self._rules.include_zero_rows
+                else math.ceil(max_rows * density)
+            )
+            span.attributes["cells"] = max_rows * periods
+        return QueryEstimate(
+            accounts=accounts,
+            levels=levels,
+            dimension_values=dimension_values,
+            periods=periods,
+            max_rows=max_rows,
+            max_cells=max_rows * periods,
+            rows=rows,
+            cells=rows * periods,
+        )
+
+    def validate(
+        self,
+        cell_budget: int | None = None,
+        *,
+        on_budget_exceeded: BudgetAction = "raise",
+    ) -> int:
+        """Validate the data query against cached metadata without calling exportData.
+
+        Checks that the referenced Version, Accounts, Levels, Periods,
+        Stratum, and Dimension Values exist, then estimates the largest
+        number of cells the export could return.
+
+        Args:
+            cell_budget: Maximum estimated number of cells (unlimited if None)
+            on_budget_exceeded: Raise an error or only warn when the estimate
+                exceeds the cell budget
+
+        Returns:
+            Estimated number of cells
+
+        Raises:
+            ValueError: Unknown members or estimate over the cell budget
+
+        Warns:
+            CellBudgetWarning: Estimate over the cell budget when warning
+
+        """
+        return self.__check_budget(cell_budget, on_budget_exceeded, stacklevel=3)
+
+    def __check_budget(
+        self,
+        cell_budget: int | None,
+        on_budget_exceeded: BudgetAction,
+        stacklevel: int,
+    ) -> int:
+        """Estimate the cells, warning at the stacklevel of the user's call."""
+        cells = self.estimate().max_cells
+        if cell_budget is not None and cells > cell_budget:
+            error_message = (
+                f"Data query of about {cells} cells exceeds the budget of "
+                f"{cell_budget} cells"
+            )
+            if on_budget_exceeded == "raise":
+                raise ValueError(error_message)
+            warnings.warn(error_message, CellBudgetWarning, stacklevel=stacklevel)
+        return cells
+
+    def _preflight_validation(self) -> None:
+        if self._preflight is not None:
+            cell_budget, on_budget_exceeded = self._preflight
+            self.__check_budget(cell_budget, on_budget_exceeded, stacklevel=4)
+
     def _generate_xml(self) -> list[ET.Element]:
         self._validate_data_query()
 
@@ -793,7 +1207,7 @@ class DataQuery:
     def _parse_response(
         self,
         response: ET.Element,
-    ) -> list[dict[str, str | float | int | None]]:
+    ) -> list[DataRecord]:
         """Parse data from XML.
 
         It reads like a table of contents for the parsing pipeline.
@@ -825,17 +1239,36 @@ class DataQuery:
     def _read_csv(
         self, csv_text: str, expected_count: int
     ) -> tuple[list[str], list[list[str]]]:
-        """Parse CSV text into lists and validates row counts."""
-        csv_reader = reader(StringIO(csv_text.strip("\n")), lineterminator="\n")
+        """Parse CSV text into lists and validates row counts.
 
-        try:
-            headers = next(csv_reader)
-        except StopIteration:
-            return [], []
-
-        raw_rows = list(csv_reader)
+        Values of the base (Name and Code) columns repeat across many rows,
+        so each distinct value is stored once and shared by every row.
+        """
+        with self.__xml_api.instrumentation.span("read_csv") as span:
+            if expected_count > -1:
+                span.attributes["expected_rows"] = expected_count
+            csv_reader = reader(StringIO(csv_text.strip("\n")), lineterminator="\n")
+
+            try:
+                headers = next(csv_reader)
+            except StopIteration:
+                return [], []
+
+            base_indexes = [idx for idx, _ in self._categorize_columns(headers)[0]]
+            pool: dict[str, str] = {}
+            intern = pool.setdefault
+            raw_rows = list(csv_reader)
+            for row in raw_rows:
+                for idx in base_indexes:
+                    value = row[idx]
+                    row[idx] = intern(value, value)
+            span.attributes["rows"] = len(raw_rows)
+            span.attributes["distinct_values"] = len(pool)
+            span.attributes["row_count_mismatch"] = (
+                expected_count > -1 and len(raw_rows) != expected_count
+            )
 
-        if expected_count > -1 and len(raw_rows) != expected_count:
+        if span.attributes["row_count_mismatch"]:
             raise RuntimeError
 
         return headers, raw_rows
@@ -859,39 +1292,51 @@ class DataQuery:
         """Cast string amount to number."""
         if raw_amount == "B":
             return None
-        try:
-            return int(raw_amount)
-        except ValueError:
-            return float(raw_amount)
+        return _to_number(raw_amount)
 
     def _unpivot_data(
         self,
         raw_rows: list[list[str]],
         base_cols: list[tuple[int, str]],
         period_cols: list[tuple[int, str]],
-    ) -> list[dict[str, str | float | int | None]]:
-        """Melts wide data into long format using high-speed integer indexing."""
-        parsed_data: list[dict[str, str | float | int | None]] = []
-
-        for row in raw_rows:
-            base_row: dict[str, str | float | int | None] = {
-                name: row[idx] for idx, name in base_cols
-            }
-            for idx, period_name in period_cols:
-                new_row = base_row.copy()
-                new_row["Period Code"] = period_name
-                new_row["Amount"] = self._cast_amount(row[idx])
-                parsed_data.append(new_row)
+    ) -> list[DataRecord]:
+        """Melts wide data into long format using high-speed integer indexing.
+
+        Cells of the same source row share one tuple of base values.
+        """
+        parsed_data: list[DataRecord] = []
+
+        columns = {name: position for position, (_, name) in enumerate(base_cols)}
+        base_indexes = [idx for idx, _ in base_cols]
+        append = parsed_data.append
+        cast_amount = self._cast_amount
+        with self.__xml_api.instrumentation.span("unpivot", rows=len(raw_rows)) as span:
+            for row in raw_rows:
+                base_values = tuple([row[idx] for idx in base_indexes])
+                for idx, period_name in period_cols:
+                    append(
+                        DataRecord(
+                            columns,
+                            base_values,
+                            period_name,
+                            cast_amount(row[idx]),
+                        ),
+                    )
+            span.attributes["cells"] = len(parsed_data)
 
         return parsed_data
 
-    def get_data(self) -> list[dict[str, str | int | float | None]]:
+    def get_data(self) -> list[DataRecord]:
         """Retrieve data from Adaptive.
 
+        Each cell is a read-only mapping of column names to values; use
+        `cell.to_dict()` for a modifiable (and JSON serializable) copy.
+
         Returns:
             Data from Adaptive
 
         """
+        self._preflight_validation()
         payload = self._generate_xml()
 
         if not payload:
@@ -904,6 +1349,594 @@ class DataQuery:
 
         return self._parse_response(response)
 
+    def _parse_table(self, response: ET.Element) -> DataTable:
+        """Parse data from XML into a columnar DataTable."""
+        expected_count, csv_text = self._extract_payload(response)
+        headers, raw_rows = (
+            self._read_csv(csv_text, expected_count) if csv_text else ([], [])
+        )
+        base_cols, period_cols = self._categorize_columns(headers)
+        with self.__xml_api.instrumentation.span(
+            "data_table",
+            rows=len(raw_rows),
+        ) as span:
+            table = DataTable.from_rows(raw_rows, base_cols, period_cols)
+            span.attributes["cells"] = table.cell_count
+        return table
+
+    def fingerprint(self) -> str:
+        """Fingerprint everything about the data query except Version and time.
+
+        Two data queries with the same fingerprint export the same rows and
+        columns for a given Version and Period.
+
+        Returns:
+            Hex digest identifying the data query
+
+        """
+        digest = hashlib.sha256()
+        for element in self._generate_xml():
+            if element.tag == "version":
+                continue
+            if element.tag == "filters":
+                element = copy.copy(element)  # NOQA: PLW2901
+                for time_span in element.findall("timeSpan"):
+                    element.remove(time_span)
+            digest.update(ET.canonicalize(ET.tostring(element)).encode())
+        return digest.hexdigest()
+
+    def refresh(
+        self,
+        store: DataStore,
+        dirty_periods: Sequence[Period | str] = (),
+    ) -> DataTable:
+        """Retrieve data from Adaptive, only exporting periods that may have changed.
+
+        The first refresh of a Version and fingerprint exports every period
+        and saves the result in the store. Later refreshes only export the
+        periods marked dirty and the periods after the Version's
+        completed_values_thru (when set with a Version retrieved from
+        Adaptive), then merge them into the stored data. Locked Versions are
+        never exported again once stored. When the data query's time span
+        is not within the stored periods, its whole time span is exported
+        and replaces the stored data. Only the periods of the data query's
+        time span are returned.
+
+        Args:
+            store: Local store of earlier results
+            dirty_periods: Periods known to have changed since the last refresh
+
+        Returns:
+            Data from Adaptive
+
+        """
+        version = self._version_filter.version
+        version_name = version.name if version and version.name else ""
+        fingerprint = self.fingerprint()
+        with self.__xml_api.instrumentation.span("refresh") as span:
+            stored = store.load(version_name, fingerprint)
+            if stored is not None and not self.__within(stored):
+                stored = None
+            if stored is not None and version is not None and version.is_locked:
+                span.attributes["skipped"] = True
+                return self.__select_time_span(stored)
+            periods = self.__refresh_periods(stored, dirty_periods)
+            if stored is not None and not periods:
+                span.attributes["skipped"] = True
+                return self.__select_time_span(stored)
+            span.attributes["exported_periods"] = len(periods) if stored else 0
+            query = self
+            if stored is not None and self._time_filter is not None:
+                query = self.copy().set_time_filter(
+                    periods[0],
+                    periods[-1],
+                    self._time_filter.stratum,
+                )
+            table = query.get_data_table()
+            if stored is not None:
+                table = stored.merge_periods(table, table.periods)
+            store.save(version_name, fingerprint, table)
+        return self.__select_time_span(table)
+
+    def __within(self, stored: DataTable) -> bool:
+        """Check whether the data query's time span is within stored periods."""
+        if self._time_filter is None:
+            return True
+        return (
+            self._time_filter.start.code in stored.periods
+            and self._time_filter.end.code in stored.periods
+        )
+
+    def __select_time_span(self, table: DataTable) -> DataTable:
+        """Keep only the periods of the data query's time span."""
+        if self._time_filter is None or not self.__within(table):
+            return table
+        start = table.periods.index(self._time_filter.start.code or "")
+        end = table.periods.index(self._time_filter.end.code or "")
+        if start == 0 and end == len(table.periods) - 1:
+            return table
+        return table.select_periods(table.periods[start : end + 1])
+
+    def __refresh_periods(
+        self,
+        stored: DataTable | None,
+        dirty_periods: Sequence[Period | str],
+    ) -> list[str]:
+        """Get the contiguous range of stored periods that must be exported.
+
+        Periods ending after the Version's completed_values_thru are dirty,
+        comparing end dates from the cached calendar. Periods whose end date
+        is unknown are dirty.
+        """
+        if stored is None or self._time_filter is None:
+            return []
+        dirty = {self._get_period_obj(period).code for period in dirty_periods}
+        version = self._version_filter.version
+        completed_values_thru = version.completed_values_thru if version else None
+        if completed_values_thru:
+            calendar = self.metadata_cache.calendar()
+            completed = calendar.period(completed_values_thru)
+            completed_end = completed.end if completed is not None else None
+            for code in stored.periods:
+                period = calendar.period(code)
+                end = period.end if period is not None else None
+                if completed_end is None or end is None or end > completed_end:
+                    dirty.add(code)
+        positions = [
+            position
+            for position, period in enumerate(stored.periods)
+            if period in dirty
+        ]
+        if not positions:
+            return []
+        return stored.periods[min(positions) : max(positions) + 1]
+
+    def get_data_table(self) -> DataTable:
+        """Retrieve data from Adaptive as a columnar DataTable.
+
+        Amounts are converted one period column at a time into float64
+        arrays, which is considerably faster and smaller than get_data for
+        large exports.
+
+        Returns:
+            Data from Adaptive
+
+        """
+        self._preflight_validation()
+        payload = self._generate_xml()
+
+        if not payload:
+            raise ValueError
+        response = self.__xml_api.make_xml_request(
+            method="exportData",
+            payload=payload,
+            stream=True,
+        )
+
+        return self._parse_table(response)
+
+
+def _export_tables(
+    queries: Sequence[DataQuery],
+    *,
+    max_workers: int,
+    rate_limiter: RateLimiter | None,
+) -> list[DataTable]:
+    """Run data queries concurrently, keeping the order of their results."""
+    if rate_limiter is not None:
+        queries = [query._derive(rate_limiter=rate_limiter) for query in queries]  # NOQA: SLF001
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda query: query.get_data_table(), queries))
+
+
+def _export_many(
+    queries: Sequence[DataQuery],
+    label_columns: Sequence[str],
+    labels: Sequence[Sequence[str]],
+    *,
+    max_workers: int,
+    rate_limiter: RateLimiter | None,
+) -> DataTable:
+    """Run data queries concurrently and stack their results with labels."""
+    tables = _export_tables(
+        queries,
+        max_workers=max_workers,
+        rate_limiter=rate_limiter,
+    )
+    return DataTable.concat(tables, label_columns, labels)
+
+
+def _version_labels(
+    versions: Sequence[Version | str] | None,
+) -> list[tuple[Version | str | None, str | None]]:
+    if versions is None:
+        return [(None, None)]
+    return [
+        (version, version.name if isinstance(version, Version) else version)
+        for version in versions
+    ]
+
+
+def export_many_connections(  # NOQA: PLR0913
+    query: DataQuery,
+    connections: Mapping[str, "DataService"],
+    *,
+    versions: Sequence[Version | str] | None = None,
+    label_column: str = "Tenant",
+    max_workers: int = 4,
+    rate_limiter: RateLimiter | None = None,
+) -> DataTable:
+    """Export the same data query from several connections concurrently.
+
+    The query is cloned onto each connection's DataService (and for each
+    Version, when given), the clones are exported concurrently, and the
+    results are stacked into one DataTable with a tenant column in front
+    (and a Version column after it, when Versions are given).
+
+    Args:
+        query: Data query to clone
+        connections: DataService of each connection, by tenant label
+        versions: Versions to export (the query's Version if None)
+        label_column: Name of the tenant column
+        max_workers: Number of concurrent exports
+        rate_limiter: Limits shared by the calls of every connection
+
+    Returns:
+        Data from every connection
+
+    """
+    queries: list[DataQuery] = []
+    labels: list[list[str]] = []
+    for tenant, service in connections.items():
+        for version, version_name in _version_labels(versions):
+            clone = service.query_data(template=query)
+            if version is not None:
+                clone.set_version_filter(version)
+            queries.append(clone)
+            labels.append([tenant] if version_name is None else [tenant, version_name])
+    label_columns = [label_column] if versions is None else [label_column, "Version"]
+    return _export_many(
+        queries,
+        label_columns,
+        labels,
+        max_workers=max_workers,
+        rate_limiter=rate_limiter,
+    )
+
+
+class ModeledSheetQuery:
+    """Query builder for Adaptive's exportConfigurableModelData API."""
+
+    def __init__(  # NOQA: PLR0913
+        self,
+        xml_api: XMLApi,
+        version_name: str,
+        sheet_name: str,
+        *,
+        is_assumption_sheet: bool = False,
+        include_all_columns: bool = True,
+        get_all_rows: bool = True,
+        use_numeric_ids: bool = False,
+        display_name_enabled: bool = True,
+        include_codes: bool = False,
+        include_names: bool = False,
+        include_display_names: bool = False,
+        use_account_precision: bool = False,
+        use_actual_value: bool = False,
+    ) -> None:
+        """Initialize ModeledSheetQuery.
+
+        Args:
+            xml_api: wdadaptivepy XMLApi
+            version_name: Adaptive Version Name
+            sheet_name: Adaptive Sheet Name
+            is_assumption_sheet: Adaptive Is Assumption Sheet
+            include_all_columns: Adaptive Include All Columns
+            get_all_rows: Adaptive Get All Rows
+            use_numeric_ids: Adaptive Use Numeric IDs
+            display_name_enabled: Adaptive Display Name Enabled
+            include_codes: Adaptive Include Codes
+            include_names: Adaptive Include Names
+            include_display_names: Adaptive Include Display Names
+            use_account_precision: Adaptive Use Account Precision
+            use_actual_value: Adaptive Use Actual Value
+
+        """
+        self.__xml_api = xml_api
+        self.version_name = version_name
+        self.sheet_name = sheet_name
+        self.options = {
+            "isGlobal": is_assumption_sheet,
+            "includeAllColumns": include_all_columns,
+            "isGetAllRows": get_all_rows,
+            "useNumericIDs": use_numeric_ids,
+            "diplsayNameEnabled": display_name_enabled,
+            "includeCodes": include_codes,
+            "includeNames": include_names,
+            "includeDisplayNames": include_display_names,
+            "useAccountPrecision": use_account_precision,
+            "useActualValue": use_actual_value,
+        }
+        self._level_filter: list[LevelFilter] = []
+        self._column_types: dict[str, ModeledColumnType] = {}
+
+    def copy(self) -> Self:
+        """Copy the modeled sheet query, so the copy can be modified independently.
+
+        Returns:
+            Copied ModeledSheetQuery object.
+
+        """
+        query = copy.copy(self)
+        query.options = dict(self.options)
+        query._level_filter = list(self._level_filter)  # NOQA: SLF001
+        query._column_types = dict(self._column_types)  # NOQA: SLF001
+        return query
+
+    def add_level_filter(
+        self,
+        levels: Level | str | Sequence[Level | str],
+        *,
+        is_rollup: bool = False,
+        include_descendants: bool = False,
+    ) -> Self:
+        """Only export the rows of some Levels.
+
+        Args:
+            levels: Levels (or Level names) to export
+            is_rollup: Flag to include only the rows loaded to a Level rollup
+            include_descendants: Include the level's descendants
+
+        Returns:
+            Modified ModeledSheetQuery object.
+
+        Raises:
+            ValueError: Level without a name
+
+        """
+        if isinstance(levels, Level | str):
+            levels = [levels]
+        for level in levels:
+            level_obj = Level(name=level) if isinstance(level, str) else level
+            if not level_obj.name:
+                error_message = "Expected Level name value"
+                raise ValueError(error_message)
+            self._level_filter.append(
+                LevelFilter(
+                    level=level_obj,
+                    is_rollup=is_rollup,
+                    include_descendants=include_descendants,
+                ),
+            )
+        return self
+
+    @property
+    def level_filter(self) -> list[LevelFilter]:
+        """Get the modeled sheet query's level filter.
+
+        Returns:
+            List of Level filters.
+
+        """
+        return self._level_filter
+
+    def clear_level_filter(self) -> Self:
+        """Clear the level filters of the modeled sheet query.
+
+        Returns:
+            Modified ModeledSheetQuery object.
+
+        """
+        self._level_filter = []
+        return self
+
+    def set_column_type(self, column: str, column_type: ModeledColumnType) -> Self:
+        """Set the type of a column instead of detecting it.
+
+        Args:
+            column: Column name
+            column_type: Type of the column's values
+
+        Returns:
+            Modified ModeledSheetQuery object.
+
+        """
+        self._column_types[column] = column_type
+        return self
+
+    def _generate_xml(self) -> list[ET.Element]:
+        version_element = ET.Element("version", attrib={"name": self.version_name})
+        attributes = {"name": self.sheet_name}
+        attributes.update(
+            {
+                name: str(bool_to_str_true_false(value))
+                for name, value in self.options.items()
+            },
+        )
+        modeled_sheet_element = ET.Element("modeled-sheet", attrib=attributes)
+        if self._level_filter:
+            filters_element = ET.SubElement(modeled_sheet_element, "filters")
+            levels_element = ET.SubElement(filters_element, "levels")
+            for level_filter in self._level_filter:
+                ET.SubElement(
+                    levels_element,
+                    "level",
+                    attrib={
+                        "name": str(level_filter.level.name),
+                        "isRollup": str(bool_to_str_true_false(level_filter.is_rollup)),
+                        "includeDescendants": str(
+                            bool_to_str_true_false(level_filter.include_descendants),
+                        ),
+                    },
+                )
+        return [version_element, modeled_sheet_element]
+
+    def _export(self) -> str | None:
+        response = self.__xml_api.make_xml_request(
+            method="exportConfigurableModelData",
+            payload=self._generate_xml(),
+        )
+        data = response.find("output/data")
+        if data is None or data.text is None:
+            return None
+        return data.text.strip("\n")
+
+    def _iter_csv(
+        self,
+        text: str | None,
+        sample_rows: int,
+        column_types: Mapping[str, ModeledColumnType] | None = None,
+    ) -> tuple[list[str], dict[str, ModeledColumnType], Iterator[list[ModeledValue]]]:
+        """Read the header, detect column types, and convert rows lazily.
+
+        Rows shorter than the header are padded with blank values, and blank
+        values past the header are dropped.
+        """
+        if not text:
+            return [], {}, iter(())
+        csv_reader = reader(StringIO(text), lineterminator="\n")
+        header = next(csv_reader, [])
+        width = len(header)
+
+        def fit(row: list[str]) -> list[str]:
+            if len(row) < width:
+                return row + [""] * (width - len(row))
+            if len(row) > width:
+                if any(row[width:]):
+                    error_message = (
+                        f"Row has {len(row)} values but the header has {width}"
+                    )
+                    raise ValueError(error_message)
+                return row[:width]
+            return row
+
+        rows = map(fit, csv_reader)
+        known_types = {**(column_types or {}), **self._column_types}
+        sample: list[list[str]] = []
+        if any(name not in known_types for name in header):
+            sample = list(islice(rows, sample_rows))
+        columns = list(zip(*sample, strict=True)) if sample else []
+        types = {
+            name: known_types.get(name)
+            or (infer_column_type(columns[index]) if columns else "text")
+            for index, name in enumerate(header)
+        }
+        convert_row = make_row_converter([types[name] for name in header])
+        return header, types, map(convert_row, chain(sample, rows))
+
+    def convert_rows(
+        self,
+        *,
+        sample_rows: int = 100,
+    ) -> Iterator[dict[str, ModeledValue]]:
+        """Retrieve Modeled Sheet rows, converting them to typed values lazily.
+
+        The response is received and parsed whole before the first row is
+        yielded, so only the conversion of its CSV rows happens one row at
+        a time. Use convert_rows_by_level to keep each response smaller.
+
+        Column types are detected from the first rows of the sheet: columns
+        whose values are all numbers, dates, or booleans ("true"/"false")
+        are converted, and blank values of those columns become None. Use
+        set_column_type to override the detection.
+
+        Args:
+            sample_rows: Number of rows used to detect column types
+
+        Yields:
+            Row of data
+
+        """
+        with self.__xml_api.instrumentation.span(
+            "modeled_sheet",
+            sheet=self.sheet_name,
+        ) as span:
+            text = self._export()
+            span.attributes["response_chars"] = len(text or "")
+        header, _, rows = self._iter_csv(text, sample_rows)
+        for row in rows:
+            yield dict(zip(header, row, strict=True))
+
+    def get_columns(self, *, sample_rows: int = 100) -> dict[str, list[ModeledValue]]:
+        """Retrieve Modeled Sheet data as typed columns.
+
+        Args:
+            sample_rows: Number of rows used to detect column types
+
+        Returns:
+            Values of each column, by column name
+
+        """
+        with self.__xml_api.instrumentation.span(
+            "modeled_sheet",
+            sheet=self.sheet_name,
+        ) as span:
+            text = self._export()
+            span.attributes["response_chars"] = len(text or "")
+        header, _, rows = self._iter_csv(text, sample_rows)
+        columns: list[list[ModeledValue]] = [[] for _ in header]
+        appends = [column.append for column in columns]
+        for row in rows:
+            for append, value in zip(appends, row, strict=True):
+                append(value)
+        return dict(zip(header, columns, strict=True))
+
+    def shard_by_level(self, levels: Sequence[Level | str]) -> list[Self]:
+        """Split the query into one query per Level.
+
+        Each shard only exports the rows of its own Level, so the rows of
+        all shards together are the rows of the sheet for those Levels.
+        Every other option of the query, including get_all_rows, is kept
+        as set on each shard.
+
+        Args:
+            levels: Levels (or Level names) to export, typically the leaf Levels
+
+        Returns:
+            One ModeledSheetQuery per Level
+
+        """
+        return [
+            self.copy().clear_level_filter().add_level_filter(level) for level in levels
+        ]
+
+    def convert_rows_by_level(
+        self,
+        levels: Sequence[Level | str],
+        *,
+        max_workers: int = 4,
+        sample_rows: int = 100,
+    ) -> Iterator[dict[str, ModeledValue]]:
+        """Retrieve Modeled Sheet rows by exporting each Level in parallel.
+
+        Rows are yielded Level by Level, in the order of the given Levels.
+        Each Level's response is received whole and its rows are converted
+        lazily, but responses of later Levels may be held until their rows
+        are reached. Column types are detected from the first Level with
+        rows and applied to every Level.
+
+        Args:
+            levels: Levels (or Level names) to export, typically the leaf Levels
+            max_workers: Number of concurrent exports
+            sample_rows: Number of rows used to detect column types
+
+        Yields:
+            Row of data
+
+        """
+        shards = self.shard_by_level(levels)
+        column_types: dict[str, ModeledColumnType] | None = None
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for text in executor.map(
+                lambda shard: shard._export(),  # NOQA: SLF001
+                shards,
+            ):
+                header, types, rows = self._iter_csv(text, sample_rows, column_types)
+                if header and column_types is None:
+                    column_types = types
+                for row in rows:
+                    yield dict(zip(header, row, strict=True))
+
 
 class DataService:
     """wdadaptivepy Service for Data.
@@ -928,6 +1961,7 @@ class DataService:
 
         """
         self.__xml_api = xml_api
+        self.metadata_cache = MetadataCache(xml_api)
         self.ExportDataAccountsFilter = AccountFilter
         self.ExportDataCurrencyFilter = CurrencyFilter
         self.ExportDataDimensionValueFilter = DimensionValueFilter
@@ -937,14 +1971,174 @@ class DataService:
         self.ExportDataLevelFilter = LevelFilter
         self.ExportDataTimeFilter = TimeFilter
 
-    def query_data(self) -> DataQuery:
+    def query_data(self, template: DataQuery | None = None) -> DataQuery:
         """Start a data query to retrieve data from Adaptive.
 
+        Args:
+            template: Data query (possibly of another connection) whose
+                filters, returned Dimensions, and rules are copied
+
         Returns:
             DataQuery object
 
         """
-        return DataQuery(xml_api=self.__xml_api)
+        if template is not None:
+            query = template.copy(xml_api=self.__xml_api)
+            query._metadata_cache = self.metadata_cache  # NOQA: SLF001
+            return query
+        return DataQuery(xml_api=self.__xml_api, metadata_cache=self.metadata_cache)
+
+    def export_many(
+        self,
+        query: DataQuery,
+        *,
+        versions: Sequence[Version | str] | None = None,
+        instance_codes: Sequence[str] | None = None,
+        max_workers: int = 4,
+        rate_limiter: RateLimiter | None = None,
+    ) -> DataTable:
+        """Export the same data query for several Versions or instances concurrently.
+
+        The query is cloned for each Version and instance code, the clones
+        are exported concurrently through the connection's pool of HTTP
+        connections, and the results are stacked into one DataTable. An
+        "Instance Code" column (when instance codes are given) and a
+        "Version" column (when Versions are given) are added in front.
+
+        Args:
+            query: Data query to clone
+            versions: Versions to export (the query's Version if None)
+            instance_codes: Instance codes to export (the connection's if None)
+            max_workers: Number of concurrent exports
+            rate_limiter: Limits shared by the calls of every clone (the
+                connection's rate limiter if None)
+
+        Returns:
+            Data of every Version and instance
+
+        """
+        queries: list[DataQuery] = []
+        labels: list[list[str]] = []
+        for instance_code in instance_codes if instance_codes is not None else [None]:
+            for version, version_name in _version_labels(versions):
+                clone = self.query_data(template=query)
+                if instance_code is not None:
+                    clone = clone._derive(instance_code=instance_code)  # NOQA: SLF001
+                if version is not None:
+                    clone.set_version_filter(version)
+                queries.append(clone)
+                labels.append(
+                    [x for x in (instance_code, version_name) if x is not None],
+                )
+        label_columns = [
+            column
+            for column, values in (
+                ("Instance Code", instance_codes),
+                ("Version", versions),
+            )
+            if values is not None
+        ]
+        with self.__xml_api.instrumentation.span(
+            "export_many",
+            queries=len(queries),
+        ):
+            return _export_many(
+                queries,
+                label_columns,
+                labels,
+                max_workers=max_workers,
+                rate_limiter=rate_limiter,
+            )
+
+    def compare_versions(
+        self,
+        query: DataQuery,
+        base_version: Version | str,
+        compare_version: Version | str,
+        *,
+        rate_limiter: RateLimiter | None = None,
+    ) -> VarianceTable:
+        """Export a data query for two Versions concurrently and compare them.
+
+        Cells are matched on their base columns (Account, Level, and
+        Dimension codes and names) with a hash join over the columnar data.
+
+        Args:
+            query: Data query to export (its Version is ignored)
+            base_version: Version compared against (such as Budget)
+            compare_version: Version compared (such as Actuals)
+            rate_limiter: Limits shared by both exports (the connection's
+                rate limiter if None)
+
+        Returns:
+            Difference, percentage, and missing cells of every cell
+
+        """
+        queries = [
+            self.query_data(template=query).set_version_filter(version)
+            for version in (base_version, compare_version)
+        ]
+        with self.__xml_api.instrumentation.span("variance") as span:
+            base, compare = _export_tables(
+                queries,
+                max_workers=2,
+                rate_limiter=rate_limiter,
+            )
+            variance = VarianceTable.from_tables(base, compare)
+            span.attributes["rows"] = variance.row_count
+        return variance
+
+    def query_modeled_sheet(  # NOQA: PLR0913
+        self,
+        version_name: str,
+        sheet_name: str,
+        *,
+        is_assumption_sheet: bool = False,
+        include_all_columns: bool = True,
+        get_all_rows: bool = True,
+        use_numeric_ids: bool = False,
+        display_name_enabled: bool = True,
+        include_codes: bool = False,
+        include_names: bool = False,
+        include_display_names: bool = False,
+        use_account_precision: bool = False,
+        use_actual_value: bool = False,
+    ) -> ModeledSheetQuery:
+        """Start a modeled sheet query to stream typed data from a Modeled Sheet.
+
+        Args:
+            version_name: Adaptive Version Name
+            sheet_name: Adaptive Sheet Name
+            is_assumption_sheet: Adaptive Is Assumption Sheet
+            include_all_columns: Adaptive Include All Columns
+            get_all_rows: Adaptive Get All Rows
+            use_numeric_ids: Adaptive Use Numeric IDs
+            display_name_enabled: Adaptive Display Name Enabled
+            include_codes: Adaptive Include Codes
+            include_names: Adaptive Include Names
+            include_display_names: Adaptive Include Display Names
+            use_account_precision: Adaptive Use Account Precision
+            use_actual_value: Adaptive Use Actual Value
+
+        Returns:
+            ModeledSheetQuery object
+
+        """
+        return ModeledSheetQuery(
+            self.__xml_api,
+            version_name,
+            sheet_name,
+            is_assumption_sheet=is_assumption_sheet,
+            include_all_columns=include_all_columns,
+            get_all_rows=get_all_rows,
+            use_numeric_ids=use_numeric_ids,
+            display_name_enabled=display_name_enabled,
+            include_codes=include_codes,
+            include_names=include_names,
+            include_display_names=include_display_names,
+            use_account_precision=use_account_precision,
+            use_actual_value=use_actual_value,
+        )
 
     def _create_dimension_element(self, dimension: Dimension) -> ET.Element:
         if dimension.name is None:
@@ -1040,21 +2234,20 @@ class DataService:
                 for period in column_headers
                 if not (period.endswith((" Name", " Code")))
             ]
+            base_columns: list[str] = []
+            for column in column_headers:
+                if column in period_columns:
+                    break
+                base_columns.append(column)
             parsed_data: list[dict[str, str | int | float]] = []
+            append = parsed_data.append
             for data_row in data:
+                base_row = {column: data_row[column] for column in base_columns}
                 for period in period_columns:
-                    row: dict[str, str | int | float] = {}
-                    for column in column_headers:
-                        if column in period_columns:
-                            break
-                        row[column] = data_row[column]
+                    row: dict[str, str | int | float] = base_row.copy()
                     row["Period Code"] = period
-                    try:
-                        row["Amount"] = int(data_row[period])
-                    except ValueError:
-                        row["Amount"] = float(data_row[period])
-
-                    parsed_data.append(row)
+                    row["Amount"] = _to_number(data_row[period])
+                    append(row)
             return parsed_data
 
         return data
@@ -1095,37 +2288,24 @@ class DataService:
             List of rows of data
 
         """
-        version_element = ET.Element("version", attrib={"name": version_name})
-        modeled_sheet_element = ET.Element(
-            "modeled-sheet",
-            attrib={
-                "name": sheet_name,
-                "isGlobal": str(bool_to_str_true_false(is_assumption_sheet)),
-                "includeAllColumns": str(bool_to_str_true_false(include_all_columns)),
-                "isGetAllRows": str(bool_to_str_true_false(get_all_rows)),
-                "useNumericIDs": str(bool_to_str_true_false(use_numeric_ids)),
-                "diplsayNameEnabled": str(bool_to_str_true_false(display_name_enabled)),
-                "includeCodes": str(bool_to_str_true_false(include_codes)),
-                "includeNames": str(bool_to_str_true_false(include_names)),
-                "includeDisplayNames": str(
-                    bool_to_str_true_false(include_display_names),
-                ),
-                "useAccountPrecision": str(
-                    bool_to_str_true_false(use_account_precision),
-                ),
-                "useActualValue": str(bool_to_str_true_false(use_actual_value)),
-            },
+        query = self.query_modeled_sheet(
+            version_name,
+            sheet_name,
+            is_assumption_sheet=is_assumption_sheet,
+            include_all_columns=include_all_columns,
+            get_all_rows=get_all_rows,
+            use_numeric_ids=use_numeric_ids,
+            display_name_enabled=display_name_enabled,
+            include_codes=include_codes,
+            include_names=include_names,
+            include_display_names=include_display_names,
+            use_account_precision=use_account_precision,
+            use_actual_value=use_actual_value,
         )
-
-        response = self.__xml_api.make_xml_request(
-            method="exportConfigurableModelData",
-            payload=[version_element, modeled_sheet_element],
-        )
-        data = response.find("output/data")
+        text = query._export()  # NOQA: SLF001
         sheet_data: list[dict[str, str | int | float | datetime]] = []
-        if data is not None and data.text is not None:
-            rows = StringIO(data.text.strip("\n"))
-            csv_reader = DictReader(rows, lineterminator="\n")
+        if text is not None:
+            csv_reader = DictReader(StringIO(text), lineterminator="\n")
             sheet_data = list(csv_reader)
 
         return sheet_data
@@ -34,6 +34,7 @@ class DimensionValueService:
         *,
         attributes: bool = True,
         display_name_enabled: bool = True,
+        lazy: bool = False,
     ) -> MetadataList[DimensionValue]:
         """Retrieve all Dimension Values from Adaptive.
 
@@ -41,6 +42,7 @@ class DimensionValueService:
             dimension: Adaptive Dimension
             attributes: Adaptive Attributes
             display_name_enabled: Adaptive Display Name Enabled
+            lazy: Convert fields other than id, code, and name on first access
 
         Returns:
             adaptive Dimension Values
@@ -60,7 +62,77 @@ class DimensionValueService:
             method="exportDimensions",
             payload=include,
         )
-        return MetadataList[DimensionValue](DimensionValue.from_xml(xml=response))
+        with self.__xml_api.instrumentation.span(
+            "from_xml", model="DimensionValue"
+        ) as span:
+            members = MetadataList[DimensionValue](
+                DimensionValue.from_xml(xml=response, lazy=lazy)
+            )
+            span.attributes["rows"] = len(members)
+        return members
+
+    def get_all_many(
+        self,
+        dimensions: Sequence[Dimension | str | int],
+        *,
+        attributes: bool = True,
+        display_name_enabled: bool = True,
+        lazy: bool = False,
+    ) -> dict[str, MetadataList[DimensionValue]]:
+        """Retrieve all Dimension Values of several Dimensions from Adaptive.
+
+        The Dimensions are resolved with a single export of the Dimension
+        list, and the Dimension Values of all of them are retrieved with a
+        single export, instead of two round trips per Dimension.
+
+        Args:
+            dimensions: Adaptive Dimensions
+            attributes: Adaptive Attributes
+            display_name_enabled: Adaptive Display Name Enabled
+            lazy: Convert fields other than id, code, and name on first access
+
+        Returns:
+            adaptive Dimension Values of each Dimension, by Dimension name
+
+        """
+        if not dimensions:
+            return {}
+        all_dimensions = self.__get_dimensions()
+        found_dimensions = {
+            found.id: found
+            for found in (
+                self.__match_dimension(all_dimensions, dimension)
+                for dimension in dimensions
+            )
+        }
+        include = ET.Element(
+            "include",
+            attrib={
+                "dimensionIDs": ",".join(str(x) for x in found_dimensions),
+                "attributes": str(bool_to_str_true_false(attributes)),
+                "displayNameEnabled": str(bool_to_str_true_false(display_name_enabled)),
+            },
+        )
+
+        response = self.__xml_api.make_xml_request(
+            method="exportDimensions",
+            payload=include,
+        )
+        dimension_values: dict[str, MetadataList[DimensionValue]] = {
+            found.name or str(found.id): MetadataList[DimensionValue]()
+            for found in found_dimensions.values()
+        }
+        with self.__xml_api.instrumentation.span(
+            "from_xml", model="DimensionValue"
+        ) as span:
+            for dimension_element in response.iter("dimension"):
+                found = found_dimensions.get(int(dimension_element.get("id", "0")))
+                if found is not None:
+                    dimension_values[found.name or str(found.id)] = (
+                        DimensionValue.from_xml(xml=dimension_element, lazy=lazy)
+                    )
+            span.attributes["rows"] = sum(len(x) for x in dimension_values.values())
+        return dimension_values
 
     def preview_update(
         self,
@@ -103,20 +175,18 @@ class DimensionValueService:
         update_dimension = update_dimensions.find("dimension")
         if update_dimension is None:
             raise ValueError
-        update_dimension.extend(DimensionValue.to_xml("update", dimension_values))
+        with self.__xml_api.instrumentation.span(
+            "to_xml",
+            model="DimensionValue",
+            rows=len(dimension_values),
+        ):
+            update_dimension.extend(DimensionValue.to_xml("update", dimension_values))
         return "updateDimensions", update_dimensions
 
-    def __find_dimension(self, dimension: Dimension | int | str) -> Dimension:  # NOQA: PLR0912 C901
-        search_dimension = None
-        if isinstance(dimension, Dimension):
-            search_dimension = dimension
-        elif isinstance(dimension, int):
-            search_dimension = Dimension(id=dimension)
-        elif isinstance(dimension, str):
-            search_dimension = Dimension(code=dimension, name=dimension)
-        else:
-            raise TypeError
+    def __find_dimension(self, dimension: Dimension | int | str) -> Dimension:
+        return self.__match_dimension(self.__get_dimensions(), dimension)
 
+    def __get_dimensions(self) -> MetadataList[Dimension]:
         dimensions_include = ET.Element(
             "include",
             attrib={
@@ -129,10 +199,25 @@ class DimensionValueService:
             method="exportDimensions",
             payload=dimensions_include,
         )
-        all_dimensions = MetadataList[Dimension](
+        return MetadataList[Dimension](
             Dimension.from_xml(xml=dimensions_response),
         )
 
+    def __match_dimension(  # NOQA: PLR0912 C901
+        self,
+        all_dimensions: MetadataList[Dimension],
+        dimension: Dimension | int | str,
+    ) -> Dimension:
+        search_dimension = None
+        if isinstance(dimension, Dimension):
+            search_dimension = dimension
+        elif isinstance(dimension, int):
+            search_dimension = Dimension(id=dimension)
+        elif isinstance(dimension, str):
+            search_dimension = Dimension(code=dimension, name=dimension)
+        else:
+            raise TypeError
+
         found_dimension = None
         if search_dimension.id is not None and search_dimension.id != 0:
             for dim in all_dimensions:
@@ -144,7 +229,7 @@ class DimensionValueService:
                 if dim.code == search_dimension.code:
                     found_dimension = dim
                     break
-            if search_dimension is None:
+            if found_dimension is None:
                 for dim in all_dimensions:
                     if dim.name == search_dimension.name:
                         found_dimension = dim
@@ -58,7 +58,10 @@ class DimensionService:
             method="exportDimensions",
             payload=include,
         )
-        return MetadataList[Dimension](Dimension.from_xml(xml=response))
+        with self.__xml_api.instrumentation.span("from_xml", model="Dimension") as span:
+            members = MetadataList[Dimension](Dimension.from_xml(xml=response))
+            span.attributes["rows"] = len(members)
+        return members
 
     def preview_update(
         self,
@@ -76,7 +79,12 @@ class DimensionService:
             XML API body
 
         """
-        updated_dimensions = Dimension.to_xml("update", dimensions)
+        with self.__xml_api.instrumentation.span(
+            "to_xml",
+            model="Dimension",
+            rows=len(dimensions),
+        ):
+            updated_dimensions = Dimension.to_xml("update", dimensions)
         return self.__xml_api.preview_xml_request(
             method="importDimensions",
             payload=updated_dimensions,
@@ -143,7 +151,10 @@ class DimensionService:
             method="exportDimensions",
             payload=include,
         )
-        return MetadataList[Dimension](Dimension.from_xml(xml=response))
+        with self.__xml_api.instrumentation.span("from_xml", model="Dimension") as span:
+            members = MetadataList[Dimension](Dimension.from_xml(xml=response))
+            span.attributes["rows"] = len(members)
+        return members
 
     def from_json(self, data: str) -> MetadataList[Dimension]:
         """Convert JSON to MetadataList of Dimensions.
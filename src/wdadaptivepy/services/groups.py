@@ -34,7 +34,10 @@ class GroupService:
 
         """
         response = self.__xml_api.make_xml_request(method="exportGroups", payload=None)
-        return MetadataList[Group](Group.from_xml(xml=response))
+        with self.__xml_api.instrumentation.span("from_xml", model="Group") as span:
+            members = MetadataList[Group](Group.from_xml(xml=response))
+            span.attributes["rows"] = len(members)
+        return members
 
     def preview_update(
         self,
@@ -52,7 +55,12 @@ class GroupService:
            XML API body
 
         """
-        updated_groups = Group.to_xml("update", groups)
+        with self.__xml_api.instrumentation.span(
+            "to_xml",
+            model="Group",
+            rows=len(groups),
+        ):
+            updated_groups = Group.to_xml("update", groups)
         return self.__xml_api.preview_xml_request(
             method="importGroups",
             payload=updated_groups,
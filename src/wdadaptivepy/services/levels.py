@@ -48,7 +48,10 @@ class LevelService:
             method="exportLevels",
             payload=include,
         )
-        return MetadataList[Level](Level.from_xml(xml=response))
+        with self.__xml_api.instrumentation.span("from_xml", model="Level") as span:
+            members = MetadataList[Level](Level.from_xml(xml=response))
+            span.attributes["rows"] = len(members)
+        return members
 
     def preview_update(
         self,
@@ -66,7 +69,12 @@ class LevelService:
             XML API body
 
         """
-        updated_levels = Level.to_xml("update", levels)
+        with self.__xml_api.instrumentation.span(
+            "to_xml",
+            model="Level",
+            rows=len(levels),
+        ):
+            updated_levels = Level.to_xml("update", levels)
         return self.__xml_api.preview_xml_request(
             method="importLevels",
             payload=updated_levels,
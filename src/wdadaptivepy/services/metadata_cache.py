@@ -0,0 +1,383 @@
+"""wdadaptivepy cache of Adaptive metadata used to plan and validate queries."""
+
+from collections.abc import Callable, Sequence
+from threading import Lock
+from typing import Any, TypeVar
+from xml.etree import ElementTree as ET
+
+from wdadaptivepy.connectors.xml_api.single_flight import SingleFlight
+from wdadaptivepy.connectors.xml_api.xml_api import XMLApi
+from wdadaptivepy.models.account import Account
+from wdadaptivepy.models.base import BaseMetadata
+from wdadaptivepy.models.calendar import Calendar
+from wdadaptivepy.models.dimension import Dimension
+from wdadaptivepy.models.dimension_value import DimensionValue
+from wdadaptivepy.models.level import Level
+from wdadaptivepy.models.list import MetadataList
+from wdadaptivepy.models.time import Period, Stratum, Time
+from wdadaptivepy.models.version import Version
+
+T = TypeVar("T")
+M = TypeVar("M", bound=BaseMetadata)
+
+
+class MetadataCache:
+    """Retrieve metadata from Adaptive once and look members up locally.
+
+    Each kind of metadata is retrieved on first use and kept until cleared,
+    so data queries can be validated and estimated without a round trip.
+
+    Refreshing marks the cached metadata as stale instead of forgetting it.
+    The next use of each kind retrieves it again, but when the response is
+    identical to the cached one (compared by SHA-256 digest) the cached
+    members are kept without parsing the response, and their lookup indexes
+    are reused. `hits` and `misses` count the stale kinds found unchanged
+    and changed.
+
+    The cache can be shared between threads. Threads needing the same
+    metadata at once share a single retrieval, while different kinds of
+    metadata are retrieved concurrently.
+
+    Attributes:
+        hits: Number of refreshed kinds of metadata found unchanged
+        misses: Number of refreshed kinds of metadata found changed
+
+    """
+
+    def __init__(self, xml_api: XMLApi) -> None:
+        """Initialize MetadataCache.
+
+        Args:
+            xml_api: wdadaptivepy XMLApi
+
+        """
+        self.__xml_api = xml_api
+        self.__lock = Lock()
+        self.__flights: SingleFlight[Any] = SingleFlight()
+        self.__generation = 0
+        self.__loaded: dict[str, Any] = {}
+        self.__digests: dict[str, str] = {}
+        self.__stale: dict[str, tuple[str, Any]] = {}
+        self.__indexes: dict[str, tuple[Sequence[Any], dict[Any, Any]]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def clear(self) -> None:
+        """Forget all cached metadata, so it is retrieved again on next use."""
+        with self.__lock:
+            self.__generation += 1
+            self.__loaded = {}
+            self.__digests = {}
+            self.__stale = {}
+            self.__indexes = {}
+
+    def refresh(self) -> None:
+        """Mark all cached metadata as stale, so it is checked on next use.
+
+        Stale metadata is retrieved again on next use and kept if Adaptive
+        returns an identical response.
+        """
+        with self.__lock:
+            self.__generation += 1
+            for key, value in self.__loaded.items():
+                self.__stale[key] = (self.__digests[key], value)
+            self.__loaded = {}
+
+    def __load(
+        self,
+        key: str,
+        method: str,
+        payload: ET.Element,
+        parse: Callable[[ET.Element], T],
+    ) -> T:
+        """Get cached metadata, retrieving it once for all waiting threads.
+
+        Stale metadata is kept when the response is unchanged. Retrievals
+        started before a clear or refresh are returned to their callers but
+        not cached.
+        """
+        with self.__lock:
+            if key in self.__loaded:
+                return self.__loaded[key]
+            generation = self.__generation
+            stale = self.__stale.get(key)
+
+        def fill() -> T:
+            with self.__xml_api.instrumentation.span(
+                "metadata",
+                kind=key,
+                stale=stale is not None,
+            ) as span:
+                response, digest = self.__xml_api.make_xml_request_if_changed(
+                    method,
+                    payload,
+                    stale[0] if stale is not None else None,
+                )
+                span.attributes["reused"] = response is None
+            value = parse(response) if response is not None else stale[1]  # pyright: ignore[reportOptionalSubscript]
+            with self.__lock:
+                if stale is not None:
+                    if response is None:
+                        self.hits += 1
+                    else:
+                        self.misses += 1
+                if generation == self.__generation:
+                    self.__loaded[key] = value
+                    self.__digests[key] = digest
+                    self.__stale.pop(key, None)
+            return value
+
+        return self.__flights.do((key, generation), fill)
+
+    def __members(self, model: type[M], response: ET.Element) -> MetadataList[M]:
+        with self.__xml_api.instrumentation.span(
+            "from_xml",
+            model=model.__name__,
+        ) as span:
+            members = model.from_xml(xml=response)
+            span.attributes["rows"] = len(members)
+        return members
+
+    def accounts(self) -> MetadataList[Account]:
+        """Get all Accounts.
+
+        Returns:
+            wdadaptivepy Accounts
+
+        """
+        return self.__load(
+            "accounts",
+            "exportAccounts",
+            ET.Element(
+                "include",
+                attrib={
+                    "attributes": "false",
+                    "include_attribute_value_names": "true",
+                    "include_attribute_value_display_names": "true",
+                },
+            ),
+            lambda response: self.__members(Account, response),
+        )
+
+    def levels(self) -> MetadataList[Level]:
+        """Get all Levels.
+
+        Returns:
+            wdadaptivepy Levels
+
+        """
+        return self.__load(
+            "levels",
+            "exportLevels",
+            ET.Element("include", attrib={"displayNameEnabled": "true"}),
+            lambda response: self.__members(Level, response),
+        )
+
+    def calendar(self) -> Calendar:
+        """Get the calendar of all Periods and Strata.
+
+        Returns:
+            wdadaptivepy Calendar
+
+        """
+        return self.__load(
+            "calendar",
+            "exportTime",
+            ET.Element(
+                "options",
+                attrib={"includeAllLocales": "0", "includeLegacyInformation": "0"},
+            ),
+            lambda response: Calendar.from_time(self.__members(Time, response)),
+        )
+
+    def periods(self, stratum: Stratum | str | None = None) -> list[Period]:
+        """Get the Periods of a Stratum in date order.
+
+        Args:
+            stratum: Stratum (or Stratum code) of the Periods (default Stratum
+                if None)
+
+        Returns:
+            wdadaptivepy Periods
+
+        """
+        return self.calendar().periods(stratum)
+
+    def strata(self) -> list[Stratum]:
+        """Get all Strata.
+
+        Returns:
+            wdadaptivepy Strata
+
+        """
+        return self.calendar().strata
+
+    def versions(self) -> MetadataList[Version]:
+        """Get all Versions.
+
+        Returns:
+            wdadaptivepy Versions
+
+        """
+        return self.__load(
+            "versions",
+            "exportVersions",
+            ET.Element(
+                "include",
+                attrib={"scenarios": "false", "currencyVersions": "false"},
+            ),
+            lambda response: self.__members(Version, response),
+        )
+
+    def dimensions(self) -> MetadataList[Dimension]:
+        """Get all Dimensions (without their Dimension Values).
+
+        Returns:
+            wdadaptivepy Dimensions
+
+        """
+        return self.__load(
+            "dimensions",
+            "exportDimensions",
+            ET.Element(
+                "include",
+                attrib={
+                    "attributes": "false",
+                    "dimensionValues": "false",
+                    "displayNameEnabled": "true",
+                },
+            ),
+            lambda response: self.__members(Dimension, response),
+        )
+
+    def dimension_values(self, dimension_name: str) -> MetadataList[DimensionValue]:
+        """Get all Dimension Values of a Dimension.
+
+        Args:
+            dimension_name: Name of the Dimension
+
+        Returns:
+            wdadaptivepy Dimension Values
+
+        Raises:
+            KeyError: Unknown Dimension
+
+        """
+        dimension = self.dimensions().get_member(name=dimension_name)
+        if dimension is None:
+            raise KeyError(dimension_name)
+        return self.__load(
+            f"dimension_values:{dimension_name}",
+            "exportDimensions",
+            ET.Element(
+                "include",
+                attrib={
+                    "dimensionIDs": str(dimension.id),
+                    "attributes": "false",
+                    "displayNameEnabled": "true",
+                },
+            ),
+            lambda response: self.__members(DimensionValue, response),
+        )
+
+    def __index(
+        self,
+        key: str,
+        members: Sequence[Any],
+        attribute: str,
+    ) -> dict[Any, Any]:
+        with self.__lock:
+            indexed = self.__indexes.get(key)
+            if indexed is not None and indexed[0] is members:
+                return indexed[1]
+            index = {}
+            for member in members:
+                value = getattr(member, attribute, None)
+                if value is not None:
+                    index.setdefault(value, member)
+            self.__indexes[key] = (members, index)
+            return index
+
+    def account(self, code: str) -> Account | None:
+        """Look up an Account by code.
+
+        Args:
+            code: Account code
+
+        Returns:
+            wdadaptivepy Account, or None if unknown
+
+        """
+        return self.__index("account", self.accounts(), "code").get(code)
+
+    def level(self, code: str) -> Level | None:
+        """Look up a Level by code.
+
+        Args:
+            code: Level code
+
+        Returns:
+            wdadaptivepy Level, or None if unknown
+
+        """
+        return self.__index("level", self.levels(), "code").get(code)
+
+    def period(self, code: str) -> Period | None:
+        """Look up a Period by code.
+
+        Args:
+            code: Period code
+
+        Returns:
+            wdadaptivepy Period, or None if unknown
+
+        """
+        return self.calendar().period(code)
+
+    def stratum(self, code: str) -> Stratum | None:
+        """Look up a Stratum by code.
+
+        Args:
+            code: Stratum code
+
+        Returns:
+            wdadaptivepy Stratum, or None if unknown
+
+        """
+        return self.calendar().stratum(code)
+
+    def version(self, name: str) -> Version | None:
+        """Look up a Version by name.
+
+        Args:
+            name: Version name
+
+        Returns:
+            wdadaptivepy Version, or None if unknown
+
+        """
+        return self.__index("version", self.versions(), "name").get(name)
+
+    def dimension_value(
+        self,
+        dimension_name: str,
+        code: str | None = None,
+        value_id: int | None = None,
+    ) -> DimensionValue | None:
+        """Look up a Dimension Value by code or ID.
+
+        Args:
+            dimension_name: Name of the Dimension
+            code: Dimension Value code
+            value_id: Dimension Value ID
+
+        Returns:
+            wdadaptivepy Dimension Value, or None if unknown
+
+        """
+        values = self.dimension_values(dimension_name)
+        if value_id is not None:
+            index = self.__index(f"dimension:{dimension_name}:id", values, "id")
+            return index.get(value_id)
+        index = self.__index(f"dimension:{dimension_name}:code", values, "code")
+        return index.get(code)
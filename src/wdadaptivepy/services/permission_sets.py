@@ -37,7 +37,12 @@ class PermissionSetService:
             method="exportPermissionSets",
             payload=None,
         )
-        return MetadataList[PermissionSet](PermissionSet.from_xml(xml=response))
+        with self.__xml_api.instrumentation.span(
+            "from_xml", model="PermissionSet"
+        ) as span:
+            members = MetadataList[PermissionSet](PermissionSet.from_xml(xml=response))
+            span.attributes["rows"] = len(members)
+        return members
 
     def preview_update(
         self,
@@ -55,7 +60,12 @@ class PermissionSetService:
             XML API body
 
         """
-        updated_permission_sets = PermissionSet.to_xml("update", permission_sets)
+        with self.__xml_api.instrumentation.span(
+            "to_xml",
+            model="PermissionSet",
+            rows=len(permission_sets),
+        ):
+            updated_permission_sets = PermissionSet.to_xml("update", permission_sets)
         return self.__xml_api.preview_xml_request(
             method="importPermissionSets",
             payload=updated_permission_sets,
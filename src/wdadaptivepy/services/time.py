@@ -5,6 +5,7 @@ from xml.etree import ElementTree as ET
 
 from wdadaptivepy.connectors.xml_api.xml_api import XMLApi
 from wdadaptivepy.models.base import bool_to_str_one_zero
+from wdadaptivepy.models.calendar import Calendar
 from wdadaptivepy.models.list import MetadataList
 from wdadaptivepy.models.time import Period, Stratum, Time
 
@@ -58,7 +59,19 @@ class TimeService:
         )
 
         response = self.__xml_api.make_xml_request(method="exportTime", payload=options)
-        return MetadataList[Time](Time.from_xml(xml=response))
+        with self.__xml_api.instrumentation.span("from_xml", model="Time") as span:
+            members = MetadataList[Time](Time.from_xml(xml=response))
+            span.attributes["rows"] = len(members)
+        return members
+
+    def get_calendar(self) -> Calendar:
+        """Retrieve all Time from Adaptive as a Calendar for fast Period lookups.
+
+        Returns:
+            wdadaptivepy Calendar
+
+        """
+        return Calendar.from_time(self.get_all())
 
     def preview_update(
         self,
@@ -76,7 +89,12 @@ class TimeService:
             XML API body
 
         """
-        updated_times = Time.to_xml("update", times)
+        with self.__xml_api.instrumentation.span(
+            "to_xml",
+            model="Time",
+            rows=len(times),
+        ):
+            updated_times = Time.to_xml("update", times)
         return self.__xml_api.preview_xml_request(
             method="importTime",
             payload=updated_times,
@@ -32,12 +32,14 @@ class UserService:
         *,
         groups: bool = True,
         owned_levels: bool = True,
+        lazy: bool = False,
     ) -> MetadataList[User]:
         """Retrieve all Users from Adaptive.
 
         Args:
             groups: Adaptive Groups
             owned_levels: Adaptive Owned Levels
+            lazy: Convert fields other than id, code, and name on first access
 
         Returns:
             adaptive Users
@@ -55,7 +57,10 @@ class UserService:
             method="exportUsers",
             payload=include,
         )
-        return MetadataList[User](User.from_xml(xml=response))
+        with self.__xml_api.instrumentation.span("from_xml", model="User") as span:
+            members = MetadataList[User](User.from_xml(xml=response, lazy=lazy))
+            span.attributes["rows"] = len(members)
+        return members
 
     def preview_update(
         self,
@@ -73,7 +78,12 @@ class UserService:
             XML API body
 
         """
-        updated_users = User.to_xml("update", users)
+        with self.__xml_api.instrumentation.span(
+            "to_xml",
+            model="User",
+            rows=len(users),
+        ):
+            updated_users = User.to_xml("update", users)
         return self.__xml_api.preview_xml_request(
             method="importUsers",
             payload=updated_users,
@@ -55,7 +55,10 @@ class VersionService:
             method="exportVersions",
             payload=include,
         )
-        return MetadataList[Version](Version.from_xml(xml=response))
+        with self.__xml_api.instrumentation.span("from_xml", model="Version") as span:
+            members = MetadataList[Version](Version.from_xml(xml=response))
+            span.attributes["rows"] = len(members)
+        return members
 
     def preview_update(
         self,
@@ -73,7 +76,12 @@ class VersionService:
             XML API body
 
         """
-        updated_versions = Version.to_xml("update", versions)
+        with self.__xml_api.instrumentation.span(
+            "to_xml",
+            model="Version",
+            rows=len(versions),
+        ):
+            updated_versions = Version.to_xml("update", versions)
         return self.__xml_api.preview_xml_request(
             method="importVersions",
             payload=updated_versions,
@@ -0,0 +1,7 @@
+"""wdadaptivepy local stores of exported Adaptive data."""
+
+from wdadaptivepy.stores.base import DataStore
+from wdadaptivepy.stores.memory import MemoryDataStore
+from wdadaptivepy.stores.sqlite import SQLiteDataStore
+
+__all__ = ["DataStore", "MemoryDataStore", "SQLiteDataStore"]
@@ -0,0 +1,33 @@
+"""wdadaptivepy interface of local stores of exported data."""
+
+from typing import Protocol
+
+from wdadaptivepy.models.data_table import DataTable
+
+
+class DataStore(Protocol):
+    """Local store of exported data keyed by Version and query fingerprint."""
+
+    def load(self, version: str, fingerprint: str) -> DataTable | None:
+        """Load previously stored data.
+
+        Args:
+            version: Name of the Version
+            fingerprint: Fingerprint of the DataQuery (see DataQuery.fingerprint)
+
+        Returns:
+            Stored data, or None if nothing is stored
+
+        """
+        ...
+
+    def save(self, version: str, fingerprint: str, table: DataTable) -> None:
+        """Store data, replacing any previously stored data.
+
+        Args:
+            version: Name of the Version
+            fingerprint: Fingerprint of the DataQuery (see DataQuery.fingerprint)
+            table: Data to store
+
+        """
+        ...
@@ -0,0 +1,40 @@
+"""wdadaptivepy in-memory store of exported data."""
+
+from threading import Lock
+
+from wdadaptivepy.models.data_table import DataTable
+
+
+class MemoryDataStore:
+    """Keep exported data in memory for the life of the process."""
+
+    def __init__(self) -> None:
+        """Initialize MemoryDataStore."""
+        self.__tables: dict[tuple[str, str], DataTable] = {}
+        self.__lock = Lock()
+
+    def load(self, version: str, fingerprint: str) -> DataTable | None:
+        """Load previously stored data.
+
+        Args:
+            version: Name of the Version
+            fingerprint: Fingerprint of the DataQuery
+
+        Returns:
+            Stored data, or None if nothing is stored
+
+        """
+        with self.__lock:
+            return self.__tables.get((version, fingerprint))
+
+    def save(self, version: str, fingerprint: str, table: DataTable) -> None:
+        """Store data, replacing any previously stored data.
+
+        Args:
+            version: Name of the Version
+            fingerprint: Fingerprint of the DataQuery
+            table: Data to store
+
+        """
+        with self.__lock:
+            self.__tables[(version, fingerprint)] = table
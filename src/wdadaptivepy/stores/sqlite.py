@@ -0,0 +1,368 @@
+"""wdadaptivepy SQLite store of exported data and metadata."""
+
+import json
+import sqlite3
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import fields
+from datetime import datetime
+from math import isnan
+from pathlib import Path
+from threading import Lock
+from typing import Any
+
+from wdadaptivepy.models.base import BaseMetadata
+from wdadaptivepy.models.data_table import DataTable
+
+PERIOD_COLUMN = "Period Code"
+AMOUNT_COLUMN = "Amount"
+VERSION_COLUMN = "Version"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS exports (
+    id INTEGER PRIMARY KEY,
+    version TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    base_columns TEXT NOT NULL,
+    periods TEXT NOT NULL,
+    UNIQUE (version, fingerprint)
+);
+CREATE TABLE IF NOT EXISTS cells (
+    export_id INTEGER NOT NULL REFERENCES exports (id) ON DELETE CASCADE,
+    row_id INTEGER NOT NULL,
+    "Period Code" TEXT NOT NULL,
+    "Amount" REAL
+);
+CREATE INDEX IF NOT EXISTS cells_export ON cells (export_id, row_id);
+CREATE INDEX IF NOT EXISTS cells_period ON cells ("Period Code");
+CREATE TABLE IF NOT EXISTS metadata (
+    kind TEXT NOT NULL,
+    id INTEGER,
+    code TEXT,
+    name TEXT,
+    parent_id INTEGER,
+    attributes TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS metadata_code ON metadata (kind, code);
+CREATE INDEX IF NOT EXISTS metadata_name ON metadata (kind, name);
+CREATE INDEX IF NOT EXISTS metadata_parent ON metadata (kind, parent_id);
+"""
+
+INDEXED_COLUMNS = ("Account Code", "Level Code", "Account Name", "Level Name")
+
+
+def _quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _scalar_attributes(member: BaseMetadata) -> dict[str, Any]:
+    attributes: dict[str, Any] = {}
+    for field in fields(member):  # pyright: ignore[reportArgumentType]
+        value = getattr(member, field.name, None)
+        if isinstance(value, datetime):
+            attributes[field.name] = value.isoformat()
+        elif value is None or isinstance(value, str | int | float | bool):
+            attributes[field.name] = value
+    return attributes
+
+
+class SQLiteDataStore:
+    """Persist exported data and metadata in an indexed SQLite database.
+
+    Each stored export is kept in long format (one row per cell) with one
+    column per base column, so filters and group-bys on Accounts, Levels,
+    Dimensions, Periods, and Versions are pushed down to SQLite. Metadata
+    hierarchies saved with save_metadata allow filtering on all descendants
+    of a member.
+
+    Implements the DataStore interface used by DataQuery.refresh.
+    """
+
+    def __init__(self, path: Path | str = ":memory:") -> None:
+        """Initialize SQLiteDataStore.
+
+        Args:
+            path: Path of the SQLite database (in memory by default)
+
+        """
+        self.__connection = sqlite3.connect(str(path), check_same_thread=False)
+        self.__connection.execute("PRAGMA foreign_keys = ON")
+        self.__lock = Lock()
+        with self.__lock, self.__connection:
+            self.__connection.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """Close the database."""
+        with self.__lock:
+            self.__connection.close()
+
+    def __columns(self) -> list[str]:
+        return [
+            row[1]
+            for row in self.__connection.execute("PRAGMA table_info(cells)").fetchall()
+        ]
+
+    def __add_columns(self, columns: Sequence[str]) -> None:
+        existing = set(self.__columns())
+        for column in columns:
+            if column in existing:
+                continue
+            self.__connection.execute(f"ALTER TABLE cells ADD COLUMN {_quote(column)}")
+            if column in INDEXED_COLUMNS:
+                index = _quote("cells_" + column.replace(" ", "_").lower())
+                self.__connection.execute(
+                    f"CREATE INDEX IF NOT EXISTS {index} ON cells ({_quote(column)})",
+                )
+
+    def save(self, version: str, fingerprint: str, table: DataTable) -> None:
+        """Store data, replacing any previously stored data.
+
+        Args:
+            version: Name of the Version
+            fingerprint: Fingerprint of the DataQuery
+            table: Data to store
+
+        """
+        cells = table.cells()
+        base_rows = (
+            list(zip(*table.base_values, strict=True)) if table.base_values else []
+        )
+        with self.__lock, self.__connection:
+            self.__connection.execute(
+                "DELETE FROM exports WHERE version = ? AND fingerprint = ?",
+                (version, fingerprint),
+            )
+            export_id = self.__connection.execute(
+                "INSERT INTO exports (version, fingerprint, base_columns, periods) "
+                "VALUES (?, ?, ?, ?)",
+                (
+                    version,
+                    fingerprint,
+                    json.dumps(table.base_columns),
+                    json.dumps(table.periods),
+                ),
+            ).lastrowid
+            self.__add_columns(table.base_columns)
+            columns = ", ".join(
+                _quote(x)
+                for x in [
+                    "export_id",
+                    "row_id",
+                    PERIOD_COLUMN,
+                    AMOUNT_COLUMN,
+                    *table.base_columns,
+                ]
+            )
+            placeholders = ", ".join("?" * (len(table.base_columns) + 4))
+            self.__connection.executemany(
+                f"INSERT INTO cells ({columns}) VALUES ({placeholders})",  # NOQA: S608
+                (
+                    (
+                        export_id,
+                        row,
+                        table.periods[period],
+                        None if isnan(amount) else amount,
+                        *(base_rows[row] if base_rows else ()),
+                    )
+                    for row, period, amount in zip(
+                        cells.row_index,
+                        cells.period_index,
+                        cells.amounts,
+                        strict=True,
+                    )
+                ),
+            )
+
+    def load(self, version: str, fingerprint: str) -> DataTable | None:
+        """Load previously stored data.
+
+        Args:
+            version: Name of the Version
+            fingerprint: Fingerprint of the DataQuery
+
+        Returns:
+            Stored data, or None if nothing is stored
+
+        """
+        with self.__lock:
+            export = self.__connection.execute(
+                "SELECT id, base_columns, periods FROM exports "
+                "WHERE version = ? AND fingerprint = ?",
+                (version, fingerprint),
+            ).fetchone()
+            if export is None:
+                return None
+            export_id, base_json, periods_json = export
+            base_columns: list[str] = json.loads(base_json)
+            periods: list[str] = json.loads(periods_json)
+            columns = ", ".join(
+                _quote(x)
+                for x in ["row_id", PERIOD_COLUMN, AMOUNT_COLUMN, *base_columns]
+            )
+            cursor = self.__connection.execute(
+                f"SELECT {columns} FROM cells WHERE export_id = ? ORDER BY row_id",  # NOQA: S608
+                (export_id,),
+            )
+            base_rows: dict[int, tuple[str, ...]] = {}
+            amounts: dict[str, dict[int, float]] = {period: {} for period in periods}
+            for row_id, period, amount, *base_values in cursor:
+                base_rows.setdefault(row_id, tuple(base_values))
+                if amount is not None:
+                    amounts[period][row_id] = amount
+        row_ids = list(base_rows)
+        return DataTable.from_columns(
+            base_columns,
+            [list(x) for x in zip(*base_rows.values(), strict=True)]
+            if base_rows
+            else [[] for _ in base_columns],
+            periods,
+            [
+                [amounts[period].get(row_id, float("nan")) for row_id in row_ids]
+                for period in periods
+            ],
+        )
+
+    def save_metadata(self, kind: str, members: Sequence[BaseMetadata]) -> None:
+        """Store metadata retrieved through the services, replacing earlier metadata.
+
+        Args:
+            kind: Prefix of the members' base columns, such as "Account",
+                "Level", or a Dimension name
+            members: wdadaptivepy members (including their ancestors)
+
+        """
+        with self.__lock, self.__connection:
+            self.__connection.execute("DELETE FROM metadata WHERE kind = ?", (kind,))
+            self.__connection.executemany(
+                "INSERT INTO metadata (kind, id, code, name, parent_id, attributes) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    (
+                        kind,
+                        getattr(member, "id", None),
+                        getattr(member, "code", None),
+                        getattr(member, "name", None),
+                        getattr(getattr(member, "adaptive_parent", None), "id", None),
+                        json.dumps(_scalar_attributes(member)),
+                    )
+                    for member in members
+                ),
+            )
+
+    def metadata(self, kind: str) -> list[dict[str, Any]]:
+        """Get stored metadata.
+
+        Args:
+            kind: Prefix of the members' base columns
+
+        Returns:
+            Attributes of each stored member
+
+        """
+        with self.__lock:
+            cursor = self.__connection.execute(
+                "SELECT attributes FROM metadata WHERE kind = ? ORDER BY rowid",
+                (kind,),
+            )
+            return [json.loads(attributes) for (attributes,) in cursor]
+
+    def query(  # NOQA: C901
+        self,
+        *,
+        filters: Mapping[str, str | Sequence[str]] | None = None,
+        under: Mapping[str, str] | None = None,
+        group_by: Sequence[str] = (),
+        versions: Sequence[str] | None = None,
+        fingerprint: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Query stored data with filters and group-bys evaluated by SQLite.
+
+        Args:
+            filters: Values to keep of any column ("Account Code", "Period Code",
+                "Version", a Dimension column, ...)
+            under: Member (by code, or name if the data has no codes) whose
+                descendants to keep, keyed by metadata kind such as "Level"
+            group_by: Columns to group by (Amounts are summed); returns
+                every cell if empty
+            versions: Names of the Versions to keep
+            fingerprint: Only query the export with this DataQuery fingerprint
+
+        Returns:
+            Rows of data, each including an Amount
+
+        Raises:
+            KeyError: Unknown column
+
+        """
+        with self.__lock:
+            known = {*self.__columns(), VERSION_COLUMN} - {"export_id", "row_id"}
+
+            def column_sql(column: str) -> str:
+                if column not in known:
+                    raise KeyError(column)
+                if column == VERSION_COLUMN:
+                    return "exports.version"
+                return "cells." + _quote(column)
+
+            where: list[str] = []
+            parameters: list[Any] = []
+            if versions is not None:
+                where.append(f"exports.version IN ({', '.join('?' * len(versions))})")
+                parameters.extend(versions)
+            if fingerprint is not None:
+                where.append("exports.fingerprint = ?")
+                parameters.append(fingerprint)
+            for column, values in (filters or {}).items():
+                value_list = [values] if isinstance(values, str) else list(values)
+                where.append(
+                    f"{column_sql(column)} IN ({', '.join('?' * len(value_list))})",
+                )
+                parameters.extend(value_list)
+            for kind, member in (under or {}).items():
+                by_code = f"{kind} Code" in known
+                column = column_sql(f"{kind} Code" if by_code else f"{kind} Name")
+                key = "code" if by_code else "name"
+                where.append(
+                    f"{column} IN (WITH RECURSIVE tree(id, key) AS ("  # NOQA: S608
+                    f"SELECT id, {key} FROM metadata WHERE kind = ? AND {key} = ? "
+                    f"UNION SELECT metadata.id, metadata.{key} FROM metadata "
+                    "JOIN tree ON metadata.parent_id = tree.id "
+                    "WHERE metadata.kind = ?) SELECT key FROM tree)",
+                )
+                parameters.extend([kind, member, kind])
+
+            if group_by:
+                selected = [f"{column_sql(x)} AS {_quote(x)}" for x in group_by] + [
+                    f'SUM(cells."Amount") AS {_quote(AMOUNT_COLUMN)}'
+                ]
+            else:
+                selected = [
+                    f"{column_sql(x)} AS {_quote(x)}"
+                    for x in sorted(known - {AMOUNT_COLUMN})
+                ] + [f'cells."Amount" AS {_quote(AMOUNT_COLUMN)}']
+            sql = (
+                f"SELECT {', '.join(selected)} FROM cells "  # NOQA: S608
+                "JOIN exports ON exports.id = cells.export_id"
+            )
+            if where:
+                sql += " WHERE " + " AND ".join(where)
+            if group_by:
+                sql += " GROUP BY " + ", ".join(column_sql(x) for x in group_by)
+                sql += " ORDER BY " + ", ".join(column_sql(x) for x in group_by)
+            else:
+                sql += " ORDER BY cells.export_id, cells.row_id"
+            cursor = self.__connection.execute(sql, parameters)
+            names = [description[0] for description in cursor.description]
+            return [dict(zip(names, row, strict=True)) for row in cursor]
+
+    def __iter__(self) -> Iterator[tuple[str, str]]:
+        """Iterate over the stored exports.
+
+        Yields:
+            Version name and DataQuery fingerprint of each stored export
+
+        """
+        with self.__lock:
+            exports = self.__connection.execute(
+                "SELECT version, fingerprint FROM exports ORDER BY id",
+            ).fetchall()
+        yield from exports
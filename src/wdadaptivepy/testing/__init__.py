@@ -0,0 +1,6 @@
+"""wdadaptivepy helpers for testing and benchmarking without an Adaptive tenant."""
+
+from wdadaptivepy.testing.server import FakeAdaptiveServer
+from wdadaptivepy.testing.synthetic import SyntheticTenant
+
+__all__ = ["FakeAdaptiveServer", "SyntheticTenant"]
@@ -0,0 +1,217 @@
+"""Local stand-in for Adaptive's XML API, served through an httpx transport."""
+
+import random
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from xml.etree import ElementTree as ET
+
+import httpx
+
+from wdadaptivepy.testing.synthetic import SyntheticTenant, _response
+
+MethodHandler = Callable[[ET.Element], str]
+
+
+def _failure(key: str, text: str) -> str:
+    response = ET.Element("response", attrib={"success": "false"})
+    messages = ET.SubElement(response, "messages")
+    message = ET.SubElement(messages, "message", attrib={"key": key, "type": "ERROR"})
+    message.text = text
+    return ET.tostring(response, encoding="unicode")
+
+
+@dataclass
+class FakeAdaptiveServer:
+    """Answer Adaptive XML API calls with a SyntheticTenant.
+
+    Plug the server into a connection with its transport:
+
+        server = FakeAdaptiveServer(SyntheticTenant(accounts=10_000))
+        adaptive = AdaptiveConnection(
+            login="login",
+            password="password",
+            transport=server.transport(),
+        )
+
+    exportAccounts, exportLevels, exportDimensions, exportUsers,
+    exportVersions, exportTime, exportData, and exportConfigurableModelData
+    are generated from the tenant; other export calls return an empty output
+    and import, update, create, and delete calls succeed without changing the
+    tenant. Any method can be overridden with `register`.
+
+    Attributes:
+        tenant: Synthetic tenant served by the server
+        login: Required login (any login is accepted if None)
+        password: Required password (any password is accepted if None)
+        data_rows: Number of rows returned by exportData and
+            exportConfigurableModelData
+        latency: Seconds added to every response
+        jitter: Maximum random seconds added on top of the latency
+        requests_per_second: Requests accepted per second before throttling
+        max_concurrent_requests: In-flight requests accepted before throttling
+        error_rate: Probability (0-1) of failing a request
+        error_methods: Methods eligible for injected errors (all if empty)
+        error_status: HTTP status code of injected errors
+        seed: Seed for latency jitter and error injection
+        calls: Number of calls received per method
+
+    """
+
+    tenant: SyntheticTenant = field(default_factory=SyntheticTenant)
+    login: str | None = None
+    password: str | None = None
+    data_rows: int = 1_000
+    latency: float = 0.0
+    jitter: float = 0.0
+    requests_per_second: float | None = None
+    max_concurrent_requests: int | None = None
+    error_rate: float = 0.0
+    error_methods: set[str] = field(default_factory=set)
+    error_status: int = 503
+    seed: int = 0
+    calls: dict[str, int] = field(default_factory=dict, init=False)
+
+    def __post_init__(self) -> None:
+        """Clean up FakeAdaptiveServer instance."""
+        self.__lock = threading.Lock()
+        self.__random = random.Random(self.seed)  # NOQA: S311
+        self.__recent: deque[float] = deque()
+        self.__in_flight = 0
+        self.__handlers: dict[str, MethodHandler] = {
+            "exportAccounts": lambda _: self.tenant.export_accounts(),
+            "exportLevels": lambda _: self.tenant.export_levels(),
+            "exportDimensions": self.__export_dimensions,
+            "exportUsers": lambda _: self.tenant.export_users(),
+            "exportVersions": lambda _: self.tenant.export_versions(),
+            "exportTime": lambda _: self.tenant.export_time(),
+            "exportData": self.__export_data,
+            "exportConfigurableModelData": self.__export_modeled_sheet,
+        }
+
+    def register(self, method: str, handler: MethodHandler) -> None:
+        """Answer an XML API method with a custom handler.
+
+        Args:
+            method: Adaptive XML API name
+            handler: Function receiving the XML call and returning the XML response
+
+        """
+        self.__handlers[method] = handler
+
+    def transport(self) -> httpx.MockTransport:
+        """Create an httpx transport answering requests with this server.
+
+        Returns:
+            httpx transport
+
+        """
+        return httpx.MockTransport(self.handle)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        """Answer a single XML API request.
+
+        Args:
+            request: HTTP request sent by XMLApi
+
+        Returns:
+            HTTP response
+
+        """
+        call = ET.fromstring(request.read())  # NOQA: S314
+        method = call.attrib.get("method", "")
+        with self.__lock:
+            self.calls[method] = self.calls.get(method, 0) + 1
+            throttled = self.__throttled()
+            if not throttled:
+                self.__in_flight += 1
+            fail = self.__random.random() < self.error_rate and (
+                not self.error_methods or method in self.error_methods
+            )
+            delay = self.latency + self.__random.uniform(0, self.jitter)
+        if throttled:
+            return httpx.Response(
+                429,
+                text=_failure("error-too-many-requests", "Too many requests"),
+            )
+        try:
+            if delay > 0:
+                time.sleep(delay)
+            if fail:
+                return httpx.Response(
+                    self.error_status,
+                    text=_failure("error-injected", f"Injected failure of {method}"),
+                )
+            return httpx.Response(200, text=self.__dispatch(method, call))
+        finally:
+            with self.__lock:
+                self.__in_flight -= 1
+
+    def __throttled(self) -> bool:
+        if (
+            self.max_concurrent_requests is not None
+            and self.__in_flight >= self.max_concurrent_requests
+        ):
+            return True
+        if self.requests_per_second is None:
+            return False
+        now = time.monotonic()
+        while self.__recent and now - self.__recent[0] >= 1:
+            self.__recent.popleft()
+        if len(self.__recent) >= self.requests_per_second:
+            return True
+        self.__recent.append(now)
+        return False
+
+    def __dispatch(self, method: str, call: ET.Element) -> str:
+        credentials = call.find("credentials")
+        if credentials is None or (
+            (self.login is not None and credentials.get("login") != self.login)
+            or (
+                self.password is not None
+                and credentials.get("password") != self.password
+            )
+        ):
+            return _failure("error-authentication-failure", "Invalid credentials")
+        handler = self.__handlers.get(method)
+        if handler is not None:
+            return handler(call)
+        if method.startswith("export"):
+            return _response(None)
+        if method.startswith(("import", "update", "create", "delete")):
+            return ET.tostring(
+                ET.Element("response", attrib={"success": "true"}),
+                encoding="unicode",
+            )
+        return _failure("error-unknown-method", f"Unknown method {method}")
+
+    def __export_dimensions(self, call: ET.Element) -> str:
+        include = call.find("include")
+        dimension_ids = None
+        include_values = True
+        if include is not None:
+            if ids := include.get("dimensionIDs"):
+                dimension_ids = [int(x) for x in ids.split(",") if x]
+            include_values = include.get("dimensionValues", "true") == "true"
+        return self.tenant.export_dimensions(
+            dimension_ids,
+            include_values=include_values,
+        )
+
+    def __export_data(self, call: ET.Element) -> str:
+        periods = self.tenant.month_codes()
+        time_span = call.find("filters/timeSpan")
+        if time_span is not None:
+            start = time_span.get("start")
+            end = time_span.get("end")
+            start_index = periods.index(start) if start in periods else 0
+            end_index = periods.index(end) if end in periods else len(periods) - 1
+            periods = periods[start_index : end_index + 1]
+        return self.tenant.export_data(self.data_rows, periods)
+
+    def __export_modeled_sheet(self, call: ET.Element) -> str:
+        levels = call.findall("modeled-sheet/filters/levels/level")
+        level_names = [level.get("name", "") for level in levels] if levels else None
+        return self.tenant.export_modeled_sheet(self.data_rows, level_names)
@@ -0,0 +1,647 @@
+"""Synthetic Adaptive tenants for tests, benchmarks, and load testing."""
+
+import calendar
+import random
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from xml.etree import ElementTree as ET
+
+EXPORT_DATA_BASE_COLUMNS = ("Account Name", "Account Code", "Level Name", "Level Code")
+
+
+def _tree_parents(count: int, branching: int) -> list[int | None]:
+    """Parent index of each node of a complete tree with `count` nodes.
+
+    A branching of 1 produces a single chain, larger branching factors
+    produce wide and shallow hierarchies.
+    """
+    return [None if index == 0 else (index - 1) // branching for index in range(count)]
+
+
+def _nest(
+    root: ET.Element,
+    elements: Sequence[ET.Element],
+    parents: Sequence[int | None],
+) -> None:
+    for element, parent in zip(elements, parents, strict=True):
+        if parent is None:
+            root.append(element)
+        else:
+            elements[parent].append(element)
+
+
+def _leaves(parents: Sequence[int | None]) -> list[int]:
+    has_children = {parent for parent in parents if parent is not None}
+    return [index for index in range(len(parents)) if index not in has_children]
+
+
+def _response(output: ET.Element | None) -> str:
+    response = ET.Element("response", attrib={"success": "true"})
+    output_element = ET.SubElement(response, "output")
+    if output is not None:
+        output_element.append(output)
+    return ET.tostring(response, encoding="unicode")
+
+
+@dataclass
+class SyntheticTenant:
+    """Generate realistic Adaptive XML API responses at a configurable scale.
+
+    Hierarchies are complete trees; a branching factor of 2 produces deep
+    hierarchies, a large branching factor produces wide, shallow ones.
+
+    Attributes:
+        accounts: Number of Accounts
+        account_branching: Children per Account
+        levels: Number of Levels
+        level_branching: Children per Level
+        dimensions: Number of custom Dimensions
+        dimension_values: Number of Dimension Values per Dimension
+        dimension_branching: Children per Dimension Value
+        attributes: Number of Attributes set on each Account, Level, and Dimension Value
+        users: Number of Users
+        versions: Number of Versions
+        start_year: First fiscal year of the calendar
+        years: Number of fiscal years in the calendar
+        seed: Seed for generated amounts
+
+    """
+
+    accounts: int = 200
+    account_branching: int = 5
+    levels: int = 50
+    level_branching: int = 4
+    dimensions: int = 2
+    dimension_values: int = 100
+    dimension_branching: int = 10
+    attributes: int = 2
+    users: int = 50
+    versions: int = 4
+    start_year: int = 2025
+    years: int = 2
+    seed: int = 0
+    __periods: list[dict[str, str]] | None = field(
+        default=None,
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
+    def __attributes_element(self, member_index: int) -> ET.Element | None:
+        if self.attributes == 0:
+            return None
+        attributes = ET.Element("attributes")
+        for attribute_index in range(self.attributes):
+            value_index = member_index % 5
+            ET.SubElement(
+                attributes,
+                "attribute",
+                attrib={
+                    "attributeId": str(attribute_index + 1),
+                    "name": f"Attribute {attribute_index + 1}",
+                    "valueId": str((attribute_index + 1) * 100 + value_index),
+                    "value": f"Value {value_index}",
+                },
+            )
+        return attributes
+
+    def account_codes(self, *, leaves_only: bool = False) -> list[str]:
+        """Codes of the generated Accounts.
+
+        Args:
+            leaves_only: Only include Accounts without children
+
+        Returns:
+            Account codes
+
+        """
+        parents = _tree_parents(self.accounts, self.account_branching)
+        indexes = _leaves(parents) if leaves_only else range(len(parents))
+        return [f"A{index}" for index in indexes]
+
+    def level_codes(self, *, leaves_only: bool = False) -> list[str]:
+        """Codes of the generated Levels.
+
+        Args:
+            leaves_only: Only include Levels without children
+
+        Returns:
+            Level codes
+
+        """
+        parents = _tree_parents(self.levels, self.level_branching)
+        indexes = _leaves(parents) if leaves_only else range(len(parents))
+        return [f"L{index}" for index in indexes]
+
+    def dimension_names(self) -> list[str]:
+        """Names of the generated Dimensions.
+
+        Returns:
+            Dimension names
+
+        """
+        return [f"Dimension {index + 1}" for index in range(self.dimensions)]
+
+    def dimension_value_codes(
+        self,
+        dimension_index: int,
+        *,
+        leaves_only: bool = False,
+    ) -> list[str]:
+        """Codes of the generated Dimension Values of a Dimension.
+
+        Args:
+            dimension_index: Position of the Dimension (starting at 0)
+            leaves_only: Only include Dimension Values without children
+
+        Returns:
+            Dimension Value codes
+
+        """
+        parents = _tree_parents(self.dimension_values, self.dimension_branching)
+        indexes = _leaves(parents) if leaves_only else range(len(parents))
+        return [f"D{dimension_index + 1}V{index}" for index in indexes]
+
+    def export_accounts(self) -> str:
+        """Generate an exportAccounts response.
+
+        Returns:
+            XML response
+
+        """
+        root = ET.Element("accounts", attrib={"seqNo": "1"})
+        parents = _tree_parents(self.accounts, self.account_branching)
+        elements: list[ET.Element] = []
+        for index in range(self.accounts):
+            element = ET.Element(
+                "account",
+                attrib={
+                    "id": str(index + 1),
+                    "code": f"A{index}",
+                    "name": f"Account {index}",
+                    "accountTypeCode": "EXPENSE" if index % 2 else "REVENUE",
+                    "description": f"Synthetic account {index}",
+                    "shortName": "",
+                    "timeStratum": "month",
+                    "displayAs": "CASH",
+                    "isAssumption": "0",
+                    "suppressZeroes": "1",
+                    "isDefaultRoot": "1" if index == 0 else "0",
+                    "decimalPrecision": "2",
+                    "planBy": "DELTA",
+                    "exchangeRateType": "AVG",
+                    "isImportable": "1",
+                    "balanceType": "DEBIT" if index % 3 else "CREDIT",
+                    "dataEntryType": "STANDARD",
+                    "timeRollUp": "LAST" if index % 7 == 0 else "SUM",
+                    "hasSalaryDetail": "0",
+                    "dataPrivacy": "PRIVATE",
+                    "subType": "CUMULATIVE",
+                    "startExpanded": "0",
+                    "isBreakbackEligible": "0",
+                    "levelDimRollup": "SUM",
+                    "enableActuals": "1",
+                    "isGroup": "0",
+                    "isIntercompany": "0",
+                    "isLinked": "0",
+                    "isSystem": "0",
+                },
+            )
+            if (attributes := self.__attributes_element(index)) is not None:
+                element.append(attributes)
+            elements.append(element)
+        _nest(root, elements, parents)
+        return _response(root)
+
+    def export_levels(self) -> str:
+        """Generate an exportLevels response.
+
+        Returns:
+            XML response
+
+        """
+        root = ET.Element("levels", attrib={"seqNo": "1", "displayNameType": "NAME"})
+        parents = _tree_parents(self.levels, self.level_branching)
+        leaves = set(_leaves(parents))
+        elements: list[ET.Element] = []
+        for index in range(self.levels):
+            element = ET.Element(
+                "level",
+                attrib={
+                    "id": str(index + 1),
+                    "code": f"L{index}",
+                    "name": f"Level {index}",
+                    "displayName": f"Level {index}",
+                    "currency": "USD",
+                    "publishCurrency": "USD",
+                    "shortName": "",
+                    "availableStart": f"01/{self.start_year}",
+                    "availableEnd": f"12/{self.start_year + self.years - 1}",
+                    "isImportable": "1",
+                    "workflowStatus": "OPEN",
+                    "isElimination": "0",
+                    "isLinked": "0",
+                    "hasChildren": "0" if index in leaves else "1",
+                    "description": f"Synthetic level {index}",
+                },
+            )
+            if (attributes := self.__attributes_element(index)) is not None:
+                element.append(attributes)
+            elements.append(element)
+        _nest(root, elements, parents)
+        return _response(root)
+
+    def export_dimensions(
+        self,
+        dimension_ids: Sequence[int] | None = None,
+        *,
+        include_values: bool = True,
+    ) -> str:
+        """Generate an exportDimensions response.
+
+        Args:
+            dimension_ids: IDs of the Dimensions to include (defaults to all)
+            include_values: Include the Dimension Values of each Dimension
+
+        Returns:
+            XML response
+
+        """
+        root = ET.Element("dimensions")
+        parents = _tree_parents(self.dimension_values, self.dimension_branching)
+        for dimension_index, name in enumerate(self.dimension_names()):
+            dimension_id = dimension_index + 1
+            if dimension_ids is not None and dimension_id not in dimension_ids:
+                continue
+            dimension = ET.SubElement(
+                root,
+                "dimension",
+                attrib={
+                    "id": str(dimension_id),
+                    "name": name,
+                    "code": f"D{dimension_id}",
+                    "shortName": "",
+                    "autoCreate": "0",
+                    "listDimension": "0",
+                    "keepSorted": "0",
+                    "useOnLevels": "0",
+                    "seqNo": str(dimension_id),
+                },
+            )
+            if not include_values:
+                continue
+            elements: list[ET.Element] = []
+            for index in range(self.dimension_values):
+                element = ET.Element(
+                    "dimensionValue",
+                    attrib={
+                        "id": str(dimension_id * 1_000_000 + index),
+                        "code": f"D{dimension_id}V{index}",
+                        "name": f"{name} Value {index}",
+                        "displayName": f"{name} Value {index}",
+                        "shortName": "",
+                        "description": "",
+                    },
+                )
+                if (attributes := self.__attributes_element(index)) is not None:
+                    element.append(attributes)
+                elements.append(element)
+            _nest(dimension, elements, parents)
+        return _response(root)
+
+    def export_users(self) -> str:
+        """Generate an exportUsers response.
+
+        Returns:
+            XML response
+
+        """
+        root = ET.Element("users", attrib={"seqNo": "1"})
+        created = datetime(self.start_year, 1, 1, 8, 0, 0)  # NOQA: DTZ001
+        for index in range(self.users):
+            user = ET.SubElement(
+                root,
+                "user",
+                attrib={
+                    "id": str(index + 1),
+                    "login": f"user{index}@example.com",
+                    "email": f"user{index}@example.com",
+                    "name": f"User {index}",
+                    "permissionSetIds": "1,2",
+                    "groupIds": "1",
+                    "guid": f"{index:032X}",
+                    "timeZone": "US/Eastern",
+                    "position": "Analyst",
+                    "homepage": "Welcome",
+                    "createdDate": f"{created:%Y-%m-%d %H:%M:%S}.0",
+                    "lastLogin": (
+                        f"{created + timedelta(days=index % 30):%Y-%m-%d %H:%M:%S}.0"
+                    ),
+                    "failedAttempts": "0",
+                    "locked": "false",
+                },
+            )
+            ET.SubElement(
+                user,
+                "subscriptions",
+                attrib={
+                    "nosubscriptions": "0",
+                    "customerNewsLetter": "0",
+                    "customerWebinars": "0",
+                    "educationTraining": "0",
+                    "localEvents": "0",
+                    "partnerNewsLetter": "0",
+                    "partnerWebinars": "0",
+                    "newProductsAndEnhancements": "0",
+                    "surveys": "0",
+                    "systemAlertsAndUpdates": "1",
+                    "userGroups": "0",
+                },
+            )
+        return _response(root)
+
+    def export_versions(self) -> str:
+        """Generate an exportVersions response.
+
+        Returns:
+            XML response
+
+        """
+        root = ET.Element("versions", attrib={"seqNo": "1"})
+        for index, name in enumerate(self.version_names()):
+            ET.SubElement(
+                root,
+                "version",
+                attrib={
+                    "id": str(index + 1),
+                    "name": name,
+                    "shortName": "",
+                    "type": "ACTUALS" if index == 0 else "PLANNING",
+                    "isVirtual": "false",
+                    "description": "",
+                    "isDefaultVersion": "true" if index == 1 else "false",
+                    "isLocked": "false",
+                    "hasAuditTrail": "false",
+                    "isImportable": "1",
+                    "startVer": str(self.start_year),
+                    "endVer": str(self.start_year + self.years - 1),
+                    "completedValuesThru": f"06/{self.start_year}",
+                },
+            )
+        return _response(root)
+
+    def version_names(self) -> list[str]:
+        """Names of the generated Versions.
+
+        Returns:
+            Version names
+
+        """
+        names = ["Actuals", "Budget"]
+        names.extend(f"Forecast {index}" for index in range(1, self.versions - 1))
+        return names[: self.versions]
+
+    def periods(self) -> list[dict[str, str]]:
+        """Attributes of every generated Period, ordered year, quarters, months.
+
+        Returns:
+            Period attributes
+
+        """
+        if self.__periods is not None:
+            return self.__periods
+        periods: list[dict[str, str]] = []
+        for year in range(self.start_year, self.start_year + self.years):
+            periods.append(
+                {
+                    "code": str(year),
+                    "label": f"FY{year}",
+                    "stratumId": "3",
+                    "id": f"{year}3",
+                    "start": f"{year}-01-01",
+                    "end": f"{year + 1}-01-01",
+                },
+            )
+            for quarter in range(1, 5):
+                quarter_end = (
+                    date(year + 1, 1, 1)
+                    if quarter == 4  # NOQA: PLR2004
+                    else date(year, quarter * 3 + 1, 1)
+                )
+                periods.append(
+                    {
+                        "code": f"Q{quarter}-{year}",
+                        "label": f"Q{quarter}-FY{year % 100}",
+                        "stratumId": "2",
+                        "id": f"{year}{quarter}2",
+                        "start": f"{date(year, quarter * 3 - 2, 1)}",
+                        "end": f"{quarter_end}",
+                        "parent": str(year),
+                    },
+                )
+                for month in range(quarter * 3 - 2, quarter * 3 + 1):
+                    month_end = date(year, month, calendar.monthrange(year, month)[1])
+                    periods.append(
+                        {
+                            "code": f"{month:02}/{year}",
+                            "label": f"{calendar.month_abbr[month]}-{year}",
+                            "stratumId": "1",
+                            "id": f"{year}{month:02}1",
+                            "start": f"{date(year, month, 1)}",
+                            "end": f"{month_end + timedelta(days=1)}",
+                            "parent": f"Q{quarter}-{year}",
+                        },
+                    )
+        self.__periods = periods
+        return periods
+
+    def month_codes(self) -> list[str]:
+        """Codes of the generated month Periods.
+
+        Returns:
+            Period codes
+
+        """
+        return [
+            period["code"] for period in self.periods() if period["stratumId"] == "1"
+        ]
+
+    def export_time(self) -> str:
+        """Generate an exportTime response.
+
+        Returns:
+            XML response
+
+        """
+        root = ET.Element("time", attrib={"isCustom": "0", "seqNo": "1"})
+        year = ET.SubElement(
+            root,
+            "stratum",
+            attrib={"code": "year", "label": "Year", "id": "3", "inUse": "1"},
+        )
+        quarter = ET.SubElement(
+            year,
+            "stratum",
+            attrib={"code": "qtr", "label": "Quarter", "id": "2", "inUse": "1"},
+        )
+        ET.SubElement(
+            quarter,
+            "stratum",
+            attrib={
+                "code": "month",
+                "label": "Month",
+                "id": "1",
+                "inUse": "1",
+                "isDefault": "1",
+            },
+        )
+        elements: dict[str, ET.Element] = {}
+        for period in self.periods():
+            attributes = {
+                key: value for key, value in period.items() if key != "parent"
+            }
+            element = ET.Element("period", attrib=attributes)
+            elements[period["code"]] = element
+            parent = period.get("parent")
+            (elements[parent] if parent else root).append(element)
+        return _response(root)
+
+    def iter_export_data_rows(
+        self,
+        rows: int,
+        periods: Sequence[str] | None = None,
+        *,
+        mark_blanks: bool = False,
+    ) -> Iterator[list[str]]:
+        """Generate rows of an exportData CSV, starting with the header.
+
+        Args:
+            rows: Number of data rows
+            periods: Period codes to use as columns (defaults to all months)
+            mark_blanks: Mark some blank cells with "B"
+
+        Yields:
+            CSV header, then CSV rows
+
+        """
+        randomizer = random.Random(self.seed)  # NOQA: S311
+        periods = list(periods) if periods is not None else self.month_codes()
+        accounts = self.account_codes(leaves_only=True)
+        levels = self.level_codes(leaves_only=True)
+        dimensions = [
+            (name, self.dimension_value_codes(index, leaves_only=True))
+            for index, name in enumerate(self.dimension_names())
+        ]
+        header = list(EXPORT_DATA_BASE_COLUMNS)
+        for name, _ in dimensions:
+            header.extend([f"{name} Code", f"{name} Name"])
+        yield header + periods
+        for row_index in range(rows):
+            account = accounts[row_index % len(accounts)]
+            level = levels[(row_index // len(accounts)) % len(levels)]
+            row = [f"Account {account[1:]}", account, f"Level {level[1:]}", level]
+            for dimension_index, (name, codes) in enumerate(dimensions):
+                code = codes[(row_index + dimension_index) % len(codes)]
+                row.extend([code, f"{name} Value {code.rsplit('V', 1)[1]}"])
+            for _ in periods:
+                if mark_blanks and randomizer.random() < 0.05:  # NOQA: PLR2004
+                    row.append("B")
+                elif randomizer.random() < 0.2:  # NOQA: PLR2004
+                    row.append("0")
+                else:
+                    row.append(f"{randomizer.uniform(-10_000, 100_000):.2f}")
+            yield row
+
+    def export_data_csv(
+        self,
+        rows: int,
+        periods: Sequence[str] | None = None,
+        *,
+        mark_blanks: bool = False,
+    ) -> str:
+        """Generate the CSV content of an exportData response.
+
+        Args:
+            rows: Number of data rows
+            periods: Period codes to use as columns (defaults to all months)
+            mark_blanks: Mark some blank cells with "B"
+
+        Returns:
+            CSV text
+
+        """
+        lines = [
+            ",".join(f'"{value}"' if " " in value else value for value in row)
+            for row in self.iter_export_data_rows(
+                rows,
+                periods,
+                mark_blanks=mark_blanks,
+            )
+        ]
+        return "\n".join(lines) + "\n"
+
+    def export_data(
+        self,
+        rows: int,
+        periods: Sequence[str] | None = None,
+        *,
+        mark_blanks: bool = False,
+    ) -> str:
+        """Generate an exportData response.
+
+        Args:
+            rows: Number of data rows
+            periods: Period codes to use as columns (defaults to all months)
+            mark_blanks: Mark some blank cells with "B"
+
+        Returns:
+            XML response
+
+        """
+        csv_text = self.export_data_csv(rows, periods, mark_blanks=mark_blanks)
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?>\n<response success="true">'
+            f"<output><![CDATA[{csv_text}]]></output>"
+            f'<status success="true" rowCountSent="{rows}" /></response>'
+        )
+
+    def export_modeled_sheet(
+        self,
+        rows: int,
+        level_names: Sequence[str] | None = None,
+    ) -> str:
+        """Generate an exportConfigurableModelData response of a personnel sheet.
+
+        Rows are spread over the leaf Levels; each row has text, number, date,
+        and boolean columns, with some blank cells.
+
+        Args:
+            rows: Number of rows across all leaf Levels
+            level_names: Only include the rows of these Levels
+
+        Returns:
+            XML response
+
+        """
+        randomizer = random.Random(self.seed)  # NOQA: S311
+        levels = [f"Level {code[1:]}" for code in self.level_codes(leaves_only=True)]
+        kept = set(level_names) if level_names is not None else None
+        lines = ["Level,Employee ID,Employee Name,Start Date,Salary,Full Time,Notes"]
+        for row_index in range(rows):
+            level = levels[row_index % len(levels)]
+            start = date(self.start_year, 1, 1) + timedelta(days=row_index % 365)
+            salary = f"{randomizer.uniform(40_000, 200_000):.2f}"
+            full_time = "true" if randomizer.random() < 0.8 else "false"  # NOQA: PLR2004
+            notes = "" if row_index % 3 else f'"Hire {row_index}, planned"'
+            if kept is not None and level not in kept:
+                continue
+            lines.append(
+                f"{level},{row_index},Employee {row_index},"
+                f"{start:%m/%d/%Y},{salary},{full_time},{notes}",
+            )
+        csv_text = "\n".join(lines) + "\n"
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?>\n<response success="true">'
+            f"<output><data><![CDATA[{csv_text}]]></data></output></response>"
+        )
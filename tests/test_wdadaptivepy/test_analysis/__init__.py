@@ -0,0 +1 @@
+"""Tests for wdadaptivepy's analysis of exported data."""
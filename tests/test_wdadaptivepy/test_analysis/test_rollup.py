@@ -0,0 +1,107 @@
+"""Tests for wdadaptivepy's RollupEngine."""
+
+import math
+
+from wdadaptivepy.analysis import RollupEngine
+from wdadaptivepy.models import Account, DataTable, Level, Period
+
+BASE_COLUMNS = ["Account Code", "Level Code"]
+
+
+def _accounts() -> list[Account]:
+    net_income = Account(code="NI", name="Net Income", balance_type="CREDIT")
+    revenue = Account(code="REV", name="Revenue", balance_type="CREDIT")
+    expense = Account(
+        code="EXP",
+        name="Expense",
+        balance_type="DEBIT",
+        time_roll_up="SUM",
+    )
+    headcount = Account(code="HC", name="Headcount", time_roll_up="LAST")
+    revenue.set_adaptive_parent(net_income)
+    expense.set_adaptive_parent(net_income)
+    return [net_income, revenue, expense, headcount]
+
+
+def _periods() -> list[Period]:
+    quarter = Period(code="Q1-2025", stratum_id=2)
+    months = [Period(code=f"0{month}/2025", stratum_id=1) for month in (1, 2, 3)]
+    for month in months:
+        month.set_adaptive_parent(quarter)
+    april = Period(code="04/2025", stratum_id=1)
+    second_quarter = Period(code="Q2-2025", stratum_id=2)
+    april.set_adaptive_parent(second_quarter)
+    Period(code="05/2025", stratum_id=1).set_adaptive_parent(second_quarter)
+    return [quarter, *months, second_quarter, april]
+
+
+def _table() -> DataTable:
+    return DataTable.from_columns(
+        BASE_COLUMNS,
+        [["REV", "EXP", "REV", "HC"], ["East", "East", "West", "East"]],
+        ["01/2025", "02/2025", "03/2025", "04/2025"],
+        [
+            [100.0, 30.0, 50.0, 5.0],
+            [100.0, 30.0, math.nan, 6.0],
+            [100.0, 40.0, 50.0, 7.0],
+            [1.0, 1.0, 1.0, 1.0],
+        ],
+    )
+
+
+def _cells(table: DataTable) -> dict[tuple[str, ...], list[float]]:
+    rows = zip(*table.base_values, strict=True)
+    return {
+        row: [table.amounts[period][index] for period in range(len(table.periods))]
+        for index, row in enumerate(rows)
+    }
+
+
+def test_account_rollup_honors_balance_types() -> None:
+    """Test that debit Accounts are subtracted from credit parents."""
+    engine = RollupEngine(accounts=_accounts())
+    cells = _cells(engine.rollup_accounts(_table()))
+
+    assert cells[("NI", "East")][:2] == [70.0, 70.0]
+    assert cells[("NI", "West")][0] == 50.0  # noqa: PLR2004
+    assert math.isnan(cells[("NI", "West")][1])
+    assert cells[("HC", "East")][0] == 5.0  # noqa: PLR2004
+
+
+def test_level_rollup_sums_children() -> None:
+    """Test that Level rollups sum their children."""
+    company = Level(code="Company", name="Company")
+    east = Level(code="East", name="East")
+    west = Level(code="West", name="West")
+    east.set_adaptive_parent(company)
+    west.set_adaptive_parent(company)
+    engine = RollupEngine(levels=[company, east, west])
+    cells = _cells(engine.rollup_levels(_table()))
+
+    assert cells[("REV", "Company")][:2] == [150.0, 100.0]
+    assert cells[("REV", "East")][0] == 100.0  # noqa: PLR2004
+
+
+def test_time_rollup_honors_time_roll_up() -> None:
+    """Test that time rollups follow each Account's time roll up."""
+    engine = RollupEngine(accounts=_accounts(), periods=_periods())
+    table = engine.rollup_time(_table())
+    cells = _cells(table)
+
+    assert table.periods[-1] == "Q1-2025"
+    assert "Q2-2025" not in table.periods
+    assert cells[("EXP", "East")][-1] == 100.0  # noqa: PLR2004
+    assert cells[("HC", "East")][-1] == 7.0  # noqa: PLR2004
+    assert cells[("REV", "West")][-1] == 100.0  # noqa: PLR2004
+
+
+def test_rollup_combines_hierarchies() -> None:
+    """Test that rollups across hierarchies include every combination."""
+    engine = RollupEngine(accounts=_accounts(), periods=_periods())
+    table = engine.rollup(_table())
+
+    cells = _cells(table)
+
+    assert cells[("NI", "East")][-1] == 200.0  # noqa: PLR2004
+    assert cells[("NI", "West")][-1] == 100.0  # noqa: PLR2004
+    assert math.isnan(cells[("NI", "West")][1])
@@ -0,0 +1,107 @@
+"""Tests for wdadaptivepy's VarianceTable."""
+
+import math
+
+import pytest
+
+from wdadaptivepy import AdaptiveConnection
+from wdadaptivepy.analysis import VarianceTable
+from wdadaptivepy.models import DataTable
+from wdadaptivepy.testing import FakeAdaptiveServer, SyntheticTenant
+
+BASE_COLUMNS = ["Account Code", "Level Code"]
+
+
+def _budget() -> DataTable:
+    return DataTable.from_columns(
+        BASE_COLUMNS,
+        [["REV", "EXP", "REV"], ["East", "East", "West"]],
+        ["01/2025", "02/2025"],
+        [[100.0, 40.0, 0.0], [100.0, math.nan, 10.0]],
+    )
+
+
+def _actuals() -> DataTable:
+    return DataTable.from_columns(
+        BASE_COLUMNS,
+        [["EXP", "REV", "HC"], ["East", "East", "East"]],
+        ["01/2025", "03/2025"],
+        [[50.0, 110.0, 3.0], [1.0, 2.0, 3.0]],
+    )
+
+
+def test_variance_aligns_rows_and_periods() -> None:
+    """Test that rows are matched on base values regardless of order."""
+    variance = VarianceTable.from_tables(_budget(), _actuals())
+
+    assert variance.row_count == 4  # noqa: PLR2004
+    assert list(zip(*variance.base_values, strict=True)) == [
+        ("REV", "East"),
+        ("EXP", "East"),
+        ("REV", "West"),
+        ("HC", "East"),
+    ]
+    assert variance.periods == ["01/2025", "02/2025", "03/2025"]
+    assert list(variance.difference[0]) == [10.0, 10.0, 0.0, 3.0]
+    assert list(variance.percentage[0])[:2] == [0.1, 0.25]
+    assert math.isnan(variance.percentage[0][2])
+    assert [bool(x) for x in variance.missing_in_base[0]] == [
+        False,
+        False,
+        False,
+        True,
+    ]
+    assert [bool(x) for x in variance.missing_in_compare[1]] == [
+        True,
+        False,
+        True,
+        False,
+    ]
+    assert math.isnan(variance.difference[1][1])
+    compared = list(variance.to_data_table("compare").column("03/2025"))
+    assert compared[:2] == [2.0, 1.0]
+    assert math.isnan(compared[2])
+
+
+def test_variance_requires_same_base_columns() -> None:
+    """Test that exports with different base columns are rejected."""
+    other = DataTable.from_columns(["Account Code"], [["REV"]], ["01/2025"], [[1]])
+    with pytest.raises(ValueError, match="same base columns"):
+        VarianceTable.from_tables(_budget(), other)
+    with pytest.raises(ValueError, match="measure"):
+        VarianceTable.from_tables(_budget(), _budget()).to_data_table("total")  # type: ignore[arg-type]
+
+
+def test_variance_rejects_duplicate_rows() -> None:
+    """Test that exports with repeated base values are rejected."""
+    duplicated = DataTable.from_columns(
+        BASE_COLUMNS,
+        [["REV", "REV"], ["East", "East"]],
+        ["01/2025"],
+        [[1.0, 2.0]],
+    )
+    with pytest.raises(ValueError, match="unique base values"):
+        VarianceTable.from_tables(duplicated, _actuals())
+    with pytest.raises(ValueError, match="unique base values"):
+        VarianceTable.from_tables(_budget(), duplicated)
+
+
+def test_compare_versions_exports_both_versions() -> None:
+    """Test comparing two Versions exported from Adaptive."""
+    server = FakeAdaptiveServer(SyntheticTenant(), data_rows=10)
+    adaptive = AdaptiveConnection(
+        login="test_login",
+        password="test_password",  # noqa: S106
+        transport=server.transport(),
+    )
+    query = (
+        adaptive.data.query_data()
+        .add_account_filter("A0")
+        .set_time_filter("01/2025", "03/2025")
+        .use_corporate_currency()
+    )
+
+    variance = adaptive.data.compare_versions(query, "Budget", "Actuals")
+    assert server.calls["exportData"] == 2  # noqa: PLR2004
+    assert variance.row_count == 10  # noqa: PLR2004
+    assert all(x == 0 for x in variance.difference[0])
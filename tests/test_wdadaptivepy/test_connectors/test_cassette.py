@@ -0,0 +1,106 @@
+"""Tests for wdadaptivepy's XML API cassettes."""
+
+from pathlib import Path
+
+import pytest
+
+from wdadaptivepy import AdaptiveConnection
+from wdadaptivepy.connectors.xml_api import Cassette, XMLApi
+from wdadaptivepy.connectors.xml_api.exceptions import (
+    CassetteMissError,
+    FailedRequestError,
+)
+from wdadaptivepy.testing import FakeAdaptiveServer, SyntheticTenant
+
+
+def test_fingerprint_ignores_formatting() -> None:
+    """Test that equivalent payloads share a fingerprint."""
+    compact = b'<include attributes="true" dimensionIDs="1"/>'
+    spaced = b'<include  dimensionIDs="1"   attributes="true"></include>'
+    assert Cassette.fingerprint("exportDimensions", compact, version=40) == (
+        Cassette.fingerprint("exportDimensions", spaced, version=40)
+    )
+    assert Cassette.fingerprint("exportDimensions", compact, version=40) != (
+        Cassette.fingerprint("exportDimensions", compact, version=41)
+    )
+
+
+def test_replay_or_record(tmp_path: Path) -> None:
+    """Test that responses are recorded once and replayed afterwards."""
+    server = FakeAdaptiveServer(SyntheticTenant(accounts=12))
+    cassette = Cassette(tmp_path)
+    adaptive = AdaptiveConnection(
+        login="test_login",
+        password="test_password",  # noqa: S106
+        transport=server.transport(),
+        cassette=cassette,
+    )
+    recorded = adaptive.accounts.get_all()
+    replayed = adaptive.accounts.get_all()
+
+    assert server.calls["exportAccounts"] == 1
+    assert (cassette.hits, cassette.misses) == (1, 1)
+    assert [account.code for account in replayed] == [
+        account.code for account in recorded
+    ]
+    assert b"test_password" not in b"".join(
+        path.read_bytes() for path in tmp_path.iterdir()
+    )
+
+
+def test_replay_only(tmp_path: Path) -> None:
+    """Test that replay mode never calls Adaptive."""
+    server = FakeAdaptiveServer()
+    adaptive = AdaptiveConnection(
+        login="test_login",
+        password="test_password",  # noqa: S106
+        transport=server.transport(),
+        cassette=Cassette(tmp_path, mode="replay"),
+    )
+    with pytest.raises(CassetteMissError):
+        adaptive.versions.get_all()
+    assert not server.calls
+
+
+def test_failed_responses_are_not_recorded(tmp_path: Path) -> None:
+    """Test that unsuccessful responses are not stored."""
+    server = FakeAdaptiveServer(error_rate=1.0)
+    adaptive = AdaptiveConnection(
+        login="test_login",
+        password="test_password",  # noqa: S106
+        transport=server.transport(),
+        cassette=Cassette(tmp_path, mode="record"),
+    )
+    with pytest.raises(FailedRequestError):
+        adaptive.versions.get_all()
+    assert not list(tmp_path.iterdir())
+
+
+def test_instances_do_not_share_recordings(tmp_path: Path) -> None:
+    """Test that recordings of one instance or locale are not replayed for another."""
+    server = FakeAdaptiveServer(SyntheticTenant(accounts=3))
+    cassette = Cassette(tmp_path)
+    xml_api = XMLApi(
+        login="test_login",
+        password="test_password",  # noqa: S106
+        instance_code="A",
+        transport=server.transport(),
+        cassette=cassette,
+    )
+    other_locale = XMLApi(
+        login="test_login",
+        password="test_password",  # noqa: S106
+        instance_code="B",
+        locale="fr_FR",
+        transport=server.transport(),
+        cassette=cassette,
+    )
+
+    for api in (xml_api, xml_api.derive(instance_code="B"), other_locale, xml_api):
+        api.make_xml_request("exportAccounts", None)
+
+    assert server.calls["exportAccounts"] == 3  # noqa: PLR2004
+    assert (cassette.hits, cassette.misses) == (1, 3)
+    assert Cassette.fingerprint("exportAccounts", b"", version=40) != (
+        Cassette.fingerprint("exportAccounts", b"", version=40, instance_code="B")
+    )
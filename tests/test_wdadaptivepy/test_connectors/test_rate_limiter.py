@@ -0,0 +1,49 @@
+"""Tests for wdadaptivepy's RateLimiter."""
+
+import threading
+import time
+
+import pytest
+
+from wdadaptivepy.connectors.xml_api import RateLimiter
+
+
+def test_rate_limiter_spaces_calls() -> None:
+    """Test that calls are spaced by the requests per second."""
+    limiter = RateLimiter(requests_per_second=50)
+    started = time.monotonic()
+    for _ in range(5):
+        with limiter.acquire():
+            pass
+    assert time.monotonic() - started >= 4 / 50 - 0.01
+    assert limiter.waited > 0
+
+
+def test_rate_limiter_limits_concurrency() -> None:
+    """Test that no more than max_concurrent_requests calls run at once."""
+    limiter = RateLimiter(max_concurrent_requests=2)
+    lock = threading.Lock()
+    running = []
+    peak = []
+
+    def call() -> None:
+        with limiter.acquire():
+            with lock:
+                running.append(1)
+                peak.append(len(running))
+            time.sleep(0.01)
+            with lock:
+                running.pop()
+
+    threads = [threading.Thread(target=call) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert max(peak) <= 2  # noqa: PLR2004
+
+
+def test_rate_limiter_rejects_non_positive_limits() -> None:
+    """Test that limits must be positive."""
+    with pytest.raises(ValueError, match="positive"):
+        RateLimiter(requests_per_second=0)
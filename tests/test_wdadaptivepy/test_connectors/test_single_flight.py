@@ -0,0 +1,79 @@
+"""Tests for wdadaptivepy's SingleFlight."""
+
+import threading
+import time
+
+import pytest
+
+from wdadaptivepy.connectors.xml_api import SingleFlight
+
+THREADS = 5
+
+
+def test_single_flight_shares_in_flight_call() -> None:
+    """Test that threads asking for the same key at once share one call."""
+    flights: SingleFlight[int] = SingleFlight()
+    calls = []
+    started = threading.Event()
+    results = []
+
+    def call() -> int:
+        calls.append(1)
+        started.set()
+        time.sleep(0.05)
+        return len(calls)
+
+    def worker() -> None:
+        results.append(flights.do("key", call))
+
+    threads = [threading.Thread(target=worker) for _ in range(THREADS)]
+    threads[0].start()
+    started.wait()
+    for thread in threads[1:]:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [1] * THREADS
+    assert flights.shared == THREADS - 1
+    assert flights.in_flight() == 0
+    assert flights.do("key", call) == 2  # NOQA: PLR2004
+
+
+def test_single_flight_shares_exceptions() -> None:
+    """Test that waiting threads receive the exception of the shared call."""
+    flights: SingleFlight[int] = SingleFlight()
+    started = threading.Event()
+    errors = []
+
+    def call() -> int:
+        started.set()
+        time.sleep(0.05)
+        error_message = "failed"
+        raise ValueError(error_message)
+
+    def worker() -> None:
+        try:
+            flights.do("key", call)
+        except ValueError as error:
+            errors.append(error)
+
+    threads = [threading.Thread(target=worker) for _ in range(2)]
+    threads[0].start()
+    started.wait()
+    threads[1].start()
+    for thread in threads:
+        thread.join()
+
+    assert len(errors) == 2  # NOQA: PLR2004
+    assert flights.in_flight() == 0
+
+
+def test_single_flight_runs_different_keys() -> None:
+    """Test that calls for different keys are not shared."""
+    flights: SingleFlight[str] = SingleFlight()
+    assert flights.do("a", lambda: "a") == "a"
+    assert flights.do("b", lambda: "b") == "b"
+    assert flights.shared == 0
+    with pytest.raises(KeyError):
+        flights.do("c", lambda: {}["c"])
@@ -1,8 +1,16 @@
 """Tests for wdadaptivepy's XMLAPI class."""
 
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from xml.etree import ElementTree as ET
+
+import httpx
 import pytest
 
-from wdadaptivepy.connectors.xml_api.xml_api import XMLApi
+from wdadaptivepy.connectors.xml_api.xml_api import XMLApi, XMLPayload
+from wdadaptivepy.testing import FakeAdaptiveServer, SyntheticTenant
+
+THREADS = 4
 
 
 def test_connection_requires_login() -> None:
@@ -15,3 +23,190 @@ def test_connection_requires_password() -> None:
     """Test that wdadaptivepy requires an Adaptive password value."""
     with pytest.raises(TypeError):
         XMLApi(login="test_login")  # pyright: ignore[reportCallIssue]
+
+
+def test_serialized_request_matches_element_tree() -> None:
+    """Test that the cached envelope serializes the same XML as ElementTree."""
+    xml_api = XMLApi(login="test_login", password="test_password", locale="en_US")  # noqa: S106
+    payload = [
+        ET.Element("include", attrib={"attributes": "true"}),
+        ET.Element("version", attrib={"name": "Actuals & Budget"}),
+    ]
+    expected = ET.tostring(
+        xml_api._XMLApi__generate_xml_call("exportData", payload, stream=True),  # noqa: SLF001  # pyright: ignore[reportAttributeAccessIssue]
+    )
+    for _ in range(2):
+        actual = b"".join(xml_api.iter_xml_request("exportData", payload, stream=True))
+        assert actual == expected
+
+
+def test_serialized_request_tracks_credential_changes() -> None:
+    """Test that the cached envelope is rebuilt when the credentials change."""
+    xml_api = XMLApi(login="test_login", password="test_password")  # noqa: S106
+    b"".join(xml_api.iter_xml_request("exportAccounts", None))
+    xml_api.instance_code = "INSTANCE"
+    call = ET.fromstring(b"".join(xml_api.iter_xml_request("exportAccounts", None)))
+    credentials = call.find("credentials")
+    assert credentials is not None
+    assert credentials.attrib["instanceCode"] == "INSTANCE"
+
+
+def test_generator_payload_is_streamed() -> None:
+    """Test that generator payloads are written into the request body as-is."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        request.read()
+        requests.append(request)
+        return httpx.Response(200, text='<response success="true"/>')
+
+    xml_api = XMLApi(
+        login="test_login",
+        password="test_password",  # noqa: S106
+        transport=httpx.MockTransport(handler),
+    )
+
+    def payload() -> Iterator[bytes]:
+        yield b"<accounts>"
+        yield b'<account id="1" />'
+        yield b"</accounts>"
+
+    xml_api.make_xml_request("importAccounts", payload())
+    assert "Content-Length" not in requests[0].headers
+    call = ET.fromstring(requests[0].content)
+    assert call.attrib["method"] == "importAccounts"
+    assert call.find("accounts/account") is not None
+
+
+def test_base_url_override() -> None:
+    """Test that requests are sent to the configured base URL and version."""
+    urls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        urls.append(str(request.url))
+        return httpx.Response(200, text='<response success="true"/>')
+
+    xml_api = XMLApi(
+        login="test_login",
+        password="test_password",  # noqa: S106
+        version=41,
+        base_url="http://localhost:8080/api/",
+        transport=httpx.MockTransport(handler),
+    )
+    xml_api.make_xml_request("exportAccounts", None)
+    assert urls == ["http://localhost:8080/api/v41"]
+
+
+def test_non_bytes_generator_payload_raises() -> None:
+    """Test that generator payloads must only yield bytes."""
+    xml_api = XMLApi(login="test_login", password="test_password")  # noqa: S106
+    with pytest.raises(TypeError):
+        b"".join(xml_api.iter_xml_request("importAccounts", iter(["<accounts/>"])))  # pyright: ignore[reportArgumentType]
+
+
+def test_in_flight_request_keeps_credentials() -> None:
+    """Test that changing credentials does not affect a request being sent."""
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        request.read()
+        requests.append(request)
+        return httpx.Response(200, text='<response success="true"/>')
+
+    xml_api = XMLApi(
+        login="test_login",
+        password="test_password",  # noqa: S106
+        transport=httpx.MockTransport(handler),
+    )
+
+    def payload() -> Iterator[bytes]:
+        xml_api.update_credentials(login="other_login", password="other_password")  # noqa: S106
+        yield b"<accounts/>"
+
+    xml_api.make_xml_request("importAccounts", payload())
+    xml_api.make_xml_request("exportAccounts", None)
+    logins = [
+        ET.fromstring(request.content).find("credentials").attrib["login"]  # pyright: ignore[reportOptionalMemberAccess]
+        for request in requests
+    ]
+    assert logins == ["test_login", "other_login"]
+    assert xml_api.credentials().password == "other_password"  # noqa: S105
+
+
+def test_update_credentials_rejects_unexpected_fields() -> None:
+    """Test that only credentials can be changed with update_credentials."""
+    xml_api = XMLApi(login="test_login", password="test_password")  # noqa: S106
+    with pytest.raises(TypeError):
+        xml_api.update_credentials(version="41")
+
+
+def _concurrent_requests(
+    xml_api: XMLApi,
+    method: str,
+    payload: XMLPayload,
+    count: int,
+) -> list[ET.Element]:
+    with ThreadPoolExecutor(count) as executor:
+        return list(
+            executor.map(
+                lambda _: xml_api.make_xml_request(method, payload),
+                range(count),
+            ),
+        )
+
+
+def test_identical_exports_are_coalesced() -> None:
+    """Test that identical concurrent exports share one in-flight call."""
+    server = FakeAdaptiveServer(SyntheticTenant(accounts=10), latency=0.2)
+    xml_api = XMLApi(
+        login="test_login",
+        password="test_password",  # noqa: S106
+        transport=server.transport(),
+    )
+    payload = ET.Element("include", attrib={"attributes": "false"})
+
+    trees = _concurrent_requests(xml_api, "exportAccounts", payload, THREADS)
+
+    assert server.calls["exportAccounts"] == 1
+    assert xml_api.coalesced_requests == THREADS - 1
+    assert len({ET.tostring(tree) for tree in trees}) == 1
+    assert len({id(tree) for tree in trees}) == THREADS
+
+
+def test_imports_and_disabled_coalescing_are_not_coalesced() -> None:
+    """Test that imports, and exports with coalescing disabled, are all sent."""
+    server = FakeAdaptiveServer(SyntheticTenant(accounts=10), latency=0.05)
+    xml_api = XMLApi(
+        login="test_login",
+        password="test_password",  # noqa: S106
+        transport=server.transport(),
+    )
+
+    _concurrent_requests(xml_api, "importAccounts", None, THREADS)
+    xml_api.coalesce_requests = False
+    _concurrent_requests(xml_api, "exportAccounts", None, THREADS)
+
+    assert server.calls["importAccounts"] == THREADS
+    assert server.calls["exportAccounts"] == THREADS
+    assert xml_api.coalesced_requests == 0
+
+
+def test_unchanged_response_is_not_parsed() -> None:
+    """Test that a response matching the previous digest is not returned."""
+    server = FakeAdaptiveServer(SyntheticTenant(accounts=3))
+    xml_api = XMLApi(
+        login="test_login",
+        password="test_password",  # noqa: S106
+        transport=server.transport(),
+    )
+
+    first, digest = xml_api.make_xml_request_if_changed("exportAccounts", None, None)
+    second, same_digest = xml_api.make_xml_request_if_changed(
+        "exportAccounts",
+        None,
+        digest,
+    )
+
+    assert first is not None
+    assert second is None
+    assert same_digest == digest
@@ -0,0 +1,91 @@
+"""Tests for wdadaptivepy's instrumentation."""
+
+import httpx
+import pytest
+
+from wdadaptivepy import AdaptiveConnection
+from wdadaptivepy.instrumentation import Instrumentation, Span
+
+ACCOUNTS_RESPONSE = (
+    '<response success="true"><output><accounts>'
+    '<account id="1" code="Assets" name="Assets">'
+    '<account id="2" code="Cash" name="Cash" />'
+    "</account>"
+    "</accounts></output></response>"
+)
+
+
+def test_span_records_stats_and_calls_hooks() -> None:
+    """Test that spans are summarized and forwarded to hooks."""
+    instrumentation = Instrumentation()
+    spans: list[Span] = []
+    instrumentation.add_hook(spans.append)
+
+    with instrumentation.span("http", method="exportAccounts") as span:
+        span.attributes["response_bytes"] = 10
+    with instrumentation.span("http", method="exportLevels", response_bytes=5):
+        pass
+
+    stats = instrumentation.stats()
+    assert [span.name for span in spans] == ["http", "http"]
+    assert stats["http"]["count"] == 2  # noqa: PLR2004
+    assert stats["http"]["response_bytes"] == 15  # noqa: PLR2004
+    assert stats["http:exportAccounts"]["response_bytes"] == 10  # noqa: PLR2004
+
+
+def test_span_records_errors() -> None:
+    """Test that spans record exceptions raised within them."""
+    instrumentation = Instrumentation()
+    with pytest.raises(RuntimeError), instrumentation.span("read_csv"):
+        raise RuntimeError
+    assert instrumentation.stats()["read_csv"]["errors"] == 1
+
+
+def test_failing_hook_keeps_original_error(caplog: pytest.LogCaptureFixture) -> None:
+    """Test that a failing hook is logged without hiding the span's error."""
+    instrumentation = Instrumentation()
+    spans: list[Span] = []
+
+    def failing_hook(_: Span) -> None:
+        raise ValueError
+
+    instrumentation.add_hook(failing_hook)
+    instrumentation.add_hook(spans.append)
+    with pytest.raises(RuntimeError), instrumentation.span("read_csv"):
+        raise RuntimeError
+    with instrumentation.span("read_csv"):
+        pass
+
+    assert len(spans) == 2  # noqa: PLR2004
+    assert caplog.text.count("Instrumentation hook") == 2  # noqa: PLR2004
+
+
+def test_connection_stats() -> None:
+    """Test that a connection summarizes HTTP, parse, and model costs."""
+    adaptive = AdaptiveConnection(
+        login="test_login",
+        password="test_password",  # noqa: S106
+        transport=httpx.MockTransport(
+            lambda _: httpx.Response(200, text=ACCOUNTS_RESPONSE),
+        ),
+    )
+    adaptive.accounts.get_all()
+
+    stats = adaptive.stats()
+    assert stats["http:exportAccounts"]["count"] == 1
+    assert stats["http:exportAccounts"]["response_bytes"] == len(ACCOUNTS_RESPONSE)
+    assert stats["http:exportAccounts"]["request_bytes"] > 0
+    assert stats["xml_parse:exportAccounts"]["count"] == 1
+    assert stats["from_xml:Account"]["rows"] == 2  # noqa: PLR2004
+
+
+def test_row_count_mismatch_is_recorded() -> None:
+    """Test that a mismatched rowCountSent is recorded before raising."""
+    adaptive = AdaptiveConnection(login="test_login", password="test_password")  # noqa: S106
+    query = adaptive.data.query_data()
+    with pytest.raises(RuntimeError):
+        query._read_csv("Account Code,01/2026\n1000,1\n", 2)  # noqa: SLF001
+    stats = adaptive.stats()["read_csv"]
+    assert stats["rows"] == 1
+    assert stats["expected_rows"] == 2  # noqa: PLR2004
+    assert stats["row_count_mismatch"] == 1
@@ -1,7 +1,13 @@
 """Tests for wdadaptivepy's main module."""
 
+import os
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
 
+import wdadaptivepy
 from wdadaptivepy import AdaptiveConnection
 
 
@@ -39,3 +45,70 @@ def test_services_existence() -> None:
 
     for service in services:
         getattr(adaptive, service)
+
+
+def test_services_created_once() -> None:
+    """Test that each wdadaptivepy service is created on first access and reused."""
+    adaptive = AdaptiveConnection(
+        login="test_login",
+        password="test_password",  # noqa: S106
+    )
+
+    assert "data" not in vars(adaptive)
+    assert adaptive.data is adaptive.data
+    assert "data" in vars(adaptive)
+
+
+def test_import_defers_services() -> None:
+    """Test that importing wdadaptivepy does not import the models or services."""
+    code = (
+        "import sys\n"
+        "from wdadaptivepy import AdaptiveConnection\n"
+        "print(','.join(sorted(sys.modules)))\n"
+    )
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": str(Path(wdadaptivepy.__file__).parents[1])},
+    )
+    modules = result.stdout.strip().split(",")
+
+    assert "wdadaptivepy.main" in modules
+    assert "wdadaptivepy.services.data" not in modules
+    assert "wdadaptivepy.models.base" not in modules
+
+
+def test_lazy_exports() -> None:
+    """Test that wdadaptivepy's lazy exports resolve and reject unknown names."""
+    from wdadaptivepy import models, services  # noqa: PLC0415
+
+    assert models.DataTable.__name__ == "DataTable"
+    assert services.DataService.__name__ == "DataService"
+    assert "Account" in dir(wdadaptivepy)
+    with pytest.raises(AttributeError):
+        wdadaptivepy.NotAnExport  # noqa: B018
+
+
+def test_update_credentials_reaches_requests() -> None:
+    """Test that credential changes made on the connection are sent to Adaptive."""
+    adaptive = AdaptiveConnection(
+        login="test_login",
+        password="test_password",  # noqa: S106
+    )
+
+    adaptive.update_credentials(login="other_login", instance_code="INSTANCE")
+    adaptive.locale = "en_US"
+    call = adaptive._AdaptiveConnection__xml_api.preview_xml_request(  # noqa: SLF001  # pyright: ignore[reportAttributeAccessIssue]
+        "exportAccounts",
+        None,
+    )
+
+    assert adaptive.login == "other_login"
+    assert call.find("credentials").attrib == {
+        "login": "other_login",
+        "password": "*" * len("test_password"),
+        "locale": "en_US",
+        "instanceCode": "INSTANCE",
+    }
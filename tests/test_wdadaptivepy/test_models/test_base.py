@@ -0,0 +1,87 @@
+"""Test the wdadaptivepy base model validators."""
+
+from collections.abc import Sequence
+from dataclasses import fields
+from datetime import datetime
+from typing import Any
+from xml.etree import ElementTree as ET
+
+import pytest
+
+from wdadaptivepy.models import Level, MetadataList
+from wdadaptivepy.models.base import date_or_none, datetime_or_none
+from wdadaptivepy.testing import SyntheticTenant
+
+
+@pytest.mark.parametrize("value", ["2025-01-31", "2024-02-29", "2025-1-5"])
+def test_date_or_none(value: str) -> None:
+    """Test parsing dates like strptime."""
+    assert date_or_none(value) == datetime.strptime(value, "%Y-%m-%d")  # NOQA: DTZ007
+
+
+@pytest.mark.parametrize("value", ["2025-02-30", "2025-13-01", "2025-01-01 "])
+def test_date_or_none_invalid(value: str) -> None:
+    """Test rejecting invalid dates."""
+    with pytest.raises(ValueError):  # NOQA: PT011
+        date_or_none(value)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2023-01-05 10:11:12.0",
+        "2023-01-05 10:11:12.123",
+        "2023-01-05 10:11:12.123456",
+        "2023-1-5 1:2:3.4",
+    ],
+)
+def test_datetime_or_none(value: str) -> None:
+    """Test parsing datetimes like strptime."""
+    expected = datetime.strptime(value, "%Y-%m-%d %H:%M:%S.%f")  # NOQA: DTZ007
+    assert datetime_or_none(value) == expected
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2023-01-05 10:11:12",
+        "2023-01-05 10:11:12.1234567",
+        "2023-01-05T10:11:12.0",
+        "2023-01-05 24:00:00.0",
+    ],
+)
+def test_datetime_or_none_invalid(value: str) -> None:
+    """Test rejecting invalid datetimes."""
+    with pytest.raises(ValueError):  # NOQA: PT011
+        datetime_or_none(value)
+
+
+def _records(members: Sequence[Level]) -> list[dict[str, Any]]:
+    return [
+        {x.name: getattr(member, x.name) for x in fields(member)} for member in members
+    ]
+
+
+def test_from_trusted_records() -> None:
+    """Test rebuilding validated members without running validators."""
+    levels = Level.from_xml(ET.fromstring(SyntheticTenant(levels=6).export_levels()))
+    records = _records(levels)
+
+    trusted = Level.from_trusted_records(records)
+    assert [x.code for x in trusted] == [x.code for x in levels]
+    assert trusted[0] == Level.from_dict(records, validate=True)[0]
+    assert trusted[2].available_start == levels[2].available_start
+    assert trusted[2].adaptive_children == MetadataList()
+    assert trusted[0].adaptive_attributes == MetadataList()
+
+    child = Level.from_trusted_records([{"id": 99, "code": "C", "parent": trusted[0]}])
+    assert child[0].adaptive_parent is trusted[0]
+    assert Level.from_dict({"id": 99, "code": "C"}, validate=False)[0].name is None
+
+
+def test_from_trusted_records_skips_validators() -> None:
+    """Test that trusted records are stored as given."""
+    level = Level.from_trusted_records([{"id": "not an int"}])[0]
+    assert level.id == "not an int"
+    with pytest.raises(TypeError):
+        Level.from_trusted_records([{"unknown": 1}])
@@ -0,0 +1,92 @@
+"""Test the wdadaptivepy Calendar."""
+
+from datetime import date, datetime
+
+import pytest
+
+from wdadaptivepy import AdaptiveConnection
+from wdadaptivepy.models.calendar import Calendar
+from wdadaptivepy.testing import FakeAdaptiveServer, SyntheticTenant
+
+
+@pytest.fixture(scope="module")
+def calendar() -> Calendar:
+    """Retrieve the Calendar of a synthetic tenant.
+
+    Returns:
+        wdadaptivepy Calendar
+
+    """
+    server = FakeAdaptiveServer(SyntheticTenant(years=2))
+    adaptive = AdaptiveConnection(
+        login="test_login",
+        password="test_password",  # noqa: S106
+        transport=server.transport(),
+    )
+    return adaptive.time.get_calendar()
+
+
+def test_lookups(calendar: Calendar) -> None:
+    """Test looking up Periods and Strata by code."""
+    assert len(calendar) == 2 * (1 + 4 + 12)
+    month = calendar.period("02/2025")
+    assert month is not None
+    assert month.stratum_id == 1
+    stratum = calendar.stratum("qtr")
+    assert stratum is not None
+    assert stratum.id == 2  # noqa: PLR2004
+    assert calendar.period("13/2025") is None
+    assert [x.code for x in calendar.periods("year")] == ["2025", "2026"]
+
+
+def test_periods_for_dates(calendar: Calendar) -> None:
+    """Test finding the Periods containing dates."""
+    dates = [
+        date(2025, 1, 1),
+        datetime(2025, 1, 31, 23, 59),  # NOQA: DTZ001
+        date(2025, 2, 1),
+        date(2026, 12, 31),
+        date(2024, 12, 31),
+        date(2027, 1, 1),
+        date(2025, 1, 1),
+    ]
+    assert calendar.codes_for_dates(dates) == [
+        "01/2025",
+        "01/2025",
+        "02/2025",
+        "12/2026",
+        None,
+        None,
+        "01/2025",
+    ]
+    quarters = calendar.periods_for_dates(dates[:4], stratum="qtr")
+    assert [x.code if x else None for x in quarters] == [
+        "Q1-2025",
+        "Q1-2025",
+        "Q1-2025",
+        "Q4-2026",
+    ]
+    period = calendar.period_for_date(date(2026, 7, 4), "year")
+    assert period is not None
+    assert period.code == "2026"
+
+
+def test_parent(calendar: Calendar) -> None:
+    """Test finding the Period of a coarser Stratum containing a Period."""
+    quarter = calendar.parent("05/2025", "qtr")
+    assert quarter is not None
+    assert quarter.code == "Q2-2025"
+    year = calendar.parent("05/2025", "year")
+    assert year is not None
+    assert year.code == "2025"
+    with pytest.raises(KeyError):
+        calendar.parent("13/2025", "year")
+
+
+def test_expand_range(calendar: Calendar) -> None:
+    """Test listing the Periods between two Periods."""
+    months = calendar.expand_range("11/2025", "02/2026")
+    assert [x.code for x in months] == ["11/2025", "12/2025", "01/2026", "02/2026"]
+    quarters = calendar.expand_range("11/2025", "02/2026", "qtr")
+    assert [x.code for x in quarters] == ["Q1-2026"]
+    assert calendar.expand_range("02/2026", "11/2025") == []
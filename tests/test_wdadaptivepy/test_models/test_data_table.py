@@ -0,0 +1,122 @@
+"""Tests for wdadaptivepy's DataTable."""
+
+import json
+import math
+from xml.etree import ElementTree as ET
+
+import pytest
+
+from wdadaptivepy.connectors.xml_api.xml_api import XMLApi
+from wdadaptivepy.models.data_table import DataTable
+from wdadaptivepy.services.data import DataQuery
+
+CSV_ROWS = [
+    ["Cash", "1000", "10.5", "B", "3"],
+    ["Revenue", "4000", "I", "-2", ""],
+]
+BASE_COLUMNS = [(0, "Account Name"), (1, "Account Code")]
+PERIOD_COLUMNS = [(2, "01/2025"), (3, "02/2025"), (4, "03/2025")]
+
+
+def test_columns_and_masks() -> None:
+    """Test that period columns are converted into amounts and masks."""
+    table = DataTable.from_rows(CSV_ROWS, BASE_COLUMNS, PERIOD_COLUMNS)
+
+    assert table.row_count == 2  # noqa: PLR2004
+    assert table.cell_count == 6  # noqa: PLR2004
+    assert list(table.column("Account Code")) == ["1000", "4000"]
+    assert table.column("01/2025")[0] == 10.5  # noqa: PLR2004
+    assert math.isnan(table.column("01/2025")[1])
+    assert [bool(x) for x in table.blanks[1]] == [True, False]
+    assert [bool(x) for x in table.blanks[2]] == [False, True]
+    assert [bool(x) for x in table.invalid[0]] == [False, True]
+
+
+def test_cells_match_unpivot() -> None:
+    """Test that cells are ordered like DataQuery's unpivoted rows."""
+    table = DataTable.from_rows(CSV_ROWS, BASE_COLUMNS, PERIOD_COLUMNS)
+    cells = table.cells()
+
+    assert len(cells) == 6  # noqa: PLR2004
+    assert list(cells.row_index) == [0, 0, 0, 1, 1, 1]
+    assert list(cells.period_index) == [0, 1, 2, 0, 1, 2]
+    assert list(cells.amounts)[4] == -2  # noqa: PLR2004
+    assert [bool(x) for x in cells.blanks] == [False, True, False, False, False, True]
+    assert [bool(x) for x in cells.invalid] == [False, False, False, True, False, False]
+
+
+def test_records_match_parse_response() -> None:
+    """Test that DataTable records match DataQuery's parsed rows."""
+    csv_text = "Account Code,Level Name,01/2025,02/2025\n1000,Company,1,2.5\n"
+    response = ET.fromstring(
+        f"<response success='true'><output><![CDATA[{csv_text}]]></output>"
+        "<status rowCountSent='1'/></response>",
+    )
+    query = DataQuery(XMLApi("", ""))
+
+    table = query._parse_table(response)  # noqa: SLF001
+
+    assert table.to_records() == query._parse_response(response)  # noqa: SLF001
+
+
+def test_record_to_dict() -> None:
+    """Test copying a read-only record into a JSON serializable dictionary."""
+    table = DataTable.from_rows(CSV_ROWS, BASE_COLUMNS, PERIOD_COLUMNS)
+    record = table.to_records()[0].to_dict()
+    record["Amount"] = 0
+
+    assert json.loads(json.dumps(record)) == {
+        "Account Name": "Cash",
+        "Account Code": "1000",
+        "Period Code": "01/2025",
+        "Amount": 0,
+    }
+    assert table.to_records()[0]["Amount"] == 10.5  # noqa: PLR2004
+
+
+def test_concat_labels_rows_and_unions_periods() -> None:
+    """Test stacking tables with label columns."""
+    actuals = DataTable.from_rows(CSV_ROWS, BASE_COLUMNS, PERIOD_COLUMNS)
+    budget = DataTable.from_rows(
+        [["Cash", "1000", "7"]],
+        BASE_COLUMNS,
+        [(2, "04/2025")],
+    )
+    table = DataTable.concat([actuals, budget], ["Version"], [["Actuals"], ["Budget"]])
+
+    assert table.base_columns == ["Version", "Account Name", "Account Code"]
+    assert list(table.column("Version")) == ["Actuals", "Actuals", "Budget"]
+    assert table.periods == ["01/2025", "02/2025", "03/2025", "04/2025"]
+    assert math.isnan(table.column("01/2025")[2])
+    assert list(table.column("04/2025"))[2] == 7  # noqa: PLR2004
+
+
+def test_merge_periods_matches_rows_on_base_values() -> None:
+    """Test that merged periods follow rows by base values, not by position."""
+    stored = DataTable.from_rows(CSV_ROWS, BASE_COLUMNS, PERIOD_COLUMNS)
+    newer = DataTable.from_rows(
+        [["Revenue", "4000", "8"], ["Equity", "3000", "9"]],
+        BASE_COLUMNS,
+        [(2, "02/2025")],
+    )
+    merged = stored.merge_periods(newer, ["02/2025"])
+
+    assert list(merged.column("Account Code")) == ["1000", "4000", "3000"]
+    assert list(merged.column("02/2025"))[1:] == [8, 9]
+    assert math.isnan(merged.column("02/2025")[0])
+    assert math.isnan(merged.column("01/2025")[2])
+
+
+def test_merge_periods_rejects_duplicate_rows() -> None:
+    """Test that rows with the same base values cannot be merged."""
+    stored = DataTable.from_rows(CSV_ROWS, BASE_COLUMNS, PERIOD_COLUMNS)
+    duplicated = DataTable.from_rows(
+        [["Cash", "1000", "1"], ["Cash", "1000", "2"]],
+        BASE_COLUMNS,
+        [(2, "02/2025")],
+    )
+
+    with pytest.raises(ValueError, match="unique base values"):
+        stored.merge_periods(duplicated, ["02/2025"])
+    with pytest.raises(ValueError, match="unique base values"):
+        duplicated.merge_periods(stored, ["02/2025"])
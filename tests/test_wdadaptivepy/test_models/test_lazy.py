@@ -0,0 +1,52 @@
+"""Test lazy conversion of metadata from XML."""
+
+from xml.etree import ElementTree as ET
+
+import pytest
+
+from wdadaptivepy.models import Account, Level, User
+from wdadaptivepy.testing import SyntheticTenant
+
+
+def test_lazy_members_equal_eager_members() -> None:
+    """Test that lazy members read the same values as eager members."""
+    tenant = SyntheticTenant(accounts=20, levels=10, users=5)
+    for model, xml in (
+        (Account, tenant.export_accounts()),
+        (Level, tenant.export_levels()),
+        (User, tenant.export_users()),
+    ):
+        eager = model.from_xml(ET.fromstring(xml))
+        lazy = model.from_xml(ET.fromstring(xml), lazy=True)
+        assert lazy == eager
+        assert [getattr(x, "adaptive_attributes", None) for x in lazy] == [
+            getattr(x, "adaptive_attributes", None) for x in eager
+        ]
+
+
+def test_lazy_members_convert_on_access() -> None:
+    """Test that only id, code, and name are converted up front."""
+    tenant = SyntheticTenant(accounts=7, account_branching=3)
+    accounts = Account.from_xml(ET.fromstring(tenant.export_accounts()), lazy=True)
+    account = accounts[1]
+    assert set(vars(account)).isdisjoint({"is_assumption", "is_importable"})
+    assert account.code == "A1"
+    assert account.adaptive_parent is accounts[0]
+    assert [x.code for x in accounts[0].adaptive_children] == ["A1", "A2", "A3"]
+    assert account.is_importable is True
+    assert vars(account)["is_importable"] is True
+
+    account.is_assumption = "1"
+    assert account.is_assumption is True
+    assert Account().is_assumption is None
+
+
+def test_lazy_members_raise_on_access() -> None:
+    """Test that invalid values raise when first read."""
+    xml = ET.fromstring(
+        '<accounts><account id="1" code="A" isAssumption="x"/></accounts>'
+    )
+    account = Account.from_xml(xml, lazy=True)[0]
+    assert account.id == 1
+    with pytest.raises(ValueError):  # NOQA: PT011
+        _ = account.is_assumption
@@ -68,3 +68,39 @@ def test_remove_attribute_returns_new() -> None:
     assert level.adaptive_attributes[0] != adaptive_attribute
     assert level.adaptive_attributes[0].value_id == "0"
     assert adaptive_attribute.value_id == "2"
+
+
+def test_attribute_lookup_follows_direct_list_edits() -> None:
+    """Test that Attributes are found after editing the list directly."""
+    level = Level(id=1)
+    for attribute_id in range(1, 4):
+        level.set_adaptive_attribute(
+            MetadataAttribute(attribute_id=attribute_id, name=str(attribute_id)),
+        )
+    assert level.get_adaptive_attribute(4) is None
+
+    level.adaptive_attributes.pop(0)
+    level.adaptive_attributes.append(MetadataAttribute(attribute_id=4, name="4"))
+
+    assert level.get_adaptive_attribute(1) is None
+    assert level.get_adaptive_attribute(3) is level.adaptive_attributes[1]
+    assert level.get_adaptive_attribute(4) is level.adaptive_attributes[2]
+
+
+def test_attribute_lookup_follows_assignment_by_index() -> None:
+    """Test that an Attribute assigned by index replaces the one with its ID."""
+    level = Level(id=1)
+    for attribute_id in range(1, 3):
+        level.set_adaptive_attribute(
+            MetadataAttribute(attribute_id=attribute_id, value_id=attribute_id),
+        )
+
+    level.adaptive_attributes[0] = MetadataAttribute(attribute_id=9, value_id=5)
+    assert level.get_adaptive_attribute(9) is level.adaptive_attributes[0]
+    assert level.get_adaptive_attribute(1) is None
+
+    level.set_adaptive_attribute(MetadataAttribute(attribute_id=9, value_id=7))
+    assert [(x.attribute_id, x.value_id) for x in level.adaptive_attributes] == [
+        (9, "7"),
+        (2, "2"),
+    ]
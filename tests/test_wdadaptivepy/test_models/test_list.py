@@ -263,3 +263,53 @@ def test_adaptive_attribute_get_member() -> None:
         )
     )
     assert set_third == found_third
+
+
+def test_get_members_by_attribute() -> None:
+    """Test looking up members by Attribute and Attribute Value."""
+    levels = MetadataList[Level]()
+    for index in range(4):
+        level = Level(id=index + 1, code=str(index))
+        level.set_adaptive_attribute(
+            MetadataAttribute(attribute_id=1, name="Region", value_id=index % 2),
+        )
+        levels.append(level)
+    levels[3].set_adaptive_attribute(
+        MetadataAttribute(attribute_id=2, name="Owner", value_id=7),
+    )
+
+    assert [x.code for x in levels.get_members_by_attribute(1, 1)] == ["1", "3"]
+    assert [x.code for x in levels.get_members_by_attribute(1, "0")] == ["0", "2"]
+    assert len(levels.get_members_by_attribute(1)) == len(levels)
+    assert [x.code for x in levels.get_members_by_attribute(2)] == ["3"]
+    assert levels.get_members_by_attribute(3) == MetadataList()
+
+    levels.pop()
+    assert levels.get_members_by_attribute(2) == MetadataList()
+
+    levels[0].set_adaptive_attribute(
+        MetadataAttribute(attribute_id=1, name="Region", value_id=1),
+    )
+    assert [x.code for x in levels.get_members_by_attribute(1, 1)] == ["0", "1"]
+
+    levels.reverse()
+    assert [x.code for x in levels.get_members_by_attribute(1, 1)] == ["1", "0"]
+    levels.sort(key=lambda x: x.code)
+    assert [x.code for x in levels.get_members_by_attribute(1, 1)] == ["0", "1"]
+
+
+def test_set_adaptive_attribute_replaces_by_id() -> None:
+    """Test that setting an Attribute replaces the Attribute with the same ID."""
+    level = Level(id=1)
+    level.set_adaptive_attribute(MetadataAttribute(attribute_id=1, value_id=1))
+    level.set_adaptive_attribute(MetadataAttribute(attribute_id=2, value_id=2))
+    level.set_adaptive_attribute(MetadataAttribute(attribute_id=1, value_id=3))
+    assert [x.value_id for x in level.adaptive_attributes] == ["3", "2"]
+    attribute = level.get_adaptive_attribute(1)
+    assert attribute is not None
+    assert attribute.value_id == "3"
+    assert level.get_adaptive_attribute(5) is None
+
+    level.adaptive_attributes.reverse()
+    level.remove_adaptive_attribute(adaptive_attribute_id=2)
+    assert [x.value_id for x in level.adaptive_attributes] == ["0", "3"]
@@ -0,0 +1,100 @@
+"""Test estimating the size of data queries."""
+
+import pytest
+
+from wdadaptivepy import AdaptiveConnection
+from wdadaptivepy.models.data import QueryEstimate
+from wdadaptivepy.services.data import DataQuery
+from wdadaptivepy.testing import FakeAdaptiveServer, SyntheticTenant
+
+PERIODS = 3
+
+
+def _query(tenant: SyntheticTenant) -> DataQuery:
+    adaptive = AdaptiveConnection(
+        login="test_login",
+        password="test_password",  # noqa: S106
+        transport=FakeAdaptiveServer(tenant, data_rows=2).transport(),
+    )
+    return (
+        adaptive.data.query_data()
+        .set_version_filter("Actuals")
+        .add_account_filter("A0", include_descendants=True)
+        .add_level_filter("L0", include_descendants=False)
+        .set_time_filter("01/2025", "03/2025")
+        .use_corporate_currency()
+    )
+
+
+def test_estimate_counts_members() -> None:
+    """Test counting Accounts, Levels, and Periods from cached metadata."""
+    tenant = SyntheticTenant(accounts=13, account_branching=3, levels=5)
+    leaves = len(tenant.account_codes(leaves_only=True))
+
+    estimate = _query(tenant).include_zero_rows().estimate(density=0.5)
+    assert estimate == QueryEstimate(
+        accounts=leaves,
+        levels=1,
+        dimension_values=1,
+        periods=PERIODS,
+        max_rows=leaves,
+        max_cells=leaves * PERIODS,
+        rows=leaves,
+        cells=leaves * PERIODS,
+    )
+
+    estimate = _query(tenant).exclude_zero_rows().estimate(density=0.5)
+    assert estimate.max_rows == leaves
+    assert estimate.rows == (leaves + 1) // 2
+    assert estimate.cells == estimate.rows * PERIODS
+
+
+def test_estimate_counts_requested_rollup_account() -> None:
+    """Test counting a rollup Account requested without its descendants."""
+    tenant = SyntheticTenant(accounts=13, account_branching=3, levels=5)
+    query = (
+        _query(tenant)
+        .clear_account_filter()
+        .add_account_filter("A0", include_descendants=False)
+    )
+    assert query.estimate().accounts == 1
+
+
+def test_estimate_counts_rollup_levels_and_periods() -> None:
+    """Test counting rollup Levels and Periods like rollup Accounts."""
+    tenant = SyntheticTenant(accounts=1, levels=5)
+    leaves = len(tenant.level_codes(leaves_only=True))
+    query = (
+        _query(tenant)
+        .clear_level_filter()
+        .add_level_filter("L0", include_descendants=True)
+    )
+
+    assert query.exclude_rollup_levels().estimate().levels == leaves
+    assert query.include_rollup_levels().estimate().levels == 5  # noqa: PLR2004
+    assert query.include_time_rollups().estimate().periods == PERIODS + 2
+    assert query.aggregate_time_periods().estimate().periods == 1
+
+
+def test_estimate_counts_dimension_values() -> None:
+    """Test multiplying the rows by the returned Dimension Values."""
+    tenant = SyntheticTenant(
+        accounts=1,
+        levels=1,
+        dimension_values=13,
+        dimension_branching=3,
+    )
+    query = _query(tenant).add_returned_dimension("Dimension 2")
+    assert query.estimate().dimension_values == tenant.dimension_values + 1
+
+    query.add_dimension_value_filter("Dimension 1", "D1V1")
+    assert query.estimate().dimension_values == (1 + 3) * (13 + 1)
+
+    query.add_dimension_value_filter("Dimension 1", "D1V0", direct_children=True)
+    assert query.estimate().dimension_values == (1 + 3 + 2) * (13 + 1)
+
+
+def test_estimate_rejects_invalid_density() -> None:
+    """Test rejecting densities outside of 0 to 1."""
+    with pytest.raises(ValueError, match="density"):
+        _query(SyntheticTenant(accounts=1, levels=1)).estimate(density=2)
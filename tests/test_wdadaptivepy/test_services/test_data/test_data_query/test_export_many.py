@@ -0,0 +1,131 @@
+"""Test the concurrent fan-out of data queries."""
+
+import threading
+from pathlib import Path
+from xml.etree import ElementTree as ET
+
+from wdadaptivepy import AdaptiveConnection
+from wdadaptivepy.connectors.xml_api import Cassette, RateLimiter
+from wdadaptivepy.services.data import DataQuery, export_many_connections
+from wdadaptivepy.testing import FakeAdaptiveServer, SyntheticTenant
+
+ROWS = 6
+
+
+def _adaptive(server: FakeAdaptiveServer) -> AdaptiveConnection:
+    return AdaptiveConnection(
+        login="test_login",
+        password="test_password",  # noqa: S106
+        transport=server.transport(),
+    )
+
+
+def _query(adaptive: AdaptiveConnection) -> DataQuery:
+    return (
+        adaptive.data.query_data()
+        .set_version_filter("Actuals")
+        .add_account_filter("A0")
+        .set_time_filter("01/2025", "03/2025")
+        .use_corporate_currency()
+    )
+
+
+def test_export_many_versions_and_instances() -> None:
+    """Test exporting a query for each Version and instance code."""
+    tenant = SyntheticTenant()
+    server = FakeAdaptiveServer(tenant, data_rows=ROWS)
+    lock = threading.Lock()
+    requested: list[tuple[str | None, str | None]] = []
+
+    def export_data(call: ET.Element) -> str:
+        credentials = call.find("credentials")
+        version = call.find("version")
+        with lock:
+            requested.append(
+                (
+                    credentials.get("instanceCode")
+                    if credentials is not None
+                    else None,
+                    version.get("name") if version is not None else None,
+                ),
+            )
+        return tenant.export_data(ROWS, tenant.month_codes()[:3])
+
+    server.register("exportData", export_data)
+    adaptive = _adaptive(server)
+    query = _query(adaptive)
+
+    table = adaptive.data.export_many(
+        query,
+        versions=["Actuals", "Budget"],
+        instance_codes=["EAST", "WEST"],
+        max_workers=3,
+        rate_limiter=RateLimiter(max_concurrent_requests=2),
+    )
+
+    assert table.base_columns[:2] == ["Instance Code", "Version"]
+    assert table.row_count == 4 * ROWS
+    assert list(table.column("Version"))[ROWS] == "Budget"
+    assert list(table.column("Instance Code"))[-1] == "WEST"
+    assert sorted(requested) == [
+        ("EAST", "Actuals"),
+        ("EAST", "Budget"),
+        ("WEST", "Actuals"),
+        ("WEST", "Budget"),
+    ]
+    assert query.version_filter.version is not None
+    assert query.version_filter.version.name == "Actuals"
+    assert adaptive.stats()["export_many"]["count"] == 1
+
+
+def test_export_many_connections() -> None:
+    """Test exporting the same query from several connections."""
+    east = _adaptive(FakeAdaptiveServer(SyntheticTenant(), data_rows=ROWS))
+    west = _adaptive(FakeAdaptiveServer(SyntheticTenant(), data_rows=ROWS * 2))
+
+    table = export_many_connections(
+        _query(east),
+        {"East": east.data, "West": west.data},
+        rate_limiter=RateLimiter(requests_per_second=100),
+    )
+
+    assert table.base_columns[0] == "Tenant"
+    assert table.periods == ["01/2025", "02/2025", "03/2025"]
+    assert list(table.column("Tenant")).count("West") == ROWS * 2
+    assert east.stats()["http"]["count"] == 1
+
+
+def test_export_many_instances_replay_from_cassette(tmp_path: Path) -> None:
+    """Test that each instance code replays its own recorded export."""
+    tenant = SyntheticTenant()
+    rows = {"EAST": ROWS, "WEST": ROWS * 2}
+
+    def export_data(call: ET.Element) -> str:
+        credentials = call.find("credentials")
+        instance_code = (
+            credentials.get("instanceCode", "") if credentials is not None else ""
+        )
+        return tenant.export_data(rows[instance_code], tenant.month_codes()[:3])
+
+    tables = []
+    for mode in ("record", "replay"):
+        server = FakeAdaptiveServer(tenant)
+        server.register("exportData", export_data)
+        adaptive = AdaptiveConnection(
+            login="test_login",
+            password="test_password",  # noqa: S106
+            transport=server.transport(),
+            cassette=Cassette(tmp_path, mode=mode),
+        )
+        tables.append(
+            adaptive.data.export_many(
+                _query(adaptive),
+                instance_codes=["EAST", "WEST"],
+            ),
+        )
+
+    assert server.calls.get("exportData", 0) == 0
+    for table in tables:
+        instance_codes = list(table.column("Instance Code"))
+        assert instance_codes.count("EAST") == rows["EAST"]
+        assert instance_codes.count("WEST") == rows["WEST"]
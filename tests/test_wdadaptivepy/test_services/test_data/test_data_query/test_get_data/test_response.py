@@ -384,3 +384,46 @@ def test_data_query_response_xml(
     """Test that the XML response is parsed properly."""
     actual_parsed_response = query._parse_response(response_xml)  # noqa: SLF001
     assert actual_parsed_response == expected_parsed_response
+
+
+def test_data_query_response_shares_base_values(query: DataQuery) -> None:
+    """Test that repeated base values and base rows are stored once."""
+    response_xml = ET.fromstring(
+        "<response><output><![CDATA[Account Code,Level Name,01/2026,02/2026\n"
+        "1000,Marketing,1,2\n"
+        "2000,Marketing,3,4\n"
+        "]]></output></response>",
+    )
+    parsed_response = query._parse_response(response_xml)  # noqa: SLF001
+
+    assert parsed_response[0]["Level Name"] is parsed_response[2]["Level Name"]
+    assert parsed_response[0] == {
+        "Account Code": "1000",
+        "Level Name": "Marketing",
+        "Period Code": "01/2026",
+        "Amount": 1,
+    }
+    assert dict(parsed_response[3]) == {
+        "Account Code": "2000",
+        "Level Name": "Marketing",
+        "Period Code": "02/2026",
+        "Amount": 4,
+    }
+    with pytest.raises(TypeError):
+        parsed_response[0]["Amount"] = 5  # pyright: ignore[reportIndexIssue]
+
+
+def test_data_query_response_keeps_integer_amounts(query: DataQuery) -> None:
+    """Test that integer amounts are ints and other amounts are floats."""
+    response_xml = ET.fromstring(
+        "<response><output><![CDATA[Account Code,01/2026,02/2026,03/2026,04/2026\n"
+        "1000,-7,+5, 5,1.0\n"
+        "]]></output></response>",
+    )
+    amounts = [
+        row["Amount"]
+        for row in query._parse_response(response_xml)  # noqa: SLF001
+    ]
+
+    assert amounts == [-7, 5, 5, 1.0]
+    assert [type(amount) for amount in amounts] == [int, int, int, float]
@@ -0,0 +1,94 @@
+"""Test validating data queries against cached metadata."""
+
+import pytest
+
+from wdadaptivepy import AdaptiveConnection
+from wdadaptivepy.services.data import CellBudgetWarning, DataQuery
+from wdadaptivepy.testing import FakeAdaptiveServer, SyntheticTenant
+
+EXPORTS = 2
+
+
+def _adaptive(server: FakeAdaptiveServer) -> AdaptiveConnection:
+    return AdaptiveConnection(
+        login="test_login",
+        password="test_password",  # noqa: S106
+        transport=server.transport(),
+    )
+
+
+def _query(adaptive: AdaptiveConnection, account: str = "A0") -> DataQuery:
+    return (
+        adaptive.data.query_data()
+        .set_version_filter("Actuals")
+        .add_account_filter(account, include_descendants=True)
+        .set_time_filter("01/2025", "03/2025")
+        .use_corporate_currency()
+    )
+
+
+def _export_calls(server: FakeAdaptiveServer) -> int:
+    return server.calls.get("exportData", 0)
+
+
+def test_validate_estimates_cells() -> None:
+    """Test estimating cells from cached Accounts, Levels, and Time."""
+    tenant = SyntheticTenant(accounts=13, account_branching=3, levels=5)
+    server = FakeAdaptiveServer(tenant, data_rows=2)
+    adaptive = _adaptive(server)
+
+    cells = _query(adaptive).validate()
+    assert cells == len(tenant.account_codes(leaves_only=True)) * 5 * 3
+
+    cells = (
+        _query(adaptive)
+        .add_level_filter("L0", include_descendants=False)
+        .include_rollup_accounts()
+        .validate()
+    )
+    assert cells == 13 * 1 * 3
+    assert adaptive.stats()["preflight"]["count"] == EXPORTS
+    assert server.calls["exportAccounts"] == 1
+    assert _export_calls(server) == 0
+
+
+def test_validate_reports_every_unknown_member() -> None:
+    """Test collecting all unknown members into one error."""
+    tenant = SyntheticTenant(accounts=5, levels=3)
+    server = FakeAdaptiveServer(tenant, data_rows=2)
+    adaptive = _adaptive(server)
+    query = (
+        _query(adaptive, account="NOPE")
+        .add_level_filter("L99")
+        .set_version_filter("Plan")
+        .set_time_filter("01/2025", "13/2025")
+    )
+
+    with pytest.raises(ValueError, match="Invalid data query") as error:
+        query.validate()
+    for member in ("Account NOPE", "Level L99", "Version Plan", "Period 13/2025"):
+        assert member in str(error.value)
+
+
+def test_preflight_validation_before_export() -> None:
+    """Test that exports over the cell budget never reach Adaptive."""
+    tenant = SyntheticTenant(accounts=13, account_branching=3, levels=5)
+    server = FakeAdaptiveServer(tenant, data_rows=2)
+    adaptive = _adaptive(server)
+
+    query = _query(adaptive).enable_preflight_validation(cell_budget=10)
+    with pytest.raises(ValueError, match="exceeds the budget"):
+        query.get_data_table()
+    assert _export_calls(server) == 0
+
+    query.enable_preflight_validation(cell_budget=10, on_budget_exceeded="warn")
+    with pytest.warns(CellBudgetWarning, match="exceeds the budget") as warned:
+        query.get_data_table()
+    assert warned[0].filename == __file__
+    with pytest.warns(CellBudgetWarning) as warned:
+        query.validate(10, on_budget_exceeded="warn")
+    assert warned[0].filename == __file__
+    assert _export_calls(server) == 1
+
+    query.disable_preflight_validation().get_data()
+    assert _export_calls(server) == EXPORTS
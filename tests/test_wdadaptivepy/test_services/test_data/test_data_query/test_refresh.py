@@ -0,0 +1,108 @@
+"""Test DataQuery's incremental refresh."""
+
+from wdadaptivepy import AdaptiveConnection
+from wdadaptivepy.models import Version
+from wdadaptivepy.services.data import DataQuery
+from wdadaptivepy.stores import MemoryDataStore
+from wdadaptivepy.testing import FakeAdaptiveServer, SyntheticTenant
+
+
+def _query(adaptive: AdaptiveConnection, version: Version) -> DataQuery:
+    return (
+        adaptive.data.query_data()
+        .set_version_filter(version)
+        .add_account_filter("A0")
+        .set_time_filter("01/2025", "12/2025")
+        .use_corporate_currency()
+    )
+
+
+def test_refresh_exports_only_changed_periods() -> None:
+    """Test that refreshes only export dirty and incomplete periods."""
+    server = FakeAdaptiveServer(SyntheticTenant(accounts=20, levels=5), data_rows=8)
+    adaptive = AdaptiveConnection(
+        login="test_login",
+        password="test_password",  # noqa: S106
+        transport=server.transport(),
+    )
+    store = MemoryDataStore()
+
+    full = _query(adaptive, Version(name="Actuals")).refresh(store)
+    assert full.periods == SyntheticTenant().month_codes()[:12]
+
+    actuals = Version(name="Actuals", completed_values_thru="06/2025")
+    refreshed = _query(adaptive, actuals).refresh(store, dirty_periods=["02/2025"])
+    assert adaptive.stats()["refresh"]["exported_periods"] == 11  # noqa: PLR2004
+    assert refreshed.periods == full.periods
+    assert refreshed.row_count == full.row_count
+
+    _query(adaptive, Version(name="Actuals")).refresh(store, dirty_periods=["12/2025"])
+    assert adaptive.stats()["refresh"]["exported_periods"] == 11 + 1
+
+    _query(adaptive, Version(name="Actuals")).refresh(store)
+    locked = Version(name="Actuals", is_locked=True, completed_values_thru="01/2025")
+    _query(adaptive, locked).refresh(store)
+    assert server.calls["exportData"] == 3  # noqa: PLR2004
+    assert adaptive.stats()["refresh"]["skipped"] == 2  # noqa: PLR2004
+
+
+def test_fingerprint_ignores_version_and_time() -> None:
+    """Test that the fingerprint only depends on the rows and columns exported."""
+    adaptive = AdaptiveConnection(login="test_login", password="test_password")  # noqa: S106
+    query = _query(adaptive, Version(name="Actuals"))
+    other_version = query.copy().set_version_filter("Budget")
+    other_time = query.copy().set_time_filter("01/2024", "12/2024")
+    other_accounts = query.copy().add_account_filter("A1")
+
+    assert query.fingerprint() == other_version.fingerprint()
+    assert query.fingerprint() == other_time.fingerprint()
+    assert query.fingerprint() != other_accounts.fingerprint()
+    assert len(query.account_filter) == 1
+
+
+def test_refresh_follows_time_span_changes() -> None:
+    """Test that extending the time span exports it and narrowing it selects it."""
+    server = FakeAdaptiveServer(SyntheticTenant(accounts=20, levels=5), data_rows=8)
+    adaptive = AdaptiveConnection(
+        login="test_login",
+        password="test_password",  # noqa: S106
+        transport=server.transport(),
+    )
+    store = MemoryDataStore()
+    months = SyntheticTenant().month_codes()
+    _query(adaptive, Version(name="Actuals")).refresh(store)
+
+    extended = (
+        _query(adaptive, Version(name="Actuals"))
+        .set_time_filter("01/2025", "03/2026")
+        .refresh(store)
+    )
+    narrowed = (
+        _query(adaptive, Version(name="Actuals"))
+        .set_time_filter("02/2025", "04/2025")
+        .refresh(store)
+    )
+
+    assert extended.periods == months[:15]
+    assert narrowed.periods == months[1:4]
+    assert server.calls["exportData"] == 2  # noqa: PLR2004
+
+
+def test_refresh_compares_completed_values_thru_by_date() -> None:
+    """Test that periods completed beyond the stored range are not exported."""
+    server = FakeAdaptiveServer(SyntheticTenant(accounts=20, levels=5), data_rows=8)
+    adaptive = AdaptiveConnection(
+        login="test_login",
+        password="test_password",  # noqa: S106
+        transport=server.transport(),
+    )
+    store = MemoryDataStore()
+    _query(adaptive, Version(name="Actuals")).refresh(store)
+
+    actuals = Version(name="Actuals", completed_values_thru="02/2026")
+    _query(adaptive, actuals).refresh(store, dirty_periods=["03/2025"])
+    assert adaptive.stats()["refresh"]["exported_periods"] == 1
+
+    actuals = Version(name="Actuals", completed_values_thru="Q1-2025")
+    _query(adaptive, actuals).refresh(store)
+    assert adaptive.stats()["refresh"]["exported_periods"] == 1 + 9
@@ -0,0 +1,111 @@
+"""Test ModeledSheetQuery's streaming, columnar, and sharded exports."""
+
+from datetime import datetime
+
+from wdadaptivepy import AdaptiveConnection
+from wdadaptivepy.models.modeled_sheet import infer_column_type
+from wdadaptivepy.testing import FakeAdaptiveServer, SyntheticTenant
+
+ROWS = 40
+
+
+def _adaptive(server: FakeAdaptiveServer) -> AdaptiveConnection:
+    return AdaptiveConnection(
+        login="test_login",
+        password="test_password",  # noqa: S106
+        transport=server.transport(),
+    )
+
+
+def test_infer_column_type() -> None:
+    """Test detecting column types from sampled values."""
+    assert infer_column_type(["1", "", "2.5"]) == "number"
+    assert infer_column_type(["01/31/2025", "2025-02-01"]) == "date"
+    assert infer_column_type(["TRUE", "false", ""]) == "boolean"
+    assert infer_column_type(["1", "nan"]) == "text"
+    assert infer_column_type(["", ""]) == "text"
+    assert infer_column_type(["1,234", "-0.5", "12,345,678.25"]) == "number"
+    assert infer_column_type(["00123", "1"]) == "text"
+    assert infer_column_type(["1,5", "2"]) == "text"
+    assert infer_column_type(["1e5"]) == "text"
+
+
+def test_convert_rows_converts_types() -> None:
+    """Test that streamed rows have typed values."""
+    server = FakeAdaptiveServer(SyntheticTenant(levels=5), data_rows=ROWS)
+    adaptive = _adaptive(server)
+    query = adaptive.data.query_modeled_sheet("Budget", "Personnel")
+
+    rows = list(query.convert_rows())
+    assert len(rows) == ROWS
+    assert rows[1]["Employee ID"] == 1
+    assert rows[1]["Start Date"] == datetime(2025, 1, 2)  # noqa: DTZ001
+    assert isinstance(rows[1]["Salary"], float)
+    assert isinstance(rows[1]["Full Time"], bool)
+    assert rows[0]["Notes"] == "Hire 0, planned"
+    assert rows[1]["Notes"] == ""
+
+    typed = query.set_column_type("Employee ID", "text").convert_rows()
+    assert next(typed)["Employee ID"] == "0"
+    assert adaptive.stats()["modeled_sheet"]["count"] == 2  # noqa: PLR2004
+
+    raw = adaptive.data.from_modeled_sheet("Budget", "Personnel")
+    assert raw[1]["Employee ID"] == "1"
+
+
+def test_get_columns() -> None:
+    """Test retrieving a Modeled Sheet as columns."""
+    server = FakeAdaptiveServer(SyntheticTenant(levels=5), data_rows=ROWS)
+    columns = _adaptive(server).data.query_modeled_sheet("B", "P").get_columns()
+
+    assert list(columns) == [
+        "Level",
+        "Employee ID",
+        "Employee Name",
+        "Start Date",
+        "Salary",
+        "Full Time",
+        "Notes",
+    ]
+    assert columns["Employee ID"] == list(range(ROWS))
+
+
+def test_convert_rows_by_level() -> None:
+    """Test exporting each Level separately and in parallel."""
+    tenant = SyntheticTenant(levels=5)
+    server = FakeAdaptiveServer(tenant, data_rows=ROWS)
+    query = _adaptive(server).data.query_modeled_sheet("Budget", "Personnel")
+    levels = [f"Level {code[1:]}" for code in tenant.level_codes(leaves_only=True)]
+
+    shards = query.shard_by_level(levels)
+    assert [shard.level_filter[0].level.name for shard in shards] == levels
+    assert query.level_filter == []
+    assert all(
+        shard.options["isGetAllRows"] is query.options["isGetAllRows"]
+        for shard in shards
+    )
+
+    rows = list(query.convert_rows_by_level(levels, max_workers=2))
+    assert server.calls["exportConfigurableModelData"] == len(levels)
+    assert sorted(row["Employee ID"] for row in rows) == list(range(ROWS))
+    assert [row["Level"] for row in rows[:2]] == [levels[0], levels[0]]
+
+
+def test_convert_rows_pads_ragged_rows() -> None:
+    """Test that rows shorter or longer than the header are fitted to it."""
+    server = FakeAdaptiveServer(SyntheticTenant(levels=5))
+    server.register(
+        "exportConfigurableModelData",
+        lambda _: (
+            '<?xml version="1.0" encoding="UTF-8"?>\n<response success="true">'
+            "<output><data><![CDATA[ID,Amount,Notes\n1,10\n2,20,Two,\n3\n]]>"
+            "</data></output></response>"
+        ),
+    )
+    query = _adaptive(server).data.query_modeled_sheet("Budget", "Personnel")
+
+    assert list(query.convert_rows()) == [
+        {"ID": 1, "Amount": 10, "Notes": ""},
+        {"ID": 2, "Amount": 20, "Notes": "Two"},
+        {"ID": 3, "Amount": None, "Notes": ""},
+    ]
@@ -15,6 +15,7 @@ from wdadaptivepy.models import (
 )
 from wdadaptivepy.models.base import MetadataAttribute
 from wdadaptivepy.services import DimensionValueService
+from wdadaptivepy.testing import FakeAdaptiveServer, SyntheticTenant
 
 tests: list[tuple[ET.Element, MetadataList[DimensionValue]]] = []
 test_with_errors: list[tuple[ET.Element, MetadataList[Dimension], int, str]] = []
@@ -222,3 +223,45 @@ def test_get_all_with_errors(  # noqa: PLR0913
     xml_value = getattr(dimension_values[index_with_error], key_with_error, None)
     expected_value = getattr(expected[index_with_error], key_with_error, None)
     assert xml_value != expected_value
+
+
+def _fake_adaptive_service() -> tuple[FakeAdaptiveServer, DimensionValueService]:
+    server = FakeAdaptiveServer(SyntheticTenant(dimensions=3, dimension_values=4))
+    xml_api = XMLApi(
+        login="test_login",
+        password="test_password",  # noqa: S106
+        transport=server.transport(),
+    )
+    return server, DimensionValueService(xml_api=xml_api)
+
+
+def test_get_all_by_dimension_name() -> None:
+    """Test that Dimensions can be found by name when no code matches."""
+    _, service = _fake_adaptive_service()
+    dimension_values = service.get_all("Dimension 2", attributes=False)
+    assert [x.code for x in dimension_values] == ["D2V0", "D2V1", "D2V2", "D2V3"]
+
+
+def test_get_all_many() -> None:
+    """Test retrieving the Dimension Values of several Dimensions in one export."""
+    server, service = _fake_adaptive_service()
+    dimension_values = service.get_all_many(["D1", 3, "Dimension 2", "D3"])
+
+    assert list(dimension_values) == ["Dimension 1", "Dimension 3", "Dimension 2"]
+    assert [x.code for x in dimension_values["Dimension 3"]] == [
+        "D3V0",
+        "D3V1",
+        "D3V2",
+        "D3V3",
+    ]
+    assert server.calls["exportDimensions"] == 2  # noqa: PLR2004
+    assert service.get_all_many([]) == {}
+    assert server.calls["exportDimensions"] == 2  # noqa: PLR2004
+
+
+def test_get_all_many_unknown_dimension() -> None:
+    """Test that an unknown Dimension raises before exporting Dimension Values."""
+    server, service = _fake_adaptive_service()
+    with pytest.raises(ValueError):  # noqa: PT011
+        service.get_all_many(["D1", "Unknown"])
+    assert server.calls["exportDimensions"] == 1
@@ -0,0 +1,114 @@
+"""Tests for wdadaptivepy's MetadataCache."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from wdadaptivepy import AdaptiveConnection
+from wdadaptivepy.testing import FakeAdaptiveServer, SyntheticTenant
+
+THREADS = 8
+
+
+def test_concurrent_fills_share_one_call() -> None:
+    """Test that threads filling the same metadata share one XML API call."""
+    server = FakeAdaptiveServer(SyntheticTenant(accounts=20, levels=5), latency=0.05)
+    adaptive = AdaptiveConnection(
+        login="test_login",
+        password="test_password",  # noqa: S106
+        transport=server.transport(),
+    )
+    cache = adaptive.data.metadata_cache
+
+    with ThreadPoolExecutor(THREADS) as executor:
+        accounts = list(executor.map(lambda _: cache.accounts(), range(THREADS)))
+        codes = list(executor.map(lambda _: cache.level("L0"), range(THREADS)))
+
+    assert all(x is accounts[0] for x in accounts)
+    assert all(x is codes[0] for x in codes)
+    assert server.calls["exportAccounts"] == 1
+    assert server.calls["exportLevels"] == 1
+
+
+def test_clear_refetches_metadata() -> None:
+    """Test that cleared metadata is retrieved again."""
+    server = FakeAdaptiveServer(SyntheticTenant(accounts=5))
+    adaptive = AdaptiveConnection(
+        login="test_login",
+        password="test_password",  # noqa: S106
+        transport=server.transport(),
+    )
+    cache = adaptive.data.metadata_cache
+
+    first = cache.account("A0")
+    cache.clear()
+    second = cache.account("A0")
+
+    assert first is not None
+    assert second is not None
+    assert first is not second
+    assert server.calls["exportAccounts"] == 2  # NOQA: PLR2004
+
+
+def test_refresh_reuses_unchanged_metadata() -> None:
+    """Test that refreshed metadata is kept when Adaptive returns the same response."""
+    tenant = SyntheticTenant(accounts=5, levels=3)
+    server = FakeAdaptiveServer(tenant)
+    adaptive = AdaptiveConnection(
+        login="test_login",
+        password="test_password",  # noqa: S106
+        transport=server.transport(),
+    )
+    cache = adaptive.data.metadata_cache
+    accounts = cache.accounts()
+    levels = cache.levels()
+
+    cache.refresh()
+    server.register(
+        "exportLevels",
+        lambda _: SyntheticTenant(levels=4).export_levels(),
+    )
+
+    assert cache.accounts() is accounts
+    assert cache.levels() is not levels
+    assert len(cache.levels()) == 4  # noqa: PLR2004
+    assert server.calls["exportAccounts"] == 2  # noqa: PLR2004
+    assert server.calls["exportLevels"] == 2  # noqa: PLR2004
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert adaptive.stats()["metadata"]["count"] == 4  # noqa: PLR2004
+
+
+def test_refresh_retrieves_changed_dimension_values() -> None:
+    """Test that refreshed Dimension Values follow value-only changes."""
+    server = FakeAdaptiveServer(SyntheticTenant(dimensions=2))
+    adaptive = AdaptiveConnection(
+        login="test_login",
+        password="test_password",  # noqa: S106
+        transport=server.transport(),
+    )
+    cache = adaptive.data.metadata_cache
+    values = cache.dimension_values("Dimension 1")
+
+    cache.refresh()
+    assert cache.dimension_values("Dimension 1") is values
+    assert server.calls["exportDimensions"] == 4  # noqa: PLR2004
+    assert (cache.hits, cache.misses) == (2, 0)
+
+    cache.refresh()
+    server.tenant = SyntheticTenant(dimensions=2, dimension_values=107)
+    assert len(cache.dimension_values("Dimension 1")) == 107  # noqa: PLR2004
+    assert server.calls["exportDimensions"] == 6  # noqa: PLR2004
+    assert (cache.hits, cache.misses) == (3, 1)
+
+
+def test_derived_queries_share_metadata_cache() -> None:
+    """Test that queries copied onto a derived XMLApi share the metadata cache."""
+    adaptive = AdaptiveConnection(
+        login="test_login",
+        password="test_password",  # noqa: S106
+        transport=FakeAdaptiveServer(SyntheticTenant()).transport(),
+    )
+    query = adaptive.data.query_data()
+    same_tenant = query._derive(caller_name="other")  # noqa: SLF001
+    other_tenant = query._derive(instance_code="B")  # noqa: SLF001
+
+    assert same_tenant.metadata_cache is query.metadata_cache
+    assert other_tenant.metadata_cache is not query.metadata_cache
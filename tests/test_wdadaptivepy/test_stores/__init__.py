@@ -0,0 +1 @@
+"""Tests for wdadaptivepy's local stores of exported data."""
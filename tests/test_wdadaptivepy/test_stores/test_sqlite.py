@@ -0,0 +1,83 @@
+"""Tests for wdadaptivepy's SQLiteDataStore."""
+
+import math
+from pathlib import Path
+
+import pytest
+
+from wdadaptivepy.models import DataTable, Level
+from wdadaptivepy.stores import SQLiteDataStore
+
+BASE_COLUMNS = ["Account Code", "Level Code", "Level Name"]
+
+
+def _table() -> DataTable:
+    return DataTable.from_columns(
+        BASE_COLUMNS,
+        [["REV", "EXP", "REV"], ["E", "E", "W"], ["East", "East", "West"]],
+        ["01/2025", "02/2025"],
+        [[100.0, 30.0, 50.0], [110.0, math.nan, 60.0]],
+    )
+
+
+def _levels() -> list[Level]:
+    total = Level(id=1, code="TOT", name="Total")
+    east = Level(id=2, code="E", name="East")
+    west = Level(id=3, code="W", name="West")
+    east.set_adaptive_parent(total)
+    west.set_adaptive_parent(total)
+    return [total, east, west]
+
+
+def test_save_and_load_round_trip(tmp_path: Path) -> None:
+    """Test that stored data is loaded back unchanged."""
+    store = SQLiteDataStore(tmp_path / "data.sqlite")
+    assert store.load("Actuals", "abc") is None
+    store.save("Actuals", "abc", _table())
+    store.save("Actuals", "abc", _table())
+    store.close()
+
+    loaded = SQLiteDataStore(tmp_path / "data.sqlite").load("Actuals", "abc")
+    assert loaded is not None
+    assert loaded.base_columns == BASE_COLUMNS
+    assert loaded.periods == ["01/2025", "02/2025"]
+    assert list(loaded.column("Account Code")) == ["REV", "EXP", "REV"]
+    assert list(loaded.column("01/2025")) == [100.0, 30.0, 50.0]
+    assert math.isnan(loaded.column("02/2025")[1])
+
+
+def test_query_pushes_down_filters_and_group_by() -> None:
+    """Test filtering and aggregating stored data."""
+    store = SQLiteDataStore()
+    store.save("Actuals", "abc", _table())
+    store.save("Budget", "abc", _table())
+
+    rows = store.query(
+        filters={"Account Code": "REV", "Period Code": ["01/2025"]},
+        group_by=["Version"],
+    )
+    assert rows == [
+        {"Version": "Actuals", "Amount": 150.0},
+        {"Version": "Budget", "Amount": 150.0},
+    ]
+    cells = store.query(versions=["Budget"], filters={"Level Code": "W"})
+    assert [cell["Amount"] for cell in cells] == [50.0, 60.0]
+    assert list(store) == [("Actuals", "abc"), ("Budget", "abc")]
+    with pytest.raises(KeyError):
+        store.query(filters={"Unknown": "x"})
+
+
+def test_query_under_metadata_member() -> None:
+    """Test filtering on the descendants of a stored member."""
+    store = SQLiteDataStore()
+    store.save("Actuals", "abc", _table())
+    store.save_metadata("Level", _levels())
+
+    assert store.metadata("Level")[1]["name"] == "East"
+    rows = store.query(under={"Level": "TOT"}, group_by=["Account Code"])
+    assert rows == [
+        {"Account Code": "EXP", "Amount": 30.0},
+        {"Account Code": "REV", "Amount": 320.0},
+    ]
+    rows = store.query(under={"Level": "W"}, group_by=["Level Name"])
+    assert rows == [{"Level Name": "West", "Amount": 110.0}]
@@ -0,0 +1 @@
+"""Tests for wdadaptivepy's testing helpers."""
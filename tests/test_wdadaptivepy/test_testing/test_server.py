@@ -0,0 +1,70 @@
+"""Tests for wdadaptivepy's fake Adaptive XML API server."""
+
+import pytest
+
+from wdadaptivepy import AdaptiveConnection
+from wdadaptivepy.connectors.xml_api.exceptions import (
+    FailedRequestError,
+    InvalidCredentialsError,
+)
+from wdadaptivepy.testing import FakeAdaptiveServer, SyntheticTenant
+
+
+def test_services_read_synthetic_tenant() -> None:
+    """Test that services read metadata and data from the fake server."""
+    server = FakeAdaptiveServer(
+        SyntheticTenant(accounts=25, levels=6, dimensions=2, dimension_values=8),
+        data_rows=7,
+    )
+    adaptive = AdaptiveConnection(
+        login="test_login",
+        password="test_password",  # noqa: S106
+        transport=server.transport(),
+    )
+
+    assert len(adaptive.accounts.get_all()) == 25  # noqa: PLR2004
+    assert len(adaptive.levels.get_all()) == 6  # noqa: PLR2004
+    assert len(adaptive.dimension_values.get_all("D2")) == 8  # noqa: PLR2004
+    data = (
+        adaptive.data.query_data()
+        .set_version_filter("Actuals")
+        .add_account_filter("A0")
+        .set_time_filter("01/2025", "03/2025")
+        .use_corporate_currency()
+        .get_data()
+    )
+    assert len(data) == 7 * 3
+    assert server.calls["exportData"] == 1
+
+
+def test_authentication_and_error_injection() -> None:
+    """Test that the fake server checks credentials and injects failures."""
+    server = FakeAdaptiveServer(login="test_login", password="test_password")  # noqa: S106
+    adaptive = AdaptiveConnection(
+        login="test_login",
+        password="wrong_password",  # noqa: S106
+        transport=server.transport(),
+    )
+    with pytest.raises(InvalidCredentialsError):
+        adaptive.versions.get_all()
+
+    server.error_rate = 1.0
+    server.error_methods = {"exportVersions"}
+    adaptive.password = "test_password"  # noqa: S105
+    with pytest.raises(FailedRequestError):
+        adaptive.versions.get_all()
+    assert len(adaptive.users.get_all()) == server.tenant.users
+
+
+def test_throttling() -> None:
+    """Test that requests beyond the configured rate are rejected."""
+    server = FakeAdaptiveServer(requests_per_second=2)
+    adaptive = AdaptiveConnection(
+        login="test_login",
+        password="test_password",  # noqa: S106
+        transport=server.transport(),
+    )
+    adaptive.versions.get_all()
+    adaptive.versions.get_all()
+    with pytest.raises(FailedRequestError):
+        adaptive.versions.get_all()
@@ -0,0 +1,59 @@
+"""Tests for wdadaptivepy's synthetic tenants."""
+
+from xml.etree import ElementTree as ET
+
+from wdadaptivepy.connectors.xml_api.xml_api import XMLApi
+from wdadaptivepy.models import Account, DimensionValue, Level, Time, User, Version
+from wdadaptivepy.services.data import DataQuery
+from wdadaptivepy.testing import SyntheticTenant
+
+
+def test_metadata_exports_match_configured_scale() -> None:
+    """Test that each metadata export contains the configured number of members."""
+    tenant = SyntheticTenant(
+        accounts=31,
+        account_branching=2,
+        levels=7,
+        dimensions=3,
+        dimension_values=12,
+        users=4,
+        versions=3,
+        years=1,
+    )
+    accounts = Account.from_xml(ET.fromstring(tenant.export_accounts()))
+    levels = Level.from_xml(ET.fromstring(tenant.export_levels()))
+    dimension_values = DimensionValue.from_xml(
+        ET.fromstring(tenant.export_dimensions(dimension_ids=[2])),
+    )
+    users = User.from_xml(ET.fromstring(tenant.export_users()))
+    versions = Version.from_xml(ET.fromstring(tenant.export_versions()))
+    time = Time.from_xml(ET.fromstring(tenant.export_time()))
+
+    assert len(accounts) == 31  # noqa: PLR2004
+    assert len(accounts[-1].get_ancestors()) == 4  # noqa: PLR2004
+    assert len(levels) == 7  # noqa: PLR2004
+    assert len(dimension_values) == 12  # noqa: PLR2004
+    assert dimension_values[0].code == "D2V0"
+    assert len(users) == 4  # noqa: PLR2004
+    assert [version.name for version in versions] == [
+        "Actuals",
+        "Budget",
+        "Forecast 1",
+    ]
+    assert len(time[0].period) == 17  # noqa: PLR2004
+    assert len(time[0].stratum) == 3  # noqa: PLR2004
+
+
+def test_export_data_parses_into_cells() -> None:
+    """Test that the exportData response parses into one cell per row and period."""
+    tenant = SyntheticTenant(accounts=20, levels=5, dimensions=1)
+    periods = tenant.month_codes()[:3]
+    response = ET.fromstring(tenant.export_data(10, periods, mark_blanks=True))
+
+    data = DataQuery(XMLApi("", ""))._parse_response(response)  # noqa: SLF001
+
+    assert len(data) == 30  # noqa: PLR2004
+    assert [row["Period Code"] for row in data[:3]] == periods
+    assert set(tenant.account_codes(leaves_only=True)) >= {
+        row["Account Code"] for row in data
+    }